@@ -9,7 +9,6 @@ Typical usage example:
 import collections
 import re
 
-import pandas as pd
 import streamlit as st
 
 import energy_harvesting_primer as eh
@@ -26,7 +25,8 @@ st.set_page_config(
 
 
 ## App Variables ####################################################
-sensor_profile = eh.sensor_profiles.EveractiveEnvironmentalPlusEversensor()
+# Registry profiles persist across reruns, so results cached per profile are reused.
+sensor_profile = eh.sensor_profiles.registry.get("everactive_env_plus")
 
 
 ## Sidebar ##########################################################
@@ -520,133 +520,67 @@ harvesting zones, for the theoretical sensor."""
 )
 st.markdown("")
 
-df_power_list = pd.DataFrame(
-    [
-        {"label": "10 nanowatts (10 nW)", "value": 1e-8},
-        {"label": "100 nanowatts (100 nW)", "value": 1e-7},
-        {"label": "1 microwatt (1 \u03bcW)", "value": 1e-6},
-        {"label": "10 microwatts (10 \u03bcW)", "value": 1e-5},
-        {"label": "100 microwatts (100 \u03bcW)", "value": 1e-4},
-        {"label": "1 milliwatt (1 mW)", "value": 1e-3},
-        {"label": "10 milliwatts (10 mW)", "value": 1e-2},
-        {"label": "100 milliwatts (100 mW)", "value": 1e-1},
-        # {"label": "1 watt (1W)", "value": 1e0},
-    ]
+power_levels = collections.OrderedDict(
+    {
+        "10 nanowatts (10 nW)": 1e-8,
+        "100 nanowatts (100 nW)": 1e-7,
+        "1 microwatt (1 \u03bcW)": 1e-6,
+        "10 microwatts (10 \u03bcW)": 1e-5,
+        "100 microwatts (100 \u03bcW)": 1e-4,
+        "1 milliwatt (1 mW)": 1e-3,
+        "10 milliwatts (10 mW)": 1e-2,
+        "100 milliwatts (100 mW)": 1e-1,
+        # "1 watt (1W)": 1e0,
+    }
 )
+power_labels = list(power_levels.keys())
 
-col1, col2 = st.columns([1, 1])
-
-# Default always on power to 1 uW and set available powers to choose from.
+# Default always on power to 1 uW and active power to 1 mW.
 if "always_on_power_label" not in st.session_state:
     st.session_state.always_on_power_label = "1 microwatt (1 \u03bcW)"
 
-    st.session_state.always_on_power_options = df_power_list[
-        df_power_list["value"] < 1e-1
-    ]
-    st.session_state.p_always_on = df_power_list[
-        df_power_list["label"] == st.session_state.always_on_power_label
-    ].iloc[0]["value"]
-
-# Default active power to 1 mW and remove selectable powers from selectbox options
-# based on always on power.
 if "active_power_label" not in st.session_state:
     st.session_state.active_power_label = "1 milliwatt (1 mW)"
 
-    st.session_state.p_active = df_power_list[
-        df_power_list["label"] == st.session_state.active_power_label
-    ].iloc[0]["value"]
-
-    st.session_state.active_power_options = (
-        df_power_list[df_power_list["value"] > st.session_state.p_always_on]
-        .copy()
-        .reset_index(drop=True)
-    )
-
-    st.session_state.active_power_idx = int(
-        st.session_state.active_power_options[
-            st.session_state.active_power_options["label"]
-            == st.session_state.active_power_label
-        ].index[0]
-    )
-
 
 def update_sensor_always_on_power():
-    """Callback for updating sensor always on power and active power based on input to
+    """Callback for keeping active power above always on power, based on input to
     always on power selectbox."""
-    st.session_state.p_always_on = df_power_list[
-        df_power_list["label"] == st.session_state.always_on_power_label
-    ].iloc[0]["value"]
-
-    if st.session_state.p_always_on < st.session_state.p_active:
-        # Active power stays the same, just dropdown options change.
-        st.session_state.active_power_options = (
-            df_power_list[df_power_list["value"] > st.session_state.p_always_on]
-            .copy()
-            .reset_index(drop=True)
-        )
-
-        st.session_state.active_power_idx = int(
-            st.session_state.active_power_options[
-                st.session_state.active_power_options["label"]
-                == st.session_state.active_power_label
-            ].index[0]
-        )
+    always_on_power_idx = power_labels.index(st.session_state.always_on_power_label)
 
-    else:
+    if power_labels.index(st.session_state.active_power_label) <= always_on_power_idx:
         # New always on power is equal or greater than current active power, update
         # active power to 1 step above new always on power.
-        current_always_on_power_idx = int(
-            df_power_list[
-                df_power_list["label"] == st.session_state.always_on_power_label
-            ].index[0]
-        )
-
-        st.session_state.active_power_label = df_power_list.iloc[
-            current_always_on_power_idx + 1
-        ]["label"]
-        st.session_state.p_active = df_power_list[
-            df_power_list["label"] == st.session_state.active_power_label
-        ].iloc[0]["value"]
-
-        st.session_state.active_power_options = (
-            df_power_list[df_power_list["value"] > st.session_state.p_always_on]
-            .copy()
-            .reset_index(drop=True)
-        )
-
-        st.session_state.active_power_idx = int(
-            st.session_state.active_power_options[
-                st.session_state.active_power_options["label"]
-                == st.session_state.active_power_label
-            ].index[0]
-        )
-
-
-def update_sensor_active_power():
-    """Callback for updating sensor active power based on active power selectbox input."""
-    st.session_state.p_active = df_power_list[
-        df_power_list["label"] == st.session_state.active_power_label
-    ].iloc[0]["value"]
+        st.session_state.active_power_label = power_labels[always_on_power_idx + 1]
+
 
+col1, col2 = st.columns([1, 1])
 
 col1.selectbox(
     "Sensor Always-On Power",
-    options=st.session_state.always_on_power_options,
+    options=power_labels[:-1],
     key="always_on_power_label",
     on_change=update_sensor_always_on_power,
 )
 
+# Selectable active powers are those above the always on power.
 col2.selectbox(
     "Sensor Mode of Operation: Active Power",
-    options=st.session_state.active_power_options,
+    options=power_labels[
+        power_labels.index(st.session_state.always_on_power_label) + 1 :
+    ],
     key="active_power_label",
-    on_change=update_sensor_active_power,
 )
 
-power_operating_space_chart = eh.charts.power_operating_space(
-    st.session_state.p_always_on, st.session_state.p_active
+p_always_on = power_levels[st.session_state.always_on_power_label]
+p_active = power_levels[st.session_state.active_power_label]
+
+# Specs are built on first selection and cached per process, so returning to a
+# selection is a lookup. Streamlit may modify the top level of the spec, so pass a copy.
+st.vega_lite_chart(
+    spec=dict(eh.charts.power_operating_space_spec(p_always_on, p_active)),
+    theme=None,
 )
-st.altair_chart(power_operating_space_chart, theme=None)
 
 st.markdown(
     """Once the required harvested power is known for the three zones, given
@@ -759,15 +693,36 @@ characteristics of the current {sensor_profile.display_name} hardware, notably t
 capacitor and supercapacitor size."""
 )
 
-lux_slider_increments = [f"{x} lux" for x in [100, 105, 110, 115, 125, 150, 200, 300]]
-selected_lux = st.select_slider("Ambient Light", lux_slider_increments, value="100 lux")
-harvestable_lux = int(re.search(r"(\d+) lux", selected_lux).group(1))
-
+# The ambient light slider is embedded in the chart, so moving it doesn't rerun the app.
 runtime_variable_lux_chart = eh.charts.runtime_variable_lux(
-    sensor_profile, harvestable_lux
+    sensor_profile, harvestable_lux=100, client_side=True
 )
 st.altair_chart(runtime_variable_lux_chart, theme=None)
 
+st.markdown(
+    f"""The chart below shows the {sensor_profile.display_name} runtime across the
+full range of ambient light at once. Infinite runtime is shaded by the number of
+readings sent per year, and the line marks the least light needed for infinite runtime
+at each sampling frequency."""
+)
+
+runtime_heatmap_chart = eh.charts.runtime_heatmap(sensor_profile)
+st.altair_chart(runtime_heatmap_chart, theme=None)
+
+st.markdown(
+    f"""Real buildings are rarely lit around the clock. The chart below shows the
+fraction of a week the {sensor_profile.display_name} keeps up at each sampling
+frequency in an office lit on weekdays from 8am to 6pm, and dark otherwise."""
+)
+
+office_lux = st.slider("Office Lighting (lux)", 100, 1000, value=300, step=25)
+lux_schedule = eh.models.weekly_lux_schedule(on_lux=office_lux, timestep_seconds=60)
+
+runtime_lux_schedule_chart = eh.charts.runtime_lux_schedule(
+    sensor_profile, lux_schedule, timestep_seconds=60
+)
+st.altair_chart(runtime_lux_schedule_chart, theme=None)
+
 
 ## Introduction #####################################################
 st.markdown("---")
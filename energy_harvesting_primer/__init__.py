@@ -1,5 +1,6 @@
 """energy_harvesting_primer"""
 
 import energy_harvesting_primer.charts as charts
+import energy_harvesting_primer.models as models
 import energy_harvesting_primer.sensor_profiles as sensor_profiles
 import energy_harvesting_primer.utils as utils
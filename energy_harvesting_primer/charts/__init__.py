@@ -8,6 +8,9 @@ from .power_operating_space import (
     example_load_power_vs_harvested_power,
     example_power_modes,
     power_operating_space,
+    power_operating_space_spec,
 )
 from .power_profile import power_profile
+from .runtime_heatmap import runtime_heatmap
+from .runtime_lux_schedule import runtime_lux_schedule
 from .runtime_variable_lux import runtime_variable_lux
@@ -1,9 +1,14 @@
 """Contains methods to generate visuals depicting indoor and outdoor lux levels."""
 
+from typing import Optional
+
 import altair as alt
+import numpy as np
 import pandas as pd
 
 import energy_harvesting_primer.charts.color as palette
+import energy_harvesting_primer.models as models
+from energy_harvesting_primer.models.environments import INDOOR_CATEGORIES
 
 CHART_WIDTH = 700
 
@@ -114,133 +119,50 @@ def environment_lux_outside() -> alt.LayerChart:
     return chart
 
 
-INDOOR_LUX_LEVELS = [
-    {
-        "environment": "Homes",
-        "min_lux": 100,
-        "max_lux": 500,
-        "display_name": "Homes",
-        "category": "Homes",
-    },
-    {
-        "environment": "Computer Desks",
-        "min_lux": 200,
-        "max_lux": 500,
-        "display_name": "Computer Desks",
-        "category": "Offices",
-    },
-    {
-        "environment": "Conference Rooms",
-        "min_lux": 300,
-        "max_lux": 700,
-        "display_name": "Conference\nRooms",
-        "category": "Offices",
-    },
-    {
-        "environment": "Corridors",
-        "min_lux": 50,
-        "max_lux": 100,
-        "display_name": "Corridors",
-        "category": "Offices",
-    },
-    {
-        "environment": "Production Hall",
-        "min_lux": 500,
-        "max_lux": 1500,
-        "display_name": "Production Hall",
-        "category": "Factories",
-    },
-    {
-        "environment": "Design CAD",
-        "min_lux": 500,
-        "max_lux": 1500,
-        "display_name": "Design CAD",
-        "category": "Factories",
-    },
-    {
-        "environment": "Laboratory and Inspection Work",
-        "min_lux": 750,
-        "max_lux": 1500,
-        "display_name": "Laboratory and Inspection Work",
-        "category": "Factories",
-    },
-    {
-        "environment": "Packaging",
-        "min_lux": 150,
-        "max_lux": 500,
-        "display_name": "Packaging",
-        "category": "Factories",
-    },
-    {
-        "environment": "Mechanical Room",
-        "min_lux": 200,
-        "max_lux": 500,
-        "display_name": "Mechanical Room",
-        "category": "Industrial",
-    },
-    {
-        "environment": "Electrical Room",
-        "min_lux": 200,
-        "max_lux": 500,
-        "display_name": "Electrical Room",
-        "category": "Industrial",
-    },
-    {
-        "environment": "Loading Dock",
-        "min_lux": 100,
-        "max_lux": 300,
-        "display_name": "Loading Dock",
-        "category": "Industrial",
-    },
-    {
-        "environment": "Storage",
-        "min_lux": 50,
-        "max_lux": 200,
-        "display_name": "Storage",
-        "category": "Industrial",
-    },
-    {
-        "environment": "Workshop",
-        "min_lux": 300,
-        "max_lux": 750,
-        "display_name": "Workshop",
-        "category": "Industrial",
-    },
-]
+def environment_lux_inside(
+    environments: Optional[models.EnvironmentCatalog] = None,
+) -> alt.LayerChart:
+    """Generate a visual of the range of lux levels available in typical indoor settings
+    and return as an Altair chart.
 
+    Args:
+        environments: Catalog of indoor environments to show; defaults to the typical
+            indoor environments
 
-def environment_lux_inside() -> alt.LayerChart:
-    """Generate a visual of the range of lux levels available in typical indoor settings
-    and return as an Altair chart."""
+    Returns:
+        Altair LayerChart
+    """
+    if environments is None:
+        environments = models.indoor_environments
 
-    df_indoor_lux = pd.DataFrame(INDOOR_LUX_LEVELS)
+    df_indoor_lux = environments.frame.reset_index(drop=True)
     df_indoor_lux["category"] = pd.Categorical(
-        df_indoor_lux["category"], ["Homes", "Offices", "Factories", "Industrial"]
+        df_indoor_lux["category"], INDOOR_CATEGORIES
     )
-    df_indoor_lux = (
-        df_indoor_lux.sort_values(["category", "min_lux"])
-        .reset_index(drop=True)
-        .reset_index()
+    df_indoor_lux = df_indoor_lux.sort_values(["category", "min_lux"]).reset_index(
+        drop=True
     )
 
-    df_indoor_lux["y"] = df_indoor_lux["index"].apply(lambda x: x + 1)
-    df_indoor_lux = df_indoor_lux.drop(columns=["index"])
-    df_indoor_lux["display_x"] = df_indoor_lux.apply(
-        lambda row: (row["min_lux"] + row["max_lux"]) / 2, axis=1
-    )
+    df_indoor_lux["y"] = np.arange(1, len(df_indoor_lux) + 1)
+    df_indoor_lux["display_x"] = (
+        df_indoor_lux["min_lux"] + df_indoor_lux["max_lux"]
+    ) / 2
 
-    df_indoor_lux["tooltip_environment"] = df_indoor_lux.apply(
-        lambda row: f"{row['category']}: {row['environment']}", axis=1
+    df_indoor_lux["tooltip_environment"] = (
+        df_indoor_lux["category"].astype(str) + ": " + df_indoor_lux["environment"]
     )
-    df_indoor_lux["tooltip_lux"] = df_indoor_lux.apply(
-        lambda row: f"{row['min_lux']} - {row['max_lux']} lux", axis=1
+    df_indoor_lux["tooltip_lux"] = (
+        df_indoor_lux["min_lux"].map("{:.15g}".format)
+        + " - "
+        + df_indoor_lux["max_lux"].map("{:.15g}".format)
+        + " lux"
     )
 
     max_x = max(df_indoor_lux["max_lux"]) + 100
 
     opacity = 33
 
-    category_domain = ["Homes", "Offices", "Factories", "Industrial"]
+    category_domain = INDOOR_CATEGORIES
     category_scale = [
         color.chartreuse(opacity),
         color.midnight(opacity),
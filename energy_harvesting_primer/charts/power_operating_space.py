@@ -1,7 +1,8 @@
 """Contains methods to generate visuals depicting the power operating space of an energy
 harvesting sensor."""
 
-import math
+import functools
+from typing import Mapping, Tuple
 
 import altair as alt
 import numpy as np
@@ -9,18 +10,25 @@ import pandas as pd
 
 import energy_harvesting_primer.charts.color as palette
 import energy_harvesting_primer.utils as utils
+from energy_harvesting_primer.models.zones import ZONE_1, ZONE_2, ZONE_3
 
 color = palette.ColorPalette()
 
-ZONE_1 = "No Energy Harvesting"
-ZONE_2 = "Limited Energy Harvesting"
-ZONE_3 = "Plentiful Energy Harvesting"
-
 TITLE_PADDING = 12
 
 MIN_POWER_EXP = -9
 MAX_POWER_EXP = 0
 
+MIN_DUTY_CYCLE = 1e-6
+DUTY_CYCLE_SAMPLES = 1000
+
+# Active power and minimum duty cycle of each example sensor mode of operation.
+EXAMPLE_POWER_MODES = {
+    "Mode 1": (1e-2, 1e-6),
+    "Mode 2": (1e-4, 1e-4),
+    "Mode 3": (1e-6, 1e-2),
+}
+
 DUTY_CYCLE_TICK_LABELS = """
     datum.label == 1e-0 ? '1'
     : datum.label == 1e-1 ? '1/10'
@@ -149,84 +157,154 @@ def example_load_power_vs_harvested_power() -> alt.LayerChart:
     )
 
 
-def example_power_modes() -> alt.LayerChart:
-    """Generate a visual depicting the power required for different energy harvesting
-    sensor modes of operation at varying duty cycles, and return as an Altair chart."""
+def _mode_slope(p_active, mode_min_duty_cycle, min_power: float):
+    """Return the slope in log-log space of the load power of modes of operation, from
+    min_power at their minimum duty cycle to their active power at a duty cycle of 1."""
+    return np.log(p_active / min_power) / -np.log(mode_min_duty_cycle)
 
-    chart_height = 300
-    chart_width = 350
-    legend_size = 100
-    unselected_opacity = 0.3
 
-    min_duty_cycle = 1e-6
-    min_power = 1e-9
+def mode_power_curves(
+    modes: Mapping[str, Tuple[float, float]],
+    p_always_on: float,
+    min_power: float = 10 ** (MIN_POWER_EXP),
+    min_duty_cycle: float = MIN_DUTY_CYCLE,
+    num: int = DUTY_CYCLE_SAMPLES,
+    analytic: bool = True,
+) -> pd.DataFrame:
+    """Calculate the load power of sensor modes of operation at varying duty cycles.
 
-    always_on_power = 1e-7
+    The load power of a mode is a straight line in log-log space, from min_power at the
+    mode's minimum duty cycle to its active power at a duty cycle of 1:
 
-    mode_profiles = {
-        1: {"power_active": 1e-2, "min_duty_cycle": 1e-6},
-        2: {"power_active": 1e-4, "min_duty_cycle": 1e-4},
-        3: {"power_active": 1e-6, "min_duty_cycle": 1e-2},
-    }
+        power = p_active * duty_cycle ** slope
 
-    mode_power_at_duty_cycle = []
-    always_on_intersects = []
+    Every mode is evaluated at once, and the curves are returned as one long DataFrame.
+    Since the curves are straight lines, by default only the endpoints of their segments
+    below and above the always-on power are returned, split at the exact intersection
+    with the always-on power. Otherwise, the curves are sampled at log-spaced duty
+    cycles.
 
-    for mode in mode_profiles.keys():
-        delta_log_y = math.log(mode_profiles[mode]["power_active"]) - math.log(
-            min_power
-        )
-        delta_log_x = math.log(1) - math.log(mode_profiles[mode]["min_duty_cycle"])
-        slope = delta_log_y / delta_log_x
+    Args:
+        modes: Mapping of mode name to (active power in watts, minimum duty cycle)
+        p_always_on: Sensor always-on power, in watts
+        min_power: Load power at each mode's minimum duty cycle, in watts
+        min_duty_cycle: Smallest duty cycle sampled, if not analytic
+        num: Number of duty cycles sampled, log-spaced from min_duty_cycle to 1, if
+            not analytic
+        analytic: Whether to return segment endpoints rather than sampled points
 
-        intersect = (always_on_power / mode_profiles[mode]["power_active"]) ** (
-            1 / slope
+    Returns:
+        DataFrame with mode, duty_cycle, power and above_always_on (whether the point
+        is on the segment of the curve above the always-on power) columns. Points at
+        the always-on power are on both segments.
+    """
+    names = np.asarray(list(modes), dtype=object)
+    p_active, mode_min_duty_cycle = np.asarray(list(modes.values()), dtype=float).T
+    slope = _mode_slope(p_active, mode_min_duty_cycle, min_power)
+
+    if analytic:
+        intersect = (p_always_on / p_active) ** (1 / slope)
+        crosses = (intersect >= mode_min_duty_cycle) & (intersect <= 1)
+        intersect = np.clip(intersect, mode_min_duty_cycle, 1)
+        # Axes of (modes, below/above always-on power, start/end of segment)
+        endpoints = np.stack(
+            [
+                np.stack([mode_min_duty_cycle, intersect], axis=-1),
+                np.stack([intersect, np.ones_like(intersect)], axis=-1),
+            ],
+            axis=1,
         )
+        # Drop empty segments, of modes entirely above or below the always-on power.
+        on_segment = np.repeat(
+            (endpoints[..., 1] > endpoints[..., 0])[..., np.newaxis], 2, axis=-1
+        )
+        mode, above, point = np.nonzero(on_segment)
+        duty_cycle = endpoints[mode, above, point]
+        power = np.where(
+            crosses[mode] & (duty_cycle == intersect[mode]),
+            p_always_on,
+            p_active[mode] * duty_cycle ** slope[mode],
+        )
+    else:
+        samples = np.logspace(np.log10(min_duty_cycle), 0, num=num)
+        sample_power = p_active[:, np.newaxis] * samples ** slope[:, np.newaxis]
+        sampled = samples >= mode_min_duty_cycle[:, np.newaxis]
 
-        always_on_intersects.extend(
+        # Axes of (modes, below/above always-on power, duty cycles)
+        on_segment = np.stack(
             [
-                {
-                    "x": min_duty_cycle,
-                    "x2": intersect,
-                    "y": always_on_power,
-                    "mode": f"Mode {mode}",
-                    "dashed": "no",
-                },
-                {
-                    "x": intersect,
-                    "x2": 1,
-                    "y": always_on_power,
-                    "mode": f"Mode {mode}",
-                    "dashed": "yes",
-                },
-            ]
+                sampled & (sample_power <= p_always_on),
+                sampled & (sample_power >= p_always_on),
+            ],
+            axis=1,
         )
+        mode, above, point = np.nonzero(on_segment)
+        duty_cycle = samples[point]
+        power = sample_power[mode, point]
 
-        for duty_cycle in np.logspace(-6, 0, num=1000):
-            if duty_cycle >= mode_profiles[mode]["min_duty_cycle"]:
-                power = mode_profiles[mode]["power_active"] * math.pow(
-                    duty_cycle, slope
-                )
+    return pd.DataFrame(
+        {
+            "mode": names[mode],
+            "duty_cycle": duty_cycle,
+            "power": power,
+            "above_always_on": above.astype(bool),
+        }
+    )
+
+
+def example_power_modes(
+    modes: Mapping[str, Tuple[float, float]] = EXAMPLE_POWER_MODES,
+    analytic: bool = True,
+) -> alt.LayerChart:
+    """Generate a visual depicting the power required for different energy harvesting
+    sensor modes of operation at varying duty cycles, and return as an Altair chart.
+
+    Args:
+        modes: Mapping of mode name to (active power in watts, minimum duty cycle)
+        analytic: Whether to draw the power curves from their exact segment endpoints,
+            rather than from sampled duty cycles
 
-                if power < always_on_power:
-                    chart_position = "below active power"
-                else:
-                    chart_position = "above active power"
+    Returns:
+        Altair LayerChart
+    """
 
-                mode_power_at_duty_cycle.append(
-                    {
-                        "mode": f"Mode {mode}",
-                        "duty_cycle": duty_cycle,
-                        "power": power,
-                        "chart": chart_position,
-                    }
-                )
+    chart_height = 300
+    chart_width = 350
+    legend_size = 100
+    unselected_opacity = 0.3
 
-    df_modes = pd.DataFrame(mode_power_at_duty_cycle)
-    df_always_on = pd.DataFrame(always_on_intersects)
+    min_duty_cycle = MIN_DUTY_CYCLE
+    min_power = 10 ** (MIN_POWER_EXP)
 
-    color_domain = ["Mode 1", "Mode 2", "Mode 3"]
+    always_on_power = 1e-7
 
+    df_modes = mode_power_curves(
+        modes, always_on_power, min_power, min_duty_cycle, analytic=analytic
+    )
+    df_modes["chart"] = np.where(
+        df_modes["above_always_on"], "above active power", "below active power"
+    )
+
+    p_active, mode_min_duty_cycle = np.asarray(list(modes.values()), dtype=float).T
+    slope = _mode_slope(p_active, mode_min_duty_cycle, min_power)
+    intersect = (always_on_power / p_active) ** (1 / slope)
+
+    # Always-on power of each mode, solid up to the mode curve and dashed after.
+    df_always_on = pd.DataFrame(
+        {
+            "x": np.column_stack(
+                [np.full_like(intersect, min_duty_cycle), intersect]
+            ).ravel(),
+            "x2": np.column_stack([intersect, np.ones_like(intersect)]).ravel(),
+            "y": always_on_power,
+            "mode": np.repeat(list(modes), 2),
+            "dashed": np.tile(["no", "yes"], len(modes)),
+        }
+    )
+
+    color_domain = list(modes)
+
+    # Mode colors repeat when there are more modes than colors.
     color_scale = alt.Scale(
         domain=color_domain,
         range=[color.violet(), color.dark_teal(), color.midnight(80)],
@@ -234,11 +312,11 @@ def example_power_modes() -> alt.LayerChart:
 
     color_scale_always_on = alt.Scale(
         domain=color_domain,
-        range=[color.charcoal(), color.charcoal(), color.charcoal()],
+        range=[color.charcoal()] * len(color_domain),
     )
 
     selection = alt.selection_single(
-        fields=["mode"], bind="legend", init={"mode": "Mode 1"}
+        fields=["mode"], bind="legend", init={"mode": color_domain[0]}
     )
 
     power_curve_above_active_power = (
@@ -317,10 +395,13 @@ def example_power_modes() -> alt.LayerChart:
     )
 
     df_p_active = pd.DataFrame(
-        [
-            {"mode": f"Mode {k}", "x": 1, "label": "P active", **v}
-            for k, v in mode_profiles.items()
-        ]
+        {
+            "mode": color_domain,
+            "x": 1,
+            "label": "P active",
+            "power_active": p_active,
+            "min_duty_cycle": mode_min_duty_cycle,
+        }
     )
 
     p_active_circles = (
@@ -375,7 +456,7 @@ def example_power_modes() -> alt.LayerChart:
 
 
 def power_operating_space(
-    p_always_on: float = 1e-8, p_active: float = 1e-6
+    p_always_on: float = 1e-8, p_active: float = 1e-6, analytic: bool = True
 ) -> alt.VConcatChart:
     """Generate a visual depicting energy harvesting sensor power operating space,
     with highlighted energy harvesting zone definitions.
@@ -383,6 +464,8 @@ def power_operating_space(
     Args:
         p_always_on: Sensor always-on power, in watts
         p_active: Active power of sensor mode, in watts
+        analytic: Whether to draw the mode curve from its exact segment endpoints,
+            rather than from sampled duty cycles
 
     Returns:
         Altair VConcatChart
@@ -516,45 +599,25 @@ def power_operating_space(
 
     # log(duty cycle) vs. log(load power) chart
 
-    min_mode_duty_cycle = 1e-6
-
-    mode_curve = []
-    always_on_line = []
-
-    delta_log_y = math.log(p_active) - math.log(min_power)
-    delta_log_x = math.log(1) - math.log(min_mode_duty_cycle)
-    slope = delta_log_y / delta_log_x
-
-    for duty_cycle in np.logspace(-6, 0, num=1000):
-        power = p_active * math.pow(duty_cycle, slope)
+    df_mode_curve = mode_power_curves(
+        {"Active Mode": (p_active, MIN_DUTY_CYCLE)},
+        p_always_on,
+        min_power,
+        analytic=analytic,
+    )
+    df_mode_curve["line"] = np.where(
+        df_mode_curve["above_always_on"], "solid", "dashed"
+    )
 
-        curve_point = {
-            "mode": f"Active Mode",
-            "duty_cycle": duty_cycle,
-            "power": power,
-        }
-        always_on_point = {
+    # The always-on power is dashed where the mode curve is above it.
+    df_always_on = pd.DataFrame(
+        {
             "mode": "Always-On",
             "power": p_always_on,
-            "duty_cycle": duty_cycle,
+            "duty_cycle": df_mode_curve["duty_cycle"],
+            "line": np.where(df_mode_curve["above_always_on"], "dashed", "solid"),
         }
-
-        if power > p_always_on:
-            mode_curve.append({**curve_point, "line": "solid"})
-
-        elif power == p_always_on:
-            mode_curve.append({**curve_point, "line": "solid"})
-            mode_curve.append({**curve_point, "line": "dashed"})
-        else:
-            mode_curve.append({**curve_point, "line": "dashed"})
-
-        if power > p_always_on:
-            always_on_line.append({**always_on_point, "line": "dashed"})
-        else:
-            always_on_line.append({**always_on_point, "line": "solid"})
-
-    df_mode_curve = pd.DataFrame(mode_curve)
-    df_always_on = pd.DataFrame(always_on_line)
+    )
 
     mode_base = (
         alt.Chart(df_mode_curve)
@@ -694,3 +757,26 @@ def power_operating_space(
     return alt.vconcat(duty_cycle_vs_pload_chart, pload_vs_pharv_chart).configure_title(
         anchor="start"
     )
+
+
+# Enough cached specs for every combination of the primer's eight power levels.
+SPEC_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=SPEC_CACHE_SIZE)
+def power_operating_space_spec(p_always_on: float, p_active: float) -> dict:
+    """Return the Vega-Lite spec of power_operating_space(), built the first time each
+    combination of always-on and active power is requested and cached afterwards, so
+    that returning to a selection is a lookup.
+
+    Typical usage example:
+        spec = power_operating_space_spec(1e-7, 1e-5)
+
+    Args:
+        p_always_on: Sensor always-on power, in watts
+        p_active: Sensor active power, in watts
+
+    Returns:
+        Vega-Lite spec (treat as read-only)
+    """
+    return power_operating_space(p_always_on, p_active).to_dict()
@@ -4,9 +4,11 @@ sensor with two modes: active and idle."""
 from typing import Tuple
 
 import altair as alt
+import numpy as np
 import pandas as pd
 
 import energy_harvesting_primer.charts.color as palette
+import energy_harvesting_primer.models as models
 import energy_harvesting_primer.utils as utils
 
 CHART_HEIGHT = 250
@@ -18,12 +20,17 @@ MAX_TIME_MINUTES = 30
 MAX_TIME_SECONDS = 60 * MAX_TIME_MINUTES
 MAX_POWER = 80
 
+# Finest time resolution, in seconds, of the data sent to the chart.
+CHART_RESOLUTION_SECONDS = 1
+
 
 def power_profile(
     idle_power: int,
     active_power: int,
     active_operation_seconds: int,
     active_operation_frequency: int,
+    transitions_only: bool = True,
+    timestep: float = 1,
 ) -> Tuple[alt.LayerChart, float, float]:
     """Generate visual depicting the power profile for a sensor with two modes: active
     and idle.
@@ -31,6 +38,15 @@ def power_profile(
     Args:
         idle_power: power used in idle mode (in microwatts)
         active_power: power used in active mode (in microwatts)
+        active_operation_seconds: time spent in active mode per sample (in seconds)
+        active_operation_frequency: sampling period (in seconds)
+        transitions_only: if True, only the breakpoints where the power level changes
+            are sent to the chart and drawn with step interpolation; otherwise every
+            chart time step of the profile is sent
+        timestep: time resolution of the sensor schedule (in seconds), e.g. 1e-3 to
+            model millisecond radio bursts. The chart shows the peak power within each
+            CHART_RESOLUTION_SECONDS interval, so the number of points sent to the
+            browser does not grow with finer time steps.
 
     Returns:
         Tuple of:
@@ -38,24 +54,38 @@ def power_profile(
             duty cycle, as float
             average power load, as float
     """
-    t_active = active_operation_seconds
-    t_idle = active_operation_frequency - active_operation_seconds
-    duty_cycle = t_active / (t_active + t_idle)
-    average_load_power = active_power * duty_cycle + idle_power * (1 - duty_cycle)
-
-    is_active = []
-    for event in range(0, int(MAX_TIME_SECONDS / active_operation_frequency) + 1):
-        event_t = event * active_operation_frequency
-        is_active.extend([event_t + t for t in range(0, active_operation_seconds)])
-
-    data = []
-    for t in range(0, MAX_TIME_SECONDS):
-        power = active_power if t in is_active else idle_power
-        data.append({"t": t, "power": power, "mode": "Sensor Power"})
-
-    df = pd.DataFrame(data)
+    # Round to the schedule resolution, keeping at least one timestep of each.
+    active_operation_seconds = timestep * max(
+        round(active_operation_seconds / timestep), 1
+    )
+    active_operation_frequency = timestep * max(
+        round(active_operation_frequency / timestep), 1
+    )
+
+    duty_cycle = models.duty_cycle(active_operation_seconds, active_operation_frequency)
+    average_load_power = models.average_load_power(idle_power, active_power, duty_cycle)
+
+    timeline = models.two_mode_schedule(
+        idle_power,
+        active_power,
+        active_operation_seconds,
+        active_operation_frequency,
+    ).compile(MAX_TIME_SECONDS)
+
+    t, power = timeline.resample(max(timestep, CHART_RESOLUTION_SECONDS), how="max")
+
+    df = pd.DataFrame({"t": t, "power": power, "mode": "Sensor Power"})
     df["t_min"] = df["t"] / 60
 
+    mark_properties = {}
+    if transitions_only:
+        # Keep the first sample of each power level (and the final sample, so the area
+        # spans the same window); step-after holds each level until the next row.
+        is_breakpoint = np.concatenate([[True], power[1:] != power[:-1]])
+        is_breakpoint[-1] = True
+        df = df[is_breakpoint].reset_index(drop=True)
+        mark_properties["interpolate"] = "step-after"
+
     min_tick_labels = """
         datum.label == '30' ? '...'
         : datum.label
@@ -65,7 +95,7 @@ def power_profile(
 
     base_chart = (
         alt.Chart(df)
-        .mark_area(line=True)
+        .mark_area(line=True, **mark_properties)
         .encode(
             alt.X(
                 "t_min",
@@ -0,0 +1,119 @@
+"""Contains method to generate visual depicting the runtime of an energy harvesting
+sensor across a range of available lux and sampling rates."""
+
+import altair as alt
+import numpy as np
+
+import energy_harvesting_primer.charts.color as palette
+import energy_harvesting_primer.models as models
+import energy_harvesting_primer.sensor_profiles as profiles
+import energy_harvesting_primer.utils as utils
+from energy_harvesting_primer.models.grid import DEFAULT_MAX_LUX
+
+CHART_HEIGHT = 400
+CHART_WIDTH = 600
+
+color = palette.ColorPalette()
+
+
+def runtime_heatmap(
+    sensor_profile: profiles.BaseSensorProfile,
+    max_lux: float = DEFAULT_MAX_LUX,
+) -> alt.LayerChart:
+    """Assemble visual depicting sensor runtime, as infinite or finite, for every level
+    of available lux up to max_lux and every sampling frequency, with the infinite
+    runtime region shaded by the readings sent per year.
+
+    The runtime is looked up from the (cached) runtime grid of the sensor profile.
+
+    Args:
+        sensor_profile: Sensor profile object to use for energy/chart calculations
+        max_lux: Maximum available light shown, in lux
+
+    Returns:
+        Visual as Altair chart
+    """
+    df = models.runtime_grid(sensor_profile, max_lux).frontier.copy()
+
+    df["sampling_rate_name"] = df["sampling_rate_seconds"].map(
+        utils.sampling_rate_display_name
+    )
+    df["display_readings_per_year"] = utils.human_readable_format(
+        df["readings_per_year"]
+    )
+    df["display_data_volume_per_year"] = np.char.add(
+        np.char.mod("%.1f", df["mb_per_year"]), " MB"
+    )
+    df["display_infinite_runtime_lux"] = df["infinite_runtime_lux"].map(
+        lambda x: f"{x:g} lux" if np.isfinite(x) else f"Above {max_lux:g} lux"
+    )
+    df["min_lux"] = 0
+    df["max_lux"] = max_lux
+    df["infinite_runtime_lux"] = df["infinite_runtime_lux"].fillna(max_lux)
+
+    sampling_rate_sort_order = list(reversed(df["sampling_rate_name"]))
+
+    y = alt.Y(
+        "sampling_rate_name",
+        axis=alt.Axis(
+            title=f"{sensor_profile.display_name} Sampling Frequency", titlePadding=12
+        ),
+        sort=sampling_rate_sort_order,
+    )
+    x_scale = alt.Scale(domain=[0, max_lux], nice=False)
+    tooltip = [
+        alt.Tooltip("sampling_rate_name", title="Sampling Frequency"),
+        alt.Tooltip("display_infinite_runtime_lux", title="Infinite Runtime From"),
+        alt.Tooltip("display_readings_per_year", title="Readings Per Year"),
+        alt.Tooltip("display_data_volume_per_year", title="MB Sent Per Year"),
+    ]
+
+    finite_runtime = (
+        alt.Chart(df)
+        .mark_rect(color=color.sand())
+        .encode(
+            alt.X(
+                "min_lux:Q",
+                axis=alt.Axis(title="Ambient Light (lux)", titlePadding=12),
+                scale=x_scale,
+            ),
+            alt.X2("infinite_runtime_lux:Q"),
+            y,
+            tooltip=tooltip,
+        )
+    )
+
+    infinite_runtime = (
+        alt.Chart(df)
+        .mark_rect()
+        .encode(
+            alt.X("infinite_runtime_lux:Q", scale=x_scale),
+            alt.X2("max_lux:Q"),
+            y,
+            alt.Color(
+                "readings_per_year:Q",
+                legend=alt.Legend(title="Readings Per Year", format="~s"),
+                scale=alt.Scale(
+                    type="log", range=[color.chartreuse(40), color.chartreuse()]
+                ),
+            ),
+            tooltip=tooltip,
+        )
+    )
+
+    frontier = (
+        alt.Chart(df)
+        .mark_line(color=color.charcoal())
+        .encode(
+            alt.X("infinite_runtime_lux:Q", scale=x_scale),
+            y,
+            order="sampling_rate_seconds:Q",
+            tooltip=alt.value(None),
+        )
+    )
+
+    return (
+        alt.layer(finite_runtime, infinite_runtime, frontier)
+        .properties(height=CHART_HEIGHT, width=CHART_WIDTH)
+        .configure_view(strokeWidth=0)
+    )
@@ -0,0 +1,95 @@
+"""Contains method to generate visual depicting the fraction of time an energy harvesting
+sensor keeps up with its sampling rate under a periodic lux schedule."""
+
+import altair as alt
+import numpy as np
+
+import energy_harvesting_primer.charts.color as palette
+import energy_harvesting_primer.models as models
+import energy_harvesting_primer.sensor_profiles as profiles
+import energy_harvesting_primer.utils as utils
+
+CHART_HEIGHT = 250
+CHART_WIDTH = 500
+
+color = palette.ColorPalette()
+
+
+def runtime_lux_schedule(
+    sensor_profile: profiles.BaseSensorProfile,
+    lux_schedule,
+    timestep_seconds: float = models.lux_schedule.SECONDS_PER_HOUR,
+) -> alt.Chart:
+    """Assemble visual depicting the fraction of time the sensor keeps up at each
+    sampling frequency, given a periodic (e.g. weekly) lux schedule.
+
+    Args:
+        sensor_profile: Sensor profile object to use for energy/chart calculations
+        lux_schedule: Available light at each step of the schedule, in lux
+        timestep_seconds: Time between steps of the schedule, in seconds
+
+    Returns:
+        Visual as Altair chart
+    """
+    df = models.lux_schedule_runtime(
+        lux_schedule, sensor_profile, timestep_seconds=timestep_seconds
+    )
+
+    always_up_display_label = "Always Keeps Up"
+    intermittent_display_label = "Intermittent (or Non-Operational)"
+
+    df["sampling_rate_name"] = df["sampling_rate_seconds"].map(
+        utils.sampling_rate_display_name
+    )
+    df["operation"] = np.where(
+        df["uptime_fraction"] >= 1,
+        always_up_display_label,
+        intermittent_display_label,
+    )
+    df["display_energy_deficit"] = np.char.add(
+        np.char.mod("%.2f", df["energy_deficit_joules"]), " J"
+    )
+    df["display_longest_outage"] = np.char.add(
+        np.char.mod("%.1f", df["longest_outage_hours"]), " hours"
+    )
+
+    sampling_rate_sort_order = list(reversed(df["sampling_rate_name"]))
+
+    color_scale = alt.Scale(
+        domain=[always_up_display_label, intermittent_display_label],
+        range=[color.chartreuse(), color.sand()],
+    )
+
+    return (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(
+            alt.X(
+                "sampling_rate_name",
+                axis=alt.Axis(
+                    title=f"{sensor_profile.display_name} Sampling Frequency",
+                    titlePadding=12,
+                    labelAngle=-35,
+                ),
+                sort=sampling_rate_sort_order,
+            ),
+            alt.Y(
+                "uptime_fraction",
+                axis=alt.Axis(title="Time Operational", format="%", titlePadding=12),
+                scale=alt.Scale(domain=[0, 1]),
+            ),
+            alt.Color(
+                "operation:N",
+                legend=alt.Legend(title=f"{sensor_profile.display_name} Runtime"),
+                scale=color_scale,
+            ),
+            tooltip=[
+                alt.Tooltip("sampling_rate_name", title="Sampling Frequency"),
+                alt.Tooltip("uptime_fraction", title="Time Operational", format=".1%"),
+                alt.Tooltip("display_energy_deficit", title="Energy Deficit"),
+                alt.Tooltip("display_longest_outage", title="Longest Outage"),
+            ],
+        )
+        .properties(height=CHART_HEIGHT, width=CHART_WIDTH)
+        .configure_view(strokeWidth=0)
+    )
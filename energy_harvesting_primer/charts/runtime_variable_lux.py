@@ -1,102 +1,139 @@
 """Contains method to generate visual depicting the runtime of an energy harvesting
 sensor given its sampling rate and available lux."""
 
-import math
+from typing import Tuple
 
 import altair as alt
+import numpy as np
 import pandas as pd
 
 import energy_harvesting_primer.charts.color as palette
+import energy_harvesting_primer.models as models
 import energy_harvesting_primer.sensor_profiles as profiles
+import energy_harvesting_primer.utils as utils
 
 CHART_HEIGHT = 300
 CHART_WIDTH = 500
 
-color = palette.ColorPalette()
-
+# Range and step of the in-chart ambient light slider, in lux
+LUX_SLIDER_RANGE = (100, 300)
+LUX_SLIDER_STEP = 5
 
-def _human_readable_format(x: int) -> str:
-    """Convert supplied large number to human-readable format."""
-    units = ["", "K", "M", "G", "T", "P"]
-    k = 1000.0
-    magnitude = int(math.floor(math.log(x, k)))
-    return "%.1f%s" % (x / k**magnitude, units[magnitude])
+color = palette.ColorPalette()
 
 
 def runtime_variable_lux(
-    sensor_profile: profiles.BaseSensorProfile, harvestable_lux: int
+    sensor_profile: profiles.BaseSensorProfile,
+    harvestable_lux: int,
+    client_side: bool = False,
+    lux_range: Tuple[int, int] = LUX_SLIDER_RANGE,
+    lux_step: int = LUX_SLIDER_STEP,
+    packet_size_bytes: int = models.DEFAULT_PACKET_SIZE_BYTES,
 ) -> alt.Chart:
     """Assemble visual depicting sensor runtime, as infinite or finite, at a range of
     sampling frequencies, given a level of harvestable lux.
 
+    With client_side, the chart embeds a slider for the harvestable lux and works out
+    the runtime at each sampling frequency in the browser, so moving the slider does
+    not require the chart to be rebuilt.
+
     Args:
         sensor_profile: Sensor profile object to use for energy/chart calculations
-        harvestable_lux: Available light for energy harvesting, in lux
+        harvestable_lux: Available light for energy harvesting, in lux (initial slider
+            value, with client_side)
+        client_side: Whether to embed the harvestable lux slider in the chart
+        lux_range: Minimum and maximum of the embedded slider, in lux
+        lux_step: Step of the embedded slider, in lux
+        packet_size_bytes: Size of the packet sent per reading, in bytes
 
     Returns:
         Visual as Altair chart
     """
 
-    packet_size_bytes = 55
-    bytes_in_mb = 1_048_576
-
     continuous = [{"continuous": "continuous"}]
     seconds = [{f"{x} seconds": x} for x in [15, 30]]
     minute = [{"1 minute": 60}]
     minutes = [{f"{x} minutes": x * 60} for x in range(2, 21, 1)]
 
-    sampling_rate_seconds_to_name = []
+    sampling_rate_names = {
+        k: v for x in [*continuous, *seconds, *minute, *minutes] for k, v in x.items()
+    }
+    sampling_rate_sort_order = list(reversed(sampling_rate_names))
+    profiles.check_single_variant(sensor_profile)
+
+    df = pd.DataFrame(
+        {
+            "sampling_rate_name": list(sampling_rate_names),
+            "sampling_rate_seconds": [
+                profiles.CONTINUOUS_SAMPLING_RATE_SECONDS if x == "continuous" else x
+                for x in sampling_rate_names.values()
+            ],
+        }
+    )
+    sampling_rates = df["sampling_rate_seconds"].to_numpy()
+    volume = models.data_volume(sampling_rates, packet_size_bytes=packet_size_bytes)
 
-    for x in [*continuous, *seconds, *minute, *minutes]:
-        sampling_rate_name = list(x.keys())[0]
-        sampling_rate_seconds = x[sampling_rate_name]
+    df["required_lux"] = sensor_profile.get_required_lux(sampling_rates)
+    df["readings_per_year"] = volume.readings.astype(int)
+    df["mb_per_year"] = np.round(volume.uplink_mb, 3)
 
-        if sampling_rate_seconds == "continuous":
-            sampling_rate_seconds = 4
+    df["display_readings_per_year"] = utils.human_readable_format(
+        df["readings_per_year"]
+    )
+    df["display_data_volume_per_year"] = np.char.add(
+        np.char.mod("%.1f", df["mb_per_year"]), " MB"
+    )
 
-        readings_per_year = (365 * 24 * 60 * 60) / int(sampling_rate_seconds)
+    df["y"] = 10
 
-        mb_per_year = round(
-            readings_per_year * packet_size_bytes * (1 / bytes_in_mb), 3
-        )
+    infinite_runtime_display_label = "Infinite Runtime"
+    finite_runtime_display_label = "Finite (or Non-Operational)"
 
-        sampling_rate_seconds_to_name.append(
-            {
-                "sampling_rate_name": sampling_rate_name,
-                "sampling_rate_seconds": sampling_rate_seconds,
-                "required_lux": sensor_profile.get_required_lux(x[sampling_rate_name]),
-                "readings_per_year": int(readings_per_year),
-                "mb_per_year": mb_per_year,
-            }
+    if client_side:
+        ambient_light = alt.selection_single(
+            name="ambient_light",
+            fields=["lux"],
+            bind=alt.binding_range(
+                min=lux_range[0], max=lux_range[1], step=lux_step, name="Ambient Light "
+            ),
+            init={"lux": harvestable_lux},
         )
 
-    sampling_rate_sort_order = [
-        x["sampling_rate_name"] for x in list(reversed(sampling_rate_seconds_to_name))
-    ]
+        rates, thresholds = sensor_profile.get_sampling_rate_thresholds(
+            df["sampling_rate_seconds"]
+        )
+        df["infinite_runtime_lux"] = thresholds[
+            np.searchsorted(rates, df["sampling_rate_seconds"])
+        ]
+        is_infinite_runtime = "datum.infinite_runtime_lux <= ambient_light.lux"
+
+        def add_runtime(chart: alt.Chart) -> alt.Chart:
+            """Add the runtime columns, computed from the slider, to the chart."""
+            return chart.transform_calculate(
+                operation=f"""{is_infinite_runtime}
+                    ? '{infinite_runtime_display_label}'
+                    : '{finite_runtime_display_label}'""",
+                infinite_runtime=f"{is_infinite_runtime} ? 'Yes' : 'No'",
+                ambient_light="ambient_light.lux + ' lux'",
+            )
 
-    df = pd.DataFrame(sampling_rate_seconds_to_name)
+    else:
+        df["ambient_light"] = f"{harvestable_lux} lux"
 
-    df["display_readings_per_year"] = df["readings_per_year"].apply(
-        lambda x: f"{_human_readable_format(x)}"
-    )
-    df["display_data_volume_per_year"] = df["mb_per_year"].apply(
-        lambda x: f"{round(x,1)} MB"
-    )
-
-    df["y"] = 10
-    df["ambient_light"] = f"{harvestable_lux} lux"
+        fastest_sampling_rate = sensor_profile.get_fastest_sampling_rate(
+            harvestable_lux, sampling_rates=df["sampling_rate_seconds"]
+        )
+        is_infinite_runtime = df["sampling_rate_seconds"] >= fastest_sampling_rate
 
-    infinite_runtime_display_label = "Infinite Runtime"
-    finite_runtime_display_label = "Finite (or Non-Operational)"
+        df["operation"] = np.where(
+            is_infinite_runtime,
+            infinite_runtime_display_label,
+            finite_runtime_display_label,
+        )
+        df["infinite_runtime"] = np.where(is_infinite_runtime, "Yes", "No")
 
-    df["operation"] = df["required_lux"].apply(
-        lambda x: infinite_runtime_display_label
-        if x <= harvestable_lux
-        else finite_runtime_display_label
-    )
-    df["infinite_runtime"] = df["required_lux"].apply(
-        lambda x: "Yes" if x <= harvestable_lux else "No"
-    )
+        def add_runtime(chart: alt.Chart) -> alt.Chart:
+            return chart
 
     color_scale = alt.Scale(
         domain=[infinite_runtime_display_label, finite_runtime_display_label],
@@ -125,7 +162,7 @@ def runtime_variable_lux(
 
     base_chart = (
         (
-            alt.Chart(df)
+            add_runtime(alt.Chart(df))
             .mark_rect()
             .encode(
                 alt.X(
@@ -146,8 +183,8 @@ def runtime_variable_lux(
                 ),
                 tooltip=[
                     alt.Tooltip("sampling_rate_name", title="Sampling Frequency"),
-                    alt.Tooltip("ambient_light", title="Ambient Light"),
-                    alt.Tooltip("infinite_runtime", title="Infinite Runtime"),
+                    alt.Tooltip("ambient_light:N", title="Ambient Light"),
+                    alt.Tooltip("infinite_runtime:N", title="Infinite Runtime"),
                     alt.Tooltip("display_readings_per_year", title="Readings Per Year"),
                     alt.Tooltip(
                         "display_data_volume_per_year", title="MB Sent Per Year"
@@ -160,7 +197,7 @@ def runtime_variable_lux(
     )
 
     data_base = (
-        alt.Chart(df)
+        add_runtime(alt.Chart(df))
         .mark_line(strokeWidth=5)
         .encode(
             alt.X("sampling_rate_name", axis=None, sort=sampling_rate_sort_order),
@@ -173,40 +210,56 @@ def runtime_variable_lux(
         )
     )
 
-    df_data_box = (
-        df[df["operation"] == "Infinite Runtime"]
-        .sort_values("sampling_rate_seconds")
-        .head(1)
-    )
-    df_data_box["label"] = df_data_box.apply(
-        lambda row: f"Sent Per Year:\n{row['display_readings_per_year']} readings\n{row['display_data_volume_per_year']}",
-        axis=1,
-    )
-
-    data_box = (
-        alt.Chart(df_data_box)
-        .mark_circle(size=600, opacity=1)
-        .encode(
-            alt.X("sampling_rate_name", axis=None, sort=sampling_rate_sort_order),
-            alt.Y("readings_per_year", axis=None),
-            alt.Color(
-                "operation:N",
-                scale=color_scale,
-            ),
+    if client_side:
+        # Select the fastest sampling rate with infinite runtime in the browser.
+        data_box_base = (
+            add_runtime(alt.Chart(df))
+            .transform_filter(f"datum.operation == '{infinite_runtime_display_label}'")
+            .transform_joinaggregate(
+                fastest_sampling_rate_seconds="min(sampling_rate_seconds)"
+            )
+            .transform_filter(
+                "datum.sampling_rate_seconds == datum.fastest_sampling_rate_seconds"
+            )
+            .transform_calculate(
+                label="""'Sent Per Year:\\n' + datum.display_readings_per_year
+                    + ' readings\\n' + datum.display_data_volume_per_year"""
+            )
+        )
+    else:
+        df_data_box = (
+            df[df["operation"] == "Infinite Runtime"]
+            .sort_values("sampling_rate_seconds")
+            .head(1)
         )
+        df_data_box["label"] = df_data_box.apply(
+            lambda row: f"Sent Per Year:\n{row['display_readings_per_year']} readings\n{row['display_data_volume_per_year']}",
+            axis=1,
+        )
+        data_box_base = alt.Chart(df_data_box)
+
+    data_box = data_box_base.mark_circle(size=600, opacity=1).encode(
+        alt.X("sampling_rate_name", axis=None, sort=sampling_rate_sort_order),
+        alt.Y("readings_per_year", axis=None),
+        alt.Color(
+            "operation:N",
+            scale=color_scale,
+        ),
     )
 
-    data_annotation = (
-        alt.Chart(df_data_box)
-        .mark_text(align="right", dx=-15, dy=-20, lineBreak="\n")
-        .encode(
-            alt.X("sampling_rate_name", axis=None, sort=sampling_rate_sort_order),
-            text="label",
-        )
+    data_annotation = data_box_base.mark_text(
+        align="right", dx=-15, dy=-20, lineBreak="\n"
+    ).encode(
+        alt.X("sampling_rate_name", axis=None, sort=sampling_rate_sort_order),
+        text="label:N",
     )
 
     data_chart = alt.layer(data_base, data_box, data_annotation).properties(
         height=50, width=CHART_WIDTH
     )
 
-    return alt.vconcat(data_chart, base_chart).configure_view(strokeWidth=0)
+    chart = alt.vconcat(data_chart, base_chart)
+    if client_side:
+        chart = chart.add_selection(ambient_light)
+
+    return chart.configure_view(strokeWidth=0)
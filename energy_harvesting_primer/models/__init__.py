@@ -0,0 +1,43 @@
+"""energy_harvesting_primer.models"""
+
+from .environments import EnvironmentCatalog, indoor_environments
+from .fleet import assess_sensor, fleet_assessment, iter_fleet_assessment
+from .grid import RuntimeGrid, runtime_grid
+from .light_logs import LightLogStore, iter_light_log, write_light_log_store
+from .lux_schedule import lux_schedule_runtime, weekly_lux_schedule
+from .lux_traces import (
+    LuxTraceChunk,
+    LuxTraceModel,
+    fleet_lux_traces,
+    iter_fleet_lux_traces,
+    iter_lux_trace,
+)
+from .monte_carlo import simulate_power_profiles, summarize_power_profiles
+from .periodic import hyperperiod, steady_state
+from .schedule import Event, Mode, Schedule, Timeline, two_mode_schedule
+from .storage import StorageSimulation, simulate_storage
+from .timeline import (
+    active_mask,
+    average_load_power,
+    duty_cycle,
+    iter_power_timeline,
+    power_profile_metrics,
+    power_profile_metrics_frame,
+    power_timeline,
+)
+from .uplink import (
+    BYTES_PER_MB,
+    DEFAULT_PACKET_SIZE_BYTES,
+    SECONDS_PER_YEAR,
+    DataVolume,
+    data_volume,
+)
+from .zones import (
+    UNKNOWN_ZONE,
+    ZONE_1,
+    ZONE_2,
+    ZONE_3,
+    ZONES,
+    classify_zone,
+    zone_labels,
+)
@@ -0,0 +1,274 @@
+"""Contains a catalog of environments and their typical light levels, and methods to
+query which environments can sustain which sensors at which sampling rates.
+
+The catalog is a columnar table, indexed by each environment's typical lux range as an
+interval index, so it can be extended with full lighting standard tables or site survey
+data. Light level queries compare every light level with the ranges of the interval
+index, and viability queries compare the light level of every environment with every
+sampling rate (and sensor), each in one NumPy broadcast.
+"""
+
+import os
+from typing import Dict, Iterable, Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+from ..sensor_profiles.base import SAMPLING_RATES, check_single_variant
+
+ENVIRONMENT_COLUMNS = {
+    "environment": str,
+    "min_lux": float,
+    "max_lux": float,
+    "display_name": str,
+    "category": str,
+}
+INDOOR_CATEGORIES = ["Homes", "Offices", "Factories", "Industrial"]
+
+# Light level of each environment used to assess viability: the bottom of its typical
+# range is a conservative choice, since a sensor may be placed anywhere in the space.
+LUX_BASES = ("min_lux", "max_lux", "mid_lux")
+
+INDOOR_LUX_LEVELS = [
+    {
+        "environment": "Homes",
+        "min_lux": 100,
+        "max_lux": 500,
+        "display_name": "Homes",
+        "category": "Homes",
+    },
+    {
+        "environment": "Computer Desks",
+        "min_lux": 200,
+        "max_lux": 500,
+        "display_name": "Computer Desks",
+        "category": "Offices",
+    },
+    {
+        "environment": "Conference Rooms",
+        "min_lux": 300,
+        "max_lux": 700,
+        "display_name": "Conference\nRooms",
+        "category": "Offices",
+    },
+    {
+        "environment": "Corridors",
+        "min_lux": 50,
+        "max_lux": 100,
+        "display_name": "Corridors",
+        "category": "Offices",
+    },
+    {
+        "environment": "Production Hall",
+        "min_lux": 500,
+        "max_lux": 1500,
+        "display_name": "Production Hall",
+        "category": "Factories",
+    },
+    {
+        "environment": "Design CAD",
+        "min_lux": 500,
+        "max_lux": 1500,
+        "display_name": "Design CAD",
+        "category": "Factories",
+    },
+    {
+        "environment": "Laboratory and Inspection Work",
+        "min_lux": 750,
+        "max_lux": 1500,
+        "display_name": "Laboratory and Inspection Work",
+        "category": "Factories",
+    },
+    {
+        "environment": "Packaging",
+        "min_lux": 150,
+        "max_lux": 500,
+        "display_name": "Packaging",
+        "category": "Factories",
+    },
+    {
+        "environment": "Mechanical Room",
+        "min_lux": 200,
+        "max_lux": 500,
+        "display_name": "Mechanical Room",
+        "category": "Industrial",
+    },
+    {
+        "environment": "Electrical Room",
+        "min_lux": 200,
+        "max_lux": 500,
+        "display_name": "Electrical Room",
+        "category": "Industrial",
+    },
+    {
+        "environment": "Loading Dock",
+        "min_lux": 100,
+        "max_lux": 300,
+        "display_name": "Loading Dock",
+        "category": "Industrial",
+    },
+    {
+        "environment": "Storage",
+        "min_lux": 50,
+        "max_lux": 200,
+        "display_name": "Storage",
+        "category": "Industrial",
+    },
+    {
+        "environment": "Workshop",
+        "min_lux": 300,
+        "max_lux": 750,
+        "display_name": "Workshop",
+        "category": "Industrial",
+    },
+]
+
+
+class EnvironmentCatalog:
+    """Catalog of environments and their typical light levels.
+
+    Typical usage example:
+        catalog = EnvironmentCatalog.from_records(INDOOR_LUX_LEVELS).extend(
+            EnvironmentCatalog.from_csv("site_surveys/rooms.csv")
+        )
+        catalog.sustaining(sensor_profile, sampling_rate=60)
+        catalog.fastest_sampling_rates({"ENV+": sensor_profile})
+
+    Args:
+        environments: DataFrame with environment, min_lux and max_lux columns, and
+            optional display_name and category columns
+    """
+
+    def __init__(self, environments: pd.DataFrame):
+        missing = {"environment", "min_lux", "max_lux"} - set(environments.columns)
+        if missing:
+            raise ValueError(f"Environments are missing columns {sorted(missing)}")
+
+        frame = environments.reset_index(drop=True)
+        if "display_name" not in frame:
+            frame["display_name"] = frame["environment"]
+        if "category" not in frame:
+            frame["category"] = ""
+        frame = frame.astype(
+            {k: v for k, v in ENVIRONMENT_COLUMNS.items() if k in frame}
+        )
+
+        frame.index = pd.IntervalIndex.from_arrays(
+            frame["min_lux"], frame["max_lux"], closed="both", name="lux_range"
+        )
+        self.frame = frame
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "EnvironmentCatalog":
+        """Create a catalog from a list of environment dicts."""
+        return cls(pd.DataFrame(list(records)))
+
+    @classmethod
+    def from_csv(cls, path: Union[str, os.PathLike]) -> "EnvironmentCatalog":
+        """Create a catalog from a CSV file with environment, min_lux and max_lux
+        columns, and optional display_name and category columns."""
+        return cls(pd.read_csv(path, dtype=ENVIRONMENT_COLUMNS))
+
+    def extend(self, other: "EnvironmentCatalog") -> "EnvironmentCatalog":
+        """Return a new catalog with the environments of both catalogs."""
+        return EnvironmentCatalog(pd.concat([self.frame, other.frame]))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def lux(self, basis: str = "min_lux") -> np.ndarray:
+        """Return the light level of each environment used to assess viability, in
+        lux: "min_lux", "max_lux" or "mid_lux" (the middle of the typical range)."""
+        if basis not in LUX_BASES:
+            raise ValueError(f"Unknown lux basis {basis}: {LUX_BASES}")
+        lux_ranges = self.frame.index
+        if basis == "mid_lux":
+            return lux_ranges.mid.to_numpy()
+        return (lux_ranges.left if basis == "min_lux" else lux_ranges.right).to_numpy()
+
+    def containing(self, lux) -> pd.DataFrame:
+        """Return, for each environment (rows) and light level (columns), whether the
+        light level is within the environment's typical range."""
+        lux = np.atleast_1d(np.asarray(lux, dtype=float))
+        # Compare every light level with every (closed) lux range in one broadcast.
+        lux_ranges = self.frame.index
+        left = lux_ranges.left.to_numpy()[:, np.newaxis]
+        right = lux_ranges.right.to_numpy()[:, np.newaxis]
+        return pd.DataFrame(
+            (left <= lux) & (lux <= right),
+            index=self.frame["environment"],
+            columns=pd.Index(lux, name="lux"),
+        )
+
+    def viability(
+        self,
+        sensor_profiles: Mapping,
+        sampling_rates=None,
+        basis: str = "min_lux",
+    ) -> pd.DataFrame:
+        """Return whether each environment sustains infinite runtime for each sensor
+        at each sampling rate.
+
+        Args:
+            sensor_profiles: Mapping of sensor name to sensor profile object
+            sampling_rates: Sampling rate periods, in seconds. Defaults to the
+                sampling rates showcased in the primer.
+            basis: Light level of each environment to assess, see lux()
+
+        Returns:
+            Boolean DataFrame indexed by environment, with (sensor, sampling rate)
+            columns
+        """
+        if sampling_rates is None:
+            sampling_rates = SAMPLING_RATES
+        rates = np.sort(np.asarray(sampling_rates, dtype=float))
+        lux = self.lux(basis)[:, np.newaxis]
+
+        matrices = []
+        for sensor_profile in sensor_profiles.values():
+            check_single_variant(sensor_profile)
+            _, thresholds = sensor_profile.get_sampling_rate_thresholds(rates)
+            matrices.append(lux >= thresholds)
+
+        return pd.DataFrame(
+            np.hstack(matrices) if matrices else np.empty((len(self), 0), bool),
+            index=self.frame["environment"],
+            columns=pd.MultiIndex.from_product(
+                [list(sensor_profiles), rates],
+                names=["sensor", "sampling_rate_seconds"],
+            ),
+        )
+
+    def sustaining(
+        self, sensor_profile, sampling_rate, basis: str = "min_lux"
+    ) -> pd.DataFrame:
+        """Return the environments that sustain infinite runtime for the sensor at the
+        given sampling rate period, in seconds."""
+        viable = self.viability({None: sensor_profile}, [sampling_rate], basis)
+        return self.frame[viable.to_numpy()[:, 0]]
+
+    def fastest_sampling_rates(
+        self,
+        sensor_profiles: Mapping,
+        sampling_rates=None,
+        basis: str = "min_lux",
+    ) -> pd.DataFrame:
+        """Return the fastest sampling rate with infinite runtime for each sensor in
+        each environment.
+
+        Returns:
+            DataFrame indexed by environment, with a column per sensor of the fastest
+            sampling rate period, in seconds (NaN where none is sustained)
+        """
+        viability = self.viability(sensor_profiles, sampling_rates, basis)
+        fastest = {}
+        for sensor in sensor_profiles:
+            viable = viability[sensor]
+            rates = viable.columns.to_numpy()
+            fastest[sensor] = np.where(
+                viable.any(axis=1), rates[viable.to_numpy().argmax(axis=1)], np.nan
+            )
+        return pd.DataFrame(fastest, index=viability.index)
+
+
+indoor_environments = EnvironmentCatalog.from_records(INDOOR_LUX_LEVELS)
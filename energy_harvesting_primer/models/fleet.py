@@ -0,0 +1,295 @@
+"""Contains methods to assess the runtime of a fleet of energy harvesting sensors, each
+with its own recorded light history.
+
+For every sensor, the assessment reports:
+    - the fastest sampling rate its average harvested power can sustain indefinitely
+      (with enough energy storage to ride out dark periods),
+    - the hours during which the available light was below the light required for
+      infinite runtime at its configured sampling rate (as in runtime_variable_lux()),
+    - its energy harvesting zone, from its load and average harvested power, if the
+      sensor's always-on and active powers are given,
+    - the hours its recorded temperature was outside of the temperatures the sensor
+      profile was measured at.
+
+Load powers and required light are evaluated at the sensor's recorded temperature if
+available. Temperatures outside of the measured range are clipped to it, so that one
+unusually hot or cold sensor does not abort the assessment of the fleet.
+
+Sensors are assessed in chunks, optionally fanned out over a process pool with a bounded
+number of chunks in flight, and results are yielded chunk by chunk. Traces read from a
+directory are loaded by the worker that assesses them, so only the chunks in flight are
+ever held in memory.
+"""
+
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import pathlib
+from typing import Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..sensor_profiles.base import check_single_variant
+from ..sensor_profiles.tabulated import to_sampling_rate_seconds
+from .zones import UNKNOWN_ZONE, ZONES, classify_zone
+
+SENSORS_PER_CHUNK = 100
+SECONDS_PER_HOUR = 3_600
+
+FleetTraces = Union[Mapping[str, np.ndarray], pd.DataFrame, str, os.PathLike]
+
+
+def _read_trace(
+    trace, lux_column: str, temperature_column: str
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Return a lux trace, and its temperature trace (or None), as arrays.
+
+    Traces given as a path are read from a CSV file with a lux column and optional
+    temperature column; traces given as a DataFrame are read from the same columns.
+    """
+    if isinstance(trace, (str, os.PathLike)):
+        trace = pd.read_csv(
+            trace,
+            usecols=lambda x: x in (lux_column, temperature_column),
+            dtype=float,
+        )
+    if isinstance(trace, pd.DataFrame):
+        temperature = trace.get(temperature_column)
+        return (
+            trace[lux_column].to_numpy(dtype=float),
+            None if temperature is None else temperature.to_numpy(dtype=float),
+        )
+    return np.asarray(trace, dtype=float), None
+
+
+def _iter_traces(traces: FleetTraces, sensor_column: str):
+    """Yield (sensor_id, trace) pairs from a mapping, long DataFrame, or directory of
+    per-sensor CSV files (whose traces are yielded as paths, to be read later)."""
+    if isinstance(traces, pd.DataFrame):
+        for sensor_id, group in traces.groupby(sensor_column, sort=False):
+            yield sensor_id, group.drop(columns=sensor_column)
+    elif isinstance(traces, (str, os.PathLike)):
+        for path in sorted(pathlib.Path(traces).glob("*.csv")):
+            yield path.stem, path
+    else:
+        yield from traces.items()
+
+
+def _lookup(value, sensor_id):
+    """Return the per-sensor value from a mapping, or the value itself."""
+    return value[sensor_id] if isinstance(value, Mapping) else value
+
+
+def _clip_temperature(sensor_profile, temperature) -> Tuple[np.ndarray, int]:
+    """Return temperatures clipped to the range the sensor profile was measured at, and
+    the number of temperatures that were outside of it."""
+    temperature = np.asarray(temperature, dtype=float)
+    grid = getattr(sensor_profile, "required_lux_grid", None)
+    if grid is None:
+        return temperature, 0
+    low, high = grid.temperatures[0], grid.temperatures[-1]
+    return np.clip(temperature, low, high), np.count_nonzero(
+        (temperature < low) | (temperature > high)
+    )
+
+
+def assess_sensor(
+    lux,
+    sensor_profile,
+    sampling_rate,
+    timestep_seconds: float = 60,
+    temperature=None,
+    p_always_on: Optional[float] = None,
+    p_active: Optional[float] = None,
+) -> dict:
+    """Assess the runtime of a single sensor over its recorded light history.
+
+    Args:
+        lux: Available light at each timestep, in lux. Missing (NaN) readings are
+            left out of averages, and do not count towards deficit_hours.
+        sensor_profile: Sensor profile object
+        sampling_rate: Configured sampling rate period, in seconds, or "continuous"
+        timestep_seconds: Time between lux readings, in seconds
+        temperature: Sensor temperature at each timestep, in degrees Celsius, or None
+            for the temperature the sensor profile was measured at. Clipped to the
+            temperatures the sensor profile was measured at.
+        p_always_on: Always-on power of the sensor, in watts, for zone
+            classification, or None to skip it
+        p_active: Active power of the sensor, in watts, for zone classification, or
+            None to skip it
+
+    Returns:
+        Dict of mean_lux, sampling_rate_seconds, sustainable_sampling_rate_seconds
+        (NaN if none), deficit_hours, zone (None if not classified, or if the trace
+        has no readings) and out_of_range_temperature_hours
+    """
+    check_single_variant(sensor_profile)
+    lux = np.asarray(lux, dtype=float)
+    sampling_rate_seconds = to_sampling_rate_seconds(sampling_rate)
+    out_of_range_steps = 0
+    if temperature is not None:
+        temperature, out_of_range_steps = _clip_temperature(sensor_profile, temperature)
+    out_of_range_temperature_hours = (
+        out_of_range_steps * timestep_seconds / SECONDS_PER_HOUR
+    )
+
+    if np.all(np.isnan(lux)):
+        # Nothing to average (an empty trace, or only missing readings).
+        return {
+            "mean_lux": np.nan,
+            "sampling_rate_seconds": sampling_rate_seconds,
+            "sustainable_sampling_rate_seconds": np.nan,
+            "deficit_hours": 0.0,
+            "zone": None,
+            "out_of_range_temperature_hours": out_of_range_temperature_hours,
+        }
+
+    def mean_load_power(rate):
+        return float(np.nanmean(sensor_profile.get_load_power(rate, temperature)))
+
+    # Average load power over the trace's temperatures, one rate at a time so that
+    # only one trace-length array is held at once.
+    rates = np.sort(np.asarray(sensor_profile.sampling_rates, dtype=float))
+    rate_load_powers = np.array([mean_load_power(rate) for rate in rates])
+    mean_harvested_power = float(np.nanmean(sensor_profile.get_harvested_power(lux)))
+
+    sustainable_rates = rates[rate_load_powers <= mean_harvested_power]
+    sustainable_rate = sustainable_rates[0] if len(sustainable_rates) else np.nan
+
+    deficit_steps = np.count_nonzero(
+        lux < sensor_profile.get_required_lux(sampling_rate_seconds, temperature)
+    )
+
+    # Zones are relative to the sensor's always-on and active powers, which sensor
+    # profiles do not provide.
+    zone = None
+    if p_always_on is not None and p_active is not None:
+        p_load = mean_load_power(sampling_rate_seconds)
+        zone_code = classify_zone(p_load, mean_harvested_power, p_always_on, p_active)
+        zone = None if zone_code == UNKNOWN_ZONE else ZONES[zone_code]
+
+    return {
+        "mean_lux": float(np.nanmean(lux)),
+        "sampling_rate_seconds": sampling_rate_seconds,
+        "sustainable_sampling_rate_seconds": float(sustainable_rate),
+        "deficit_hours": deficit_steps * timestep_seconds / SECONDS_PER_HOUR,
+        "zone": zone,
+        "out_of_range_temperature_hours": out_of_range_temperature_hours,
+    }
+
+
+def _assess_chunk(
+    chunk: List[Tuple],
+    timestep_seconds: float,
+    lux_column: str,
+    temperature_column: str,
+) -> pd.DataFrame:
+    """Assess a chunk of (sensor_id, trace, sensor_profile, sampling_rate,
+    p_always_on, p_active) items."""
+    assessments = []
+    for sensor_id, trace, sensor_profile, sampling_rate, p_always_on, p_active in chunk:
+        lux, temperature = _read_trace(trace, lux_column, temperature_column)
+        assessment = assess_sensor(
+            lux,
+            sensor_profile,
+            sampling_rate,
+            timestep_seconds,
+            temperature,
+            p_always_on,
+            p_active,
+        )
+        assessments.append({"sensor_id": sensor_id, **assessment})
+    return pd.DataFrame(assessments)
+
+
+def iter_fleet_assessment(
+    traces: FleetTraces,
+    sensor_profile,
+    sampling_rate,
+    timestep_seconds: float = 60,
+    p_always_on=None,
+    p_active=None,
+    sensors_per_chunk: int = SENSORS_PER_CHUNK,
+    max_workers: Optional[int] = None,
+    max_pending_chunks: Optional[int] = None,
+    sensor_column: str = "sensor_id",
+    lux_column: str = "lux",
+    temperature_column: str = "temperature",
+) -> Iterator[pd.DataFrame]:
+    """Assess the runtime of every sensor in a fleet, yielding results chunk by chunk,
+    in the order of the traces.
+
+    Typical usage example:
+        for df_chunk in iter_fleet_assessment(
+            "site_surveys/lux_logs", EveractiveEnvironmentalPlusEversensor(), 60,
+            max_workers=8,
+        ):
+            df_chunk.to_csv("fleet.csv", mode="a", header=False)
+
+    Args:
+        traces: Per-sensor lux traces, as a mapping of sensor ID to trace (array, or
+            DataFrame with lux_column and optional temperature_column columns), a
+            long DataFrame with sensor_column, lux_column and optional
+            temperature_column columns, or a directory of CSV files (one per sensor,
+            named by sensor ID) with the same columns
+        sensor_profile: Sensor profile object, or mapping of sensor ID to profile
+        sampling_rate: Configured sampling rate period, in seconds, or
+            "continuous", or mapping of sensor ID to sampling rate
+        timestep_seconds: Time between lux readings, in seconds
+        p_always_on: Always-on power, in watts, or mapping of sensor ID to always-on
+            power, for zone classification; zones are None if not given
+        p_active: Active power, in watts, or mapping of sensor ID to active power,
+            for zone classification; zones are None if not given
+        sensors_per_chunk: Number of sensors assessed per task
+        max_workers: Number of worker processes; runs in-process if None
+        max_pending_chunks: Maximum number of chunks in flight at once. Defaults to
+            twice max_workers.
+
+    Yields:
+        DataFrame per chunk with one row per sensor, with sensor_id and the columns
+        returned by assess_sensor()
+    """
+    items = (
+        (
+            sensor_id,
+            trace,
+            _lookup(sensor_profile, sensor_id),
+            _lookup(sampling_rate, sensor_id),
+            _lookup(p_always_on, sensor_id),
+            _lookup(p_active, sensor_id),
+        )
+        for sensor_id, trace in _iter_traces(traces, sensor_column)
+    )
+    chunks = iter(lambda: list(itertools.islice(items, sensors_per_chunk)), [])
+    assess_chunk = functools.partial(
+        _assess_chunk,
+        timestep_seconds=timestep_seconds,
+        lux_column=lux_column,
+        temperature_column=temperature_column,
+    )
+
+    if max_workers is None:
+        yield from map(assess_chunk, chunks)
+        return
+
+    max_pending_chunks = max_pending_chunks or 2 * max_workers
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending = collections.deque()
+        for chunk in chunks:
+            if len(pending) >= max_pending_chunks:
+                yield pending.popleft().result()
+            pending.append(executor.submit(assess_chunk, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def fleet_assessment(traces: FleetTraces, sensor_profile, sampling_rate, **kwargs):
+    """Assess the runtime of every sensor in a fleet, and return the results as a
+    single DataFrame. Takes the same arguments as iter_fleet_assessment()."""
+    chunks = list(
+        iter_fleet_assessment(traces, sensor_profile, sampling_rate, **kwargs)
+    )
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
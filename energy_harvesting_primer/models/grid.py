@@ -0,0 +1,95 @@
+"""Contains methods to evaluate the runtime of an energy harvesting sensor over a dense
+grid of available light levels and sampling rates.
+
+Every (lux, sampling rate) pair is evaluated in a single NumPy broadcast, with the same
+rule as runtime_variable_lux(): a sampling rate achieves infinite runtime when the
+available light sustains it, or any faster rate. Grids are cached per sensor profile, so
+charts built from them only look up precomputed results.
+"""
+
+import functools
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..sensor_profiles.base import SAMPLING_RATES, check_single_variant
+from .uplink import DEFAULT_PACKET_SIZE_BYTES, data_volume
+
+DEFAULT_MAX_LUX = 2_000
+
+
+class RuntimeGrid(NamedTuple):
+    """Result of runtime_grid().
+
+    Attributes:
+        lux: Available light levels, in lux, ascending
+        sampling_rates: Sampling rate periods, in seconds, ascending
+        infinite_runtime: Whether each (lux, sampling rate) pair achieves infinite
+            runtime, as boolean array of shape (len(lux), len(sampling_rates))
+        frontier: DataFrame with, per sampling rate, the minimum lux (on the grid) for
+            infinite runtime (NaN if never reached), readings_per_year and mb_per_year
+    """
+
+    lux: np.ndarray
+    sampling_rates: np.ndarray
+    infinite_runtime: np.ndarray
+    frontier: pd.DataFrame
+
+    def fastest_sampling_rate(self) -> np.ndarray:
+        """Return the fastest sampling rate with infinite runtime at each lux level, in
+        seconds (NaN where there is none)."""
+        sustained = self.infinite_runtime.any(axis=1)
+        fastest = self.sampling_rates[self.infinite_runtime.argmax(axis=1)]
+        return np.where(sustained, fastest, np.nan)
+
+
+@functools.lru_cache(maxsize=32)
+def runtime_grid(
+    sensor_profile,
+    max_lux: float = DEFAULT_MAX_LUX,
+    lux_step: float = 1,
+    sampling_rates: Optional[Tuple[float, ...]] = None,
+    packet_size_bytes: int = DEFAULT_PACKET_SIZE_BYTES,
+) -> RuntimeGrid:
+    """Evaluate sensor runtime over a grid of lux levels and sampling rates.
+
+    Results are cached per sensor profile object and arguments; treat the returned
+    arrays as read-only.
+
+    Typical usage example:
+        grid = runtime_grid(sensor_profile, max_lux=2000, sampling_rates=(4, 60, 600))
+        grid.frontier
+
+    Args:
+        sensor_profile: Sensor profile object to use for energy calculations
+        max_lux: Maximum light level of the grid, in lux
+        lux_step: Spacing of the light levels of the grid, in lux
+        sampling_rates: Sampling rate periods, in seconds, as a tuple. Defaults to the
+            sampling rates showcased in the primer.
+        packet_size_bytes: Size of the packet sent per reading, in bytes
+
+    Returns:
+        RuntimeGrid
+    """
+    check_single_variant(sensor_profile)
+    lux = np.arange(0, max_lux + lux_step / 2, lux_step, dtype=float)
+    rates, thresholds = sensor_profile.get_sampling_rate_thresholds(
+        sampling_rates or SAMPLING_RATES
+    )
+    infinite_runtime = lux[:, np.newaxis] >= thresholds[np.newaxis, :]
+
+    reached = infinite_runtime.any(axis=0)
+    volume = data_volume(rates, packet_size_bytes=packet_size_bytes)
+    frontier = pd.DataFrame(
+        {
+            "sampling_rate_seconds": rates,
+            "infinite_runtime_lux": np.where(
+                reached, lux[infinite_runtime.argmax(axis=0)], np.nan
+            ),
+            "readings_per_year": volume.readings,
+            "mb_per_year": volume.uplink_mb,
+        }
+    )
+
+    return RuntimeGrid(lux, rates, infinite_runtime, frontier)
@@ -0,0 +1,242 @@
+"""Contains methods to ingest recorded ambient light logs and store them for reuse.
+
+A light log is a CSV file with one reading per row: a timestamp, a sensor ID and the
+lux measured, with the readings of many sensors interleaved and irregularly spaced. The
+log is read in chunks, and each sensor's readings are resampled onto a uniform grid by
+holding each reading until the next one. Only the chunk being read and the last reading
+of each sensor are held in memory, so files of any size can be ingested.
+
+Readings can be held for at most max_gap_seconds, after which the sensor is assumed to
+be in the dark (gap_lux, 0 lux by default) until its next reading. Resampled traces
+hold no missing values, so that runtime assessments count gaps in the log as periods
+without harvestable light rather than propagating NaN.
+
+Resampled traces are written to a light log store: a directory holding a raw float32
+file per sensor and a JSON metadata file. A LightLogStore maps sensor IDs to memory
+mapped lux traces, which can be passed directly to sensor profiles and to
+fleet_assessment():
+
+    store = write_light_log_store("logs.csv", "logs_store", timestep_seconds=60)
+    fleet_assessment(store, sensor_profile, sampling_rate=60, timestep_seconds=60)
+"""
+
+import collections.abc
+import json
+import os
+import pathlib
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 1_000_000
+STORE_DTYPE = np.float32
+METADATA_FILENAME = "metadata.json"
+TRACE_SUFFIX = ".lux"
+
+
+def _timestamp_seconds(timestamps: pd.Series, timestamp_unit: Optional[str]):
+    """Return timestamps as seconds since the Unix epoch, as float array."""
+    if timestamp_unit is None:
+        timestamps = pd.to_datetime(timestamps, utc=True)
+        seconds = (timestamps - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)
+        return seconds.to_numpy(dtype=float)
+    return (
+        timestamps.to_numpy(dtype=float)
+        * pd.Timedelta(1, timestamp_unit)
+        / (pd.Timedelta(seconds=1))
+    )
+
+
+def iter_light_log(
+    path: Union[str, os.PathLike],
+    timestep_seconds: float = 60,
+    max_gap_seconds: Optional[float] = None,
+    gap_lux: float = 0.0,
+    timestamp_column: str = "timestamp",
+    sensor_column: str = "sensor_id",
+    lux_column: str = "lux",
+    timestamp_unit: Optional[str] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[Tuple[str, float, np.ndarray]]:
+    """Read a light log in chunks, and yield each sensor's readings resampled onto a
+    uniform grid, segment by segment.
+
+    Each grid point takes the last reading at or before it. A sensor's grid starts at
+    its first reading, rounded up to the timestep, and ends at its last reading.
+    Readings need not be sorted across sensors, but each sensor's readings must be in
+    time order.
+
+    Typical usage example:
+        for sensor_id, start_seconds, lux in iter_light_log("logs.csv"):
+            ...
+
+    Args:
+        path: Path to the CSV light log
+        timestep_seconds: Time between grid points, in seconds
+        max_gap_seconds: Longest a reading is held, in seconds, after which grid
+            points are set to gap_lux, or None to hold readings until the next one
+        gap_lux: Light assumed at grid points more than max_gap_seconds after the
+            last reading, in lux
+        timestamp_column: Column of reading timestamps
+        sensor_column: Column of sensor IDs
+        lux_column: Column of lux readings
+        timestamp_unit: Unit of numeric (epoch) timestamps, e.g. "s" or "ms", or None
+            for date/time strings
+        chunksize: Number of rows read at a time
+
+    Yields:
+        Tuple of sensor ID, time of the segment's first grid point (in seconds since
+        the Unix epoch) and lux at each grid point of the segment, as float array.
+        Consecutive segments of a sensor are contiguous.
+    """
+    dtype = {sensor_column: str, lux_column: np.float64}
+    if timestamp_unit is not None:
+        dtype[timestamp_column] = np.float64
+    else:
+        dtype[timestamp_column] = str
+
+    # Last reading (time, lux) and next grid point of each sensor, across chunks
+    last_readings: Dict[str, Tuple[float, float]] = {}
+    next_grid_points: Dict[str, float] = {}
+
+    def resample(sensor_id, times, lux, final):
+        if sensor_id in last_readings:
+            last_time, last_lux = last_readings[sensor_id]
+            if times[0] < last_time:
+                raise ValueError(f"Readings of sensor {sensor_id} are out of order")
+            times = np.concatenate([[last_time], times])
+            lux = np.concatenate([[last_lux], lux])
+            start = next_grid_points[sensor_id]
+        else:
+            start = np.ceil(times[0] / timestep_seconds) * timestep_seconds
+
+        # Until the last reading of the sensor, a later reading could still change the
+        # grid points at the time of the last reading read so far.
+        steps = (times[-1] - start) / timestep_seconds
+        n_points = int(max(np.floor(steps) + 1 if final else np.ceil(steps), 0))
+        grid = start + np.arange(n_points) * timestep_seconds
+        last_readings[sensor_id] = (times[-1], lux[-1])
+        next_grid_points[sensor_id] = start + n_points * timestep_seconds
+
+        index = np.searchsorted(times, grid, side="right") - 1
+        resampled = lux[index]
+        if max_gap_seconds is not None:
+            resampled[grid - times[index] > max_gap_seconds] = gap_lux
+        return start, resampled
+
+    chunks = pd.read_csv(
+        path,
+        usecols=[timestamp_column, sensor_column, lux_column],
+        dtype=dtype,
+        chunksize=chunksize,
+    )
+    for chunk in chunks:
+        chunk["seconds"] = _timestamp_seconds(chunk[timestamp_column], timestamp_unit)
+        for sensor_id, group in chunk.groupby(sensor_column, sort=False):
+            times = group["seconds"].to_numpy()
+            if np.any(np.diff(times) < 0):
+                raise ValueError(f"Readings of sensor {sensor_id} are out of order")
+            start, lux = resample(
+                sensor_id, times, group[lux_column].to_numpy(), final=False
+            )
+            if len(lux):
+                yield sensor_id, start, lux
+
+    # Emit the grid points up to each sensor's last reading.
+    for sensor_id, (last_time, last_lux) in list(last_readings.items()):
+        start, lux = resample(
+            sensor_id, np.array([last_time]), np.array([last_lux]), final=True
+        )
+        if len(lux):
+            yield sensor_id, start, lux
+
+
+class LightLogStore(collections.abc.Mapping):
+    """Read-only mapping of sensor IDs to resampled lux traces, memory mapped from a
+    light log store written by write_light_log_store().
+
+    Attributes:
+        directory: Path to the store
+        timestep_seconds: Time between readings of every trace, in seconds
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self.directory = pathlib.Path(directory)
+        with open(self.directory / METADATA_FILENAME) as f:
+            metadata = json.load(f)
+        self.timestep_seconds = metadata["timestep_seconds"]
+        self._sensors = metadata["sensors"]
+
+    def __getitem__(self, sensor_id: str) -> np.ndarray:
+        sensor = self._sensors[sensor_id]
+        if sensor["length"] == 0:
+            return np.empty(0, dtype=STORE_DTYPE)
+        return np.memmap(
+            self.directory / sensor["filename"],
+            dtype=STORE_DTYPE,
+            mode="r",
+            shape=(sensor["length"],),
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sensors)
+
+    def __len__(self) -> int:
+        return len(self._sensors)
+
+    def start_seconds(self, sensor_id: str) -> float:
+        """Return the time of the first reading of a sensor, in seconds since the Unix
+        epoch."""
+        return self._sensors[sensor_id]["start_seconds"]
+
+    def times(self, sensor_id: str) -> np.ndarray:
+        """Return the time of each reading of a sensor, in seconds since the Unix
+        epoch, as float array."""
+        sensor = self._sensors[sensor_id]
+        return sensor["start_seconds"] + np.arange(sensor["length"]) * (
+            self.timestep_seconds
+        )
+
+
+def write_light_log_store(
+    path: Union[str, os.PathLike],
+    directory: Union[str, os.PathLike],
+    timestep_seconds: float = 60,
+    **kwargs,
+) -> LightLogStore:
+    """Ingest a light log into a light log store, streaming the resampled traces to
+    disk. Takes the same keyword arguments as iter_light_log().
+
+    Typical usage example:
+        store = write_light_log_store("logs.csv", "logs_store", timestep_seconds=60)
+        sensor_profile.get_harvested_power(store["sensor-1"])
+
+    Args:
+        path: Path to the CSV light log
+        directory: Path to the store to write (created if needed)
+        timestep_seconds: Time between readings of the stored traces, in seconds
+
+    Returns:
+        The written store
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    sensors = {}
+
+    for sensor_id, start, lux in iter_light_log(path, timestep_seconds, **kwargs):
+        if sensor_id not in sensors:
+            sensors[sensor_id] = {
+                "filename": f"{len(sensors)}{TRACE_SUFFIX}",
+                "start_seconds": start,
+                "length": 0,
+            }
+            (directory / sensors[sensor_id]["filename"]).unlink(missing_ok=True)
+        sensor = sensors[sensor_id]
+        with open(directory / sensor["filename"], "ab") as f:
+            f.write(lux.astype(STORE_DTYPE).tobytes())
+        sensor["length"] += len(lux)
+
+    with open(directory / METADATA_FILENAME, "w") as f:
+        json.dump({"timestep_seconds": timestep_seconds, "sensors": sensors}, f)
+    return LightLogStore(directory)
@@ -0,0 +1,118 @@
+"""Contains methods to evaluate the runtime of an energy harvesting sensor under a
+periodic (e.g. weekly) light schedule, such as an office that goes dark at night and on
+weekends.
+
+At each step of the schedule, a sampling rate keeps up when the available light
+sustains it, as in runtime_variable_lux(). Every sampling rate is evaluated at once, as
+a (steps x sampling rates) matrix. Energy storage is not modeled here; see
+simulate_storage() for riding out dark periods on stored energy.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..sensor_profiles.base import SAMPLING_RATES, check_single_variant
+
+SECONDS_PER_HOUR = 3_600
+HOURS_PER_DAY = 24
+DAYS_PER_WEEK = 7
+
+
+def weekly_lux_schedule(
+    on_lux: float,
+    off_lux: float = 0,
+    start_hour: float = 8,
+    end_hour: float = 18,
+    days_on: int = 5,
+    timestep_seconds: float = SECONDS_PER_HOUR,
+) -> np.ndarray:
+    """Return a week-long lux schedule with lights on during working hours.
+
+    Typical usage example:
+        lux_schedule = weekly_lux_schedule(on_lux=300, timestep_seconds=60)
+
+    Args:
+        on_lux: Available light while the lights are on, in lux
+        off_lux: Available light while the lights are off, in lux
+        start_hour: Hour of the day the lights turn on
+        end_hour: Hour of the day the lights turn off
+        days_on: Number of days per week (starting with the first) with lights on
+        timestep_seconds: Time between steps of the schedule, in seconds
+
+    Returns:
+        Available light at each step of the week, in lux, as float array
+    """
+    steps = int(DAYS_PER_WEEK * HOURS_PER_DAY * SECONDS_PER_HOUR // timestep_seconds)
+    hours = np.arange(steps) * timestep_seconds / SECONDS_PER_HOUR
+    hour_of_day = hours % HOURS_PER_DAY
+    day = hours // HOURS_PER_DAY
+
+    lights_on = (day < days_on) & (hour_of_day >= start_hour) & (hour_of_day < end_hour)
+    return np.where(lights_on, float(on_lux), float(off_lux))
+
+
+def _longest_circular_run(mask: np.ndarray) -> np.ndarray:
+    """Return the longest run of True values in each column of a 2-D boolean array,
+    with runs wrapping around from the last row to the first."""
+    steps = len(mask)
+    doubled = np.concatenate([mask, mask])
+    index = np.arange(2 * steps)[:, np.newaxis]
+
+    # Length of the current run at each row is the distance to the last False row.
+    last_false = np.maximum.accumulate(np.where(doubled, -1, index), axis=0)
+    return np.minimum((index - last_false).max(axis=0, initial=0), steps)
+
+
+def lux_schedule_runtime(
+    lux_schedule,
+    sensor_profile,
+    sampling_rates=None,
+    timestep_seconds: float = SECONDS_PER_HOUR,
+    temperature: Optional[float] = None,
+) -> pd.DataFrame:
+    """Evaluate sensor runtime at every sampling rate under a periodic lux schedule.
+
+    Args:
+        lux_schedule: Available light at each step of the (repeating) schedule, in lux
+        sensor_profile: Sensor profile object to use for energy calculations
+        sampling_rates: Sampling rate periods, in seconds. Defaults to the sampling
+            rates showcased in the primer.
+        timestep_seconds: Time between steps of the schedule, in seconds
+        temperature: Sensor temperature, in degrees Celsius, or None for the
+            temperature the sensor profile was measured at
+
+    Returns:
+        DataFrame with one row per sampling rate, with sampling_rate_seconds,
+        uptime_fraction (fraction of the schedule the sensor keeps up),
+        energy_deficit_joules (energy short of the load, per schedule period) and
+        longest_outage_hours (longest stretch, wrapping around, it cannot keep up)
+    """
+    check_single_variant(sensor_profile)
+    lux = np.asarray(lux_schedule, dtype=float)
+    if sampling_rates is None:
+        sampling_rates = SAMPLING_RATES
+    rates, thresholds = sensor_profile.get_sampling_rate_thresholds(
+        sampling_rates, temperature=temperature
+    )
+    keeps_up = lux[:, np.newaxis] >= thresholds[np.newaxis, :]
+
+    harvested_power = np.asarray(sensor_profile.get_harvested_power(lux), dtype=float)
+    load_power = np.asarray(
+        sensor_profile.get_load_power(rates, temperature=temperature), dtype=float
+    )
+    shortfall = np.clip(
+        load_power[np.newaxis, :] - harvested_power[:, np.newaxis], 0, None
+    )
+
+    return pd.DataFrame(
+        {
+            "sampling_rate_seconds": rates,
+            "uptime_fraction": keeps_up.mean(axis=0),
+            "energy_deficit_joules": shortfall.sum(axis=0) * timestep_seconds,
+            "longest_outage_hours": _longest_circular_run(~keeps_up)
+            * timestep_seconds
+            / SECONDS_PER_HOUR,
+        }
+    )
@@ -0,0 +1,256 @@
+"""Contains methods to generate synthetic ambient light (lux) traces for simulations.
+
+A trace is the sum of electric lighting, on while the space is occupied, and daylight
+through windows, with seasonal day length:
+
+    lux = (occupied ? occupied_lux : unoccupied_lux) + daylight_lux * clearness * sun
+
+where sun rises and sets around solar noon with a day length that varies sinusoidally
+over the year, and clearness varies from day to day. Occupancy start and end times vary
+from day to day, and each sensor's lighting and daylight levels vary around the
+model's. Readings get multiplicative noise.
+
+Each sensor draws from its own random stream, spawned from the seed, so a sensor's trace
+is reproducible for a given seed and does not depend on the number of sensors or on how
+the traces are chunked. Without a seed, fresh entropy is drawn, and reported with every
+chunk so that the run can be reproduced. Traces are generated whole days at a time,
+vectorized across sensors and timesteps, and yielded lazily in chunks of sensors and
+days, so that memory use is bounded by the chunk size.
+"""
+
+import dataclasses
+from typing import Iterator, NamedTuple, Union
+
+import numpy as np
+
+SECONDS_PER_DAY = 24 * 60 * 60
+HOURS_PER_DAY = 24
+DAYS_PER_YEAR = 365
+DAYS_PER_WEEK = 7
+# Day of the year of the March equinox, when day and night are the same length.
+EQUINOX_DAY_OF_YEAR = 79
+SENSORS_PER_CHUNK = 100
+
+Seed = Union[None, int, np.random.SeedSequence]
+
+
+@dataclasses.dataclass(frozen=True)
+class LuxTraceModel:
+    """Parameters of a synthetic lux trace.
+
+    Attributes:
+        occupied_lux: Electric lighting while the space is occupied, in lux
+        unoccupied_lux: Electric lighting while the space is unoccupied, in lux
+        occupied_start_hour: Hour of the day occupancy starts, on average
+        occupied_end_hour: Hour of the day occupancy ends, on average
+        occupied_days: Number of days per week, starting Monday, that are occupied
+        occupancy_jitter_hours: Standard deviation of occupancy start and end times
+        daylight_lux: Daylight through windows at solar noon on a clear day, in lux
+        day_length_amplitude_hours: Difference between the longest day and 12 hours
+            (about 4 hours at 45 degrees latitude)
+        min_clearness: Daylight on the most overcast day, as a fraction of clear sky
+        sensor_variation: Standard deviation of each sensor's log lighting and
+            daylight levels around the model's
+        noise: Standard deviation of the log multiplicative noise on each reading
+    """
+
+    occupied_lux: float = 400
+    unoccupied_lux: float = 0
+    occupied_start_hour: float = 8
+    occupied_end_hour: float = 18
+    occupied_days: int = 5
+    occupancy_jitter_hours: float = 0.5
+    daylight_lux: float = 200
+    day_length_amplitude_hours: float = 4
+    min_clearness: float = 0.2
+    sensor_variation: float = 0.3
+    noise: float = 0.05
+
+
+class LuxTraceChunk(NamedTuple):
+    """Chunk of synthetic lux traces yielded by iter_fleet_lux_traces().
+
+    Attributes:
+        sensors: Sensors of the chunk, as a slice of the fleet's sensors
+        times: Time of each reading, in seconds from the start
+        lux: Lux of each sensor (rows) at each reading (columns)
+        entropy: Entropy the traces were seeded with; pass it as the seed to
+            reproduce them (as a SeedSequence with the same spawn_key, if the seed
+            was spawned)
+    """
+
+    sensors: slice
+    times: np.ndarray
+    lux: np.ndarray
+    entropy: int
+
+
+class _SensorDraws(NamedTuple):
+    """Random draws of a block of sensors for every day of the traces."""
+
+    rngs: list
+    scales: np.ndarray
+    start_hours: np.ndarray
+    end_hours: np.ndarray
+    clearness: np.ndarray
+
+
+def _draw_sensors(
+    model: LuxTraceModel,
+    seed_sequence: np.random.SeedSequence,
+    sensors: range,
+    days: int,
+) -> _SensorDraws:
+    """Draw each sensor's lighting and daylight levels, and its occupancy times and
+    clearness on every day, from the sensor's own random stream. The streams are left
+    positioned for the readings' noise."""
+    rngs = [
+        np.random.default_rng(
+            np.random.SeedSequence(
+                seed_sequence.entropy, spawn_key=seed_sequence.spawn_key + (sensor,)
+            )
+        )
+        for sensor in sensors
+    ]
+    scales, jitter, clearness = [], [], []
+    for rng in rngs:
+        scales.append(rng.lognormal(0, model.sensor_variation, 2))
+        jitter.append(rng.normal(0, model.occupancy_jitter_hours, (2, days)))
+        clearness.append(rng.uniform(model.min_clearness, 1, days))
+
+    # Arrays of shape (2, sensors), (2, sensors, days) and (sensors, days)
+    scales = np.stack(scales, axis=1)
+    jitter = np.stack(jitter, axis=1)
+    return _SensorDraws(
+        rngs,
+        scales,
+        model.occupied_start_hour + jitter[0],
+        model.occupied_end_hour + jitter[1],
+        np.stack(clearness),
+    )
+
+
+def _generate_days(
+    model: LuxTraceModel,
+    days: np.ndarray,
+    hours: np.ndarray,
+    draws: _SensorDraws,
+    start_day_of_year: int,
+) -> np.ndarray:
+    """Generate the lux of every sensor of a block (rows) at every timestep of the
+    given days (columns, day by day)."""
+    n_sensors = len(draws.rngs)
+
+    # Arrays of shape (sensors, days, timesteps)
+    h = hours[np.newaxis, np.newaxis, :]
+    start_hours = draws.start_hours[:, days, np.newaxis]
+    end_hours = draws.end_hours[:, days, np.newaxis]
+    clearness = draws.clearness[:, days, np.newaxis]
+    noise = np.stack(
+        [rng.lognormal(0, model.noise, (len(days), len(hours))) for rng in draws.rngs]
+    )
+
+    day_of_year = (start_day_of_year + days) % DAYS_PER_YEAR
+    day_length = HOURS_PER_DAY / 2 + model.day_length_amplitude_hours * np.sin(
+        2 * np.pi * (day_of_year - EQUINOX_DAY_OF_YEAR) / DAYS_PER_YEAR
+    )
+    day_length = day_length[np.newaxis, :, np.newaxis]
+    sunrise = (HOURS_PER_DAY - day_length) / 2
+    sun = np.clip(np.sin(np.pi * (h - sunrise) / day_length), 0, None)
+
+    # Accumulate in place, to hold as few (sensors, days, timesteps) arrays as possible.
+    lux = model.daylight_lux * draws.scales[1][:, np.newaxis, np.newaxis] * clearness
+    lux = lux * sun
+    weekday = (days % DAYS_PER_WEEK)[np.newaxis, :, np.newaxis]
+    occupied = (weekday < model.occupied_days) & (h >= start_hours) & (h < end_hours)
+    lux += np.where(
+        occupied,
+        model.occupied_lux * draws.scales[0][:, np.newaxis, np.newaxis],
+        model.unoccupied_lux,
+    )
+    lux *= noise
+    return lux.reshape(n_sensors, -1)
+
+
+def iter_fleet_lux_traces(
+    model: LuxTraceModel,
+    n_sensors: int,
+    days: int = DAYS_PER_YEAR,
+    timestep_seconds: float = 60,
+    chunk_days: int = DAYS_PER_WEEK,
+    sensors_per_chunk: int = SENSORS_PER_CHUNK,
+    start_day_of_year: int = 0,
+    seed: Seed = None,
+) -> Iterator[LuxTraceChunk]:
+    """Generate synthetic lux traces for a fleet of sensors, chunk by chunk: every day
+    chunk of the first block of sensors, then of the next block, and so on.
+
+    Each chunk holds sensors_per_chunk * chunk_days * (readings per day) readings, and
+    takes a few times that in memory to generate; lower either for fine timesteps (e.g.
+    1 second).
+
+    Typical usage example:
+        for chunk in iter_fleet_lux_traces(LuxTraceModel(), 1000, seed=42):
+            ...  # chunk.lux[i] is sensor chunk.sensors.start + i at chunk.times
+
+    Args:
+        model: Parameters of the traces
+        n_sensors: Number of sensors (distinct traces)
+        days: Length of the traces, in days; day 0 is a Monday
+        timestep_seconds: Time between readings, in seconds; must divide a day
+        chunk_days: Number of days generated per chunk
+        sensors_per_chunk: Number of sensors generated per chunk
+        start_day_of_year: Day of the year of day 0 (0 is January 1st)
+        seed: Seed (or entropy) for the random draws, or SeedSequence, or None for
+            fresh entropy
+
+    Yields:
+        LuxTraceChunk
+    """
+    steps_per_day = SECONDS_PER_DAY / timestep_seconds
+    if steps_per_day != int(steps_per_day):
+        raise ValueError(f"Timestep {timestep_seconds} s does not divide a day")
+
+    seconds = np.arange(int(steps_per_day)) * timestep_seconds
+    hours = seconds / (SECONDS_PER_DAY / HOURS_PER_DAY)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    for first_sensor in range(0, n_sensors, sensors_per_chunk):
+        sensors = slice(first_sensor, min(first_sensor + sensors_per_chunk, n_sensors))
+        draws = _draw_sensors(model, seed, range(n_sensors)[sensors], days)
+
+        for first_day in range(0, days, chunk_days):
+            chunk = np.arange(first_day, min(first_day + chunk_days, days))
+            t = (chunk[:, np.newaxis] * SECONDS_PER_DAY + seconds).ravel().astype(float)
+            lux = _generate_days(model, chunk, hours, draws, start_day_of_year)
+            yield LuxTraceChunk(sensors, t, lux, seed.entropy)
+
+
+def iter_lux_trace(
+    model: LuxTraceModel, days: int = DAYS_PER_YEAR, **kwargs
+) -> Iterator[LuxTraceChunk]:
+    """Generate a synthetic lux trace for a single sensor, chunk by chunk. Takes the
+    same keyword arguments as iter_fleet_lux_traces().
+
+    Yields:
+        LuxTraceChunk, whose lux is the sensor's lux at each reading
+    """
+    for chunk in iter_fleet_lux_traces(model, 1, days, **kwargs):
+        yield chunk._replace(lux=chunk.lux[0])
+
+
+def fleet_lux_traces(
+    model: LuxTraceModel, n_sensors: int, days: int = DAYS_PER_YEAR, **kwargs
+) -> np.ndarray:
+    """Generate synthetic lux traces for a fleet of sensors, as a single array of
+    shape (n_sensors, readings). Takes the same keyword arguments as
+    iter_fleet_lux_traces(); pass a SeedSequence as the seed to record its entropy."""
+    timestep_seconds = kwargs.get("timestep_seconds", 60)
+    steps_per_day = round(SECONDS_PER_DAY / timestep_seconds)
+    traces = np.empty((n_sensors, days * steps_per_day))
+
+    for chunk in iter_fleet_lux_traces(model, n_sensors, days, **kwargs):
+        start = round(chunk.times[0] / timestep_seconds) if len(chunk.times) else 0
+        traces[chunk.sensors, start : start + chunk.lux.shape[1]] = chunk.lux
+    return traces
@@ -0,0 +1,202 @@
+"""Contains methods to simulate the power profile of a two-mode (active and idle) sensor
+whose sampling triggers do not arrive at a consistent frequency.
+
+Triggers are either jittered around a nominal sampling period or arrive at random, as a
+Poisson process with the same mean period. Many independent trigger sequences are drawn
+at once as NumPy arrays, and each run's duty cycle is measured exactly from its trigger
+times, using the same model as power_profile(): every trigger keeps the sensor active
+for the following active_operation_seconds, and overlapping active periods merge.
+"""
+
+import concurrent.futures
+import functools
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .timeline import average_load_power
+
+TRIGGER_PROCESSES = ("poisson", "jitter")
+RUNS_PER_CHUNK = 1_000
+# Maximum number of trigger times drawn per chunk (about 16 MB per float array), so that
+# long runs are split into smaller chunks rather than using memory in proportion to
+# their duration.
+MAX_TRIGGERS_PER_CHUNK = 2_000_000
+SUMMARY_PERCENTILES = {"p5": 5, "p95": 95}
+
+
+def _triggers_per_run(
+    active_operation_frequency: float, duration_seconds: float, process: str
+) -> int:
+    """Return the number of trigger times drawn per run (before any extension)."""
+    expected = duration_seconds / active_operation_frequency
+    if process == "poisson":
+        # Enough inter-arrival times that every run almost surely covers the window.
+        return int(expected + 6 * np.sqrt(expected) + 10)
+    return int(np.ceil(expected))
+
+
+def _draw_trigger_times(
+    rng: np.random.Generator,
+    n_runs: int,
+    active_operation_frequency: float,
+    duration_seconds: float,
+    process: str,
+    jitter_seconds: float,
+) -> np.ndarray:
+    """Draw sorted trigger times for n_runs independent runs, as a (n_runs, n) array.
+
+    Rows are padded with duration_seconds once the run's triggers are exhausted.
+    """
+    n_draws = _triggers_per_run(active_operation_frequency, duration_seconds, process)
+
+    if process == "jitter":
+        nominal = active_operation_frequency * np.arange(n_draws)
+        noise = rng.uniform(-jitter_seconds, jitter_seconds, (n_runs, len(nominal)))
+        times = np.sort(np.clip(nominal + noise, 0, None), axis=1)
+
+    elif process == "poisson":
+        # Extend the few runs whose inter-arrival times do not cover the window.
+        times = np.cumsum(
+            rng.exponential(active_operation_frequency, (n_runs, n_draws)), axis=1
+        )
+        while np.any(times[:, -1] < duration_seconds):
+            extension = np.cumsum(
+                rng.exponential(active_operation_frequency, (n_runs, n_draws)), axis=1
+            )
+            times = np.hstack([times, times[:, -1:] + extension])
+
+    else:
+        raise ValueError(f"Unknown trigger process {process}: {TRIGGER_PROCESSES}")
+
+    return np.minimum(times, duration_seconds)
+
+
+def _active_seconds(
+    trigger_times: np.ndarray, active_operation_seconds: float, duration_seconds: float
+) -> np.ndarray:
+    """Return the total time each run spends in active mode.
+
+    All active periods have the same length, so with sorted trigger times each active
+    period can only overlap the one before it.
+    """
+    ends = np.minimum(trigger_times + active_operation_seconds, duration_seconds)
+    previous_ends = np.hstack([np.zeros((len(ends), 1)), ends[:, :-1]])
+    contributions = ends - np.maximum(trigger_times, previous_ends)
+    return np.clip(contributions, 0, None).sum(axis=1)
+
+
+def _simulate_chunk(
+    seed: np.random.SeedSequence,
+    n_runs: int,
+    active_operation_seconds: float,
+    active_operation_frequency: float,
+    duration_seconds: float,
+    process: str,
+    jitter_seconds: float,
+) -> np.ndarray:
+    """Simulate a chunk of runs and return the duty cycle of each run."""
+    rng = np.random.default_rng(seed)
+    trigger_times = _draw_trigger_times(
+        rng,
+        n_runs,
+        active_operation_frequency,
+        duration_seconds,
+        process,
+        jitter_seconds,
+    )
+    active = _active_seconds(trigger_times, active_operation_seconds, duration_seconds)
+    return active / duration_seconds
+
+
+def simulate_power_profiles(
+    idle_power: float,
+    active_power: float,
+    active_operation_seconds: float,
+    active_operation_frequency: float,
+    duration_seconds: float,
+    n_runs: int = 10_000,
+    process: str = "poisson",
+    jitter_seconds: float = 0.0,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate many independent runs of a sensor with stochastic sampling triggers.
+
+    Runs are split into chunks of up to RUNS_PER_CHUNK, and of up to
+    MAX_TRIGGERS_PER_CHUNK trigger times (but at least one run), so that memory use
+    does not grow with the duration of the runs. Each chunk has its own random stream
+    spawned from the seed, so results are reproducible for a given seed regardless of
+    the number of worker processes.
+
+    Typical usage example:
+        duty_cycles, average_load_powers = simulate_power_profiles(
+            10, 60, 15, 60, duration_seconds=24 * 60 * 60, seed=42, max_workers=4
+        )
+
+    Args:
+        idle_power: Power used in idle mode
+        active_power: Power used in active mode (same units as idle_power)
+        active_operation_seconds: Time spent in active mode per trigger, in seconds
+        active_operation_frequency: Mean time between triggers, in seconds
+        duration_seconds: Length of each simulated run, in seconds
+        n_runs: Number of independent runs
+        process: "poisson" for random arrivals, or "jitter" for triggers uniformly
+            jittered by up to jitter_seconds around each multiple of the period
+        jitter_seconds: Maximum trigger jitter, in seconds (jitter process only)
+        seed: Seed for the random streams
+        max_workers: Number of worker processes; runs in-process if None
+
+    Returns:
+        Tuple of:
+            duty cycle of each run, as float array
+            average load power of each run, as float array
+    """
+    triggers_per_run = _triggers_per_run(
+        active_operation_frequency, duration_seconds, process
+    )
+    runs_per_chunk = min(
+        RUNS_PER_CHUNK, max(1, MAX_TRIGGERS_PER_CHUNK // max(triggers_per_run, 1))
+    )
+    chunk_sizes = [
+        min(runs_per_chunk, n_runs - start)
+        for start in range(0, n_runs, runs_per_chunk)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    simulate_chunk = functools.partial(
+        _simulate_chunk,
+        active_operation_seconds=active_operation_seconds,
+        active_operation_frequency=active_operation_frequency,
+        duration_seconds=duration_seconds,
+        process=process,
+        jitter_seconds=jitter_seconds,
+    )
+
+    if max_workers is None:
+        chunks = list(map(simulate_chunk, seeds, chunk_sizes))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            chunks = list(executor.map(simulate_chunk, seeds, chunk_sizes))
+
+    duty_cycles = np.concatenate(chunks) if chunks else np.empty(0)
+    return duty_cycles, average_load_power(idle_power, active_power, duty_cycles)
+
+
+def summarize_power_profiles(
+    duty_cycles: np.ndarray, average_load_powers: np.ndarray
+) -> pd.DataFrame:
+    """Summarize simulated runs as the mean, 5th and 95th percentile of their duty
+    cycles and average load powers.
+
+    Returns:
+        DataFrame indexed by statistic (mean, p5, p95), with columns duty_cycle and
+        average_load_power
+    """
+    runs = pd.DataFrame(
+        {"duty_cycle": duty_cycles, "average_load_power": average_load_powers}
+    )
+    summary = {"mean": runs.mean()}
+    for name, percentile in SUMMARY_PERCENTILES.items():
+        summary[name] = runs.quantile(percentile / 100)
+    return pd.DataFrame(summary).T
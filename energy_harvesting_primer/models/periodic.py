@@ -0,0 +1,137 @@
+"""Contains methods to compute the exact steady-state duty cycle and average power of a
+schedule of periodic tasks, without stepping through time.
+
+Periodic tasks with different periods repeat together every hyperperiod (the least
+common multiple of their periods), so the long-run averages equal the averages over a
+single hyperperiod. Within one hyperperiod each task contributes a known number of
+occurrences, and overlaps between tasks are resolved by measuring the union of those
+occurrence intervals.
+"""
+
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .schedule import Schedule
+
+DEFAULT_RESOLUTION = 1e-3
+MAX_OCCURRENCES = 10_000_000
+
+
+def _to_ticks(seconds: float, resolution: float) -> int:
+    """Convert a time in seconds to an integer number of resolution ticks."""
+    return int(round(seconds / resolution))
+
+
+def hyperperiod(
+    periods: Sequence[float], resolution: float = DEFAULT_RESOLUTION
+) -> float:
+    """Return the hyperperiod (least common multiple) of the supplied periods.
+
+    Args:
+        periods: Task periods, in seconds
+        resolution: Time resolution, in seconds, that the periods are rounded to
+
+    Returns:
+        Hyperperiod, in seconds
+    """
+    ticks = [_to_ticks(period, resolution) for period in periods]
+    if not ticks or min(ticks) <= 0:
+        raise ValueError(f"Periods must be at least {resolution} seconds: {periods}")
+    return math.lcm(*ticks) * resolution
+
+
+def _union_length(starts: np.ndarray, ends: np.ndarray) -> int:
+    """Return the total length covered by the union of the supplied intervals."""
+    if len(starts) == 0:
+        return 0
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    # Each interval only adds the part that extends past every interval before it.
+    covered_until = np.concatenate([[starts[0]], np.maximum.accumulate(ends)[:-1]])
+    return int(np.maximum(ends - np.maximum(starts, covered_until), 0).sum())
+
+
+def steady_state(
+    schedule: Schedule, resolution: float = DEFAULT_RESOLUTION
+) -> Tuple[float, float]:
+    """Compute the exact long-run duty cycle and average power of a schedule made up of
+    periodic events.
+
+    As in Schedule.compile(), overlapping events draw the power of the most demanding
+    mode. Event times are rounded to the requested resolution.
+
+    Typical usage example:
+        schedule = Schedule(
+            Mode("Standby", 10),
+            [
+                Event(Mode("Sample", 60), duration=2, period=60),
+                Event(Mode("Heartbeat", 70), duration=5, period=15 * 60),
+                Event(Mode("OTA Check", 75), duration=30, period=24 * 60 * 60),
+            ],
+        )
+        duty_cycle, average_power = steady_state(schedule)
+
+    Args:
+        schedule: Schedule whose events all have a period
+        resolution: Time resolution, in seconds
+
+    Returns:
+        Tuple of:
+            duty cycle (fraction of time outside of standby), as float
+            average power, as float
+    """
+    if not schedule.events:
+        return 0.0, float(schedule.standby.power)
+    if any(event.period is None for event in schedule.events):
+        raise ValueError("Steady-state analysis requires periodic events only")
+
+    periods = [_to_ticks(event.period, resolution) for event in schedule.events]
+    h = _to_ticks(
+        hyperperiod([event.period for event in schedule.events], resolution),
+        resolution,
+    )
+
+    n_occurrences = sum(h // period for period in periods)
+    if n_occurrences > MAX_OCCURRENCES:
+        raise ValueError(
+            f"Hyperperiod of {h * resolution} seconds contains {n_occurrences} event "
+            "occurrences; round the event periods to a coarser resolution"
+        )
+
+    starts = []
+    ends = []
+    for event, period in zip(schedule.events, periods):
+        duration = min(_to_ticks(event.duration, resolution), period)
+        offset = _to_ticks(event.offset, resolution) % period
+        event_starts = offset + period * np.arange(h // period, dtype=np.int64)
+        event_ends = event_starts + duration
+
+        # Occurrences that run past the end of the hyperperiod wrap around to its start.
+        wraps = event_ends > h
+        starts.append(np.concatenate([event_starts, np.zeros(wraps.sum(), np.int64)]))
+        ends.append(np.concatenate([np.minimum(event_ends, h), event_ends[wraps] - h]))
+
+    # Attribute time to events in order of precedence: each event is credited with the
+    # time it adds to the union of all more demanding events.
+    precedence = sorted(
+        range(len(schedule.events)), key=lambda i: -schedule.events[i].mode.power
+    )
+    standby_power = schedule.standby.power
+    covered = 0
+    energy_above_standby = 0.0
+    for n in range(1, len(precedence) + 1):
+        included = precedence[:n]
+        union = _union_length(
+            np.concatenate([starts[i] for i in included]),
+            np.concatenate([ends[i] for i in included]),
+        )
+        event_power = schedule.events[precedence[n - 1]].mode.power
+        energy_above_standby += (event_power - standby_power) * (union - covered)
+        covered = union
+
+    duty_cycle = covered / h
+    average_power = standby_power + energy_above_standby / h
+
+    return duty_cycle, average_power
@@ -0,0 +1,293 @@
+"""Contains classes to describe multi-mode sensor schedules and compile them into
+run-length-encoded, piecewise-constant power timelines.
+
+A compiled timeline stores one entry per segment of constant power (segment start,
+duration and mode), so memory scales with the number of mode transitions rather than
+with the number of timesteps in the horizon.
+"""
+
+import dataclasses
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Relative tolerance used when assigning segment boundaries to resampling bins, so that
+# floating-point error does not move a boundary into the neighbouring bin.
+BIN_TOLERANCE = 1e-9
+
+
+@dataclasses.dataclass(frozen=True)
+class Mode:
+    """Sensor mode of operation, such as Measurement, Transmit, Update or Standby.
+
+    Attributes:
+        name: Display name of the mode
+        power: Power drawn while in the mode (e.g. in microwatts)
+    """
+
+    name: str
+    power: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    """Occurrence(s) of a sensor mode within a schedule.
+
+    An event with a period repeats every period seconds, starting at offset. An event
+    without a period is a one-off that occurs once, at offset.
+
+    Attributes:
+        mode: Mode the sensor operates in for the duration of the event
+        duration: Time spent in the mode per occurrence, in seconds
+        period: Time between consecutive occurrences, in seconds, or None for one-off
+        offset: Time of the first occurrence, in seconds
+    """
+
+    mode: Mode
+    duration: float
+    period: Optional[float] = None
+    offset: float = 0.0
+
+    def __post_init__(self):
+        if self.duration < 0:
+            raise ValueError(f"Event duration must be non-negative: {self.duration}")
+        if self.period is not None and self.period <= 0:
+            raise ValueError(f"Event period must be positive: {self.period}")
+        if self.offset < 0:
+            raise ValueError(f"Event offset must be non-negative: {self.offset}")
+
+    def starts(self, horizon: float) -> np.ndarray:
+        """Return the start times of all occurrences that begin before the horizon."""
+        if self.offset >= horizon:
+            return np.empty(0)
+        if self.period is None:
+            return np.array([float(self.offset)])
+
+        n_occurrences = int(np.ceil((horizon - self.offset) / self.period))
+        return self.offset + self.period * np.arange(n_occurrences, dtype=float)
+
+
+class Timeline:
+    """Run-length-encoded, piecewise-constant power timeline, as produced by
+    Schedule.compile().
+
+    Typical usage example:
+        timeline = schedule.compile(horizon=30 * 24 * 60 * 60)
+        timeline.average_power()
+        timeline.energy_per_period(60)
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        durations: np.ndarray,
+        mode_codes: np.ndarray,
+        modes: Sequence[Mode],
+    ):
+        self.starts = np.asarray(starts, dtype=float)
+        self.durations = np.asarray(durations, dtype=float)
+        self.mode_codes = np.asarray(mode_codes, dtype=np.int32)
+        self.modes = list(modes)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def horizon(self) -> float:
+        """Return the end time of the timeline, in seconds."""
+        return float(self.starts[-1] + self.durations[-1]) if len(self) else 0.0
+
+    @property
+    def power(self) -> np.ndarray:
+        """Return the power level of each segment."""
+        return np.array([mode.power for mode in self.modes], dtype=float)[
+            self.mode_codes
+        ]
+
+    def energy(self) -> float:
+        """Return the total energy consumed over the timeline (power x seconds)."""
+        return float(np.dot(self.power, self.durations))
+
+    def average_power(self) -> float:
+        """Return the average power over the timeline."""
+        return self.energy() / self.horizon
+
+    def duty_cycle(self) -> float:
+        """Return the fraction of time spent outside of the standby mode."""
+        return float(self.durations[self.mode_codes != 0].sum()) / self.horizon
+
+    def time_in_mode(self) -> Dict[str, float]:
+        """Return the total time, in seconds, spent in each mode."""
+        totals = np.bincount(
+            self.mode_codes, weights=self.durations, minlength=len(self.modes)
+        )
+        return {mode.name: float(total) for mode, total in zip(self.modes, totals)}
+
+    def cumulative_energy(self, t) -> np.ndarray:
+        """Return the energy consumed between t = 0 and each of the requested times.
+
+        Energy is piecewise linear in time for a piecewise-constant power timeline, so
+        interpolating between segment boundaries is exact.
+        """
+        boundaries = np.append(self.starts, self.horizon)
+        energy = np.concatenate([[0.0], np.cumsum(self.power * self.durations)])
+        return np.interp(t, boundaries, energy)
+
+    def energy_per_period(self, period: float) -> np.ndarray:
+        """Return the energy consumed in each complete period of the timeline."""
+        edges = period * np.arange(int(self.horizon // period) + 1)
+        return np.diff(self.cumulative_energy(edges))
+
+    def resample(self, step: float, how: str = "mean") -> Tuple[np.ndarray, np.ndarray]:
+        """Aggregate the timeline into fixed-width bins, e.g. to display a timeline with
+        millisecond bursts at chart resolution.
+
+        Args:
+            step: Bin width, in seconds
+            how: "mean" for the average power in each bin (preserves energy), or "max"
+                for the peak power in each bin (keeps short bursts visible)
+
+        Returns:
+            Tuple of:
+                start time of each bin, as float array
+                aggregated power of each bin, as float array
+        """
+        n_bins = int(np.ceil(self.horizon / step - BIN_TOLERANCE))
+        bin_starts = step * np.arange(n_bins)
+
+        if how == "mean":
+            edges = np.append(bin_starts, self.horizon)
+            values = np.diff(self.cumulative_energy(edges)) / np.diff(edges)
+        elif how == "max":
+            power = self.power
+            # Every segment overlapping a bin is either in effect at the start of the
+            # bin, or starts part-way through it.
+            values = power[np.searchsorted(self.starts, bin_starts, side="right") - 1]
+            start_bins = np.floor(self.starts / step + BIN_TOLERANCE).astype(np.int64)
+            np.maximum.at(values, np.minimum(start_bins, n_bins - 1), power)
+        else:
+            raise ValueError(f"Unknown aggregation {how}; expected 'mean' or 'max'")
+
+        return bin_starts, values
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the timeline segments as a DataFrame."""
+        return pd.DataFrame(
+            {
+                "start": self.starts,
+                "duration": self.durations,
+                "power": self.power,
+                "mode": [self.modes[code].name for code in self.mode_codes],
+            }
+        )
+
+
+class Schedule:
+    """Multi-mode sensor schedule: a standby mode plus periodic and one-off events.
+
+    When events overlap, the sensor is assumed to draw the power of the most demanding
+    mode; ties are broken in favor of the event listed first.
+
+    Typical usage example:
+        standby = Mode("Standby", 10)
+        schedule = Schedule(
+            standby,
+            [
+                Event(Mode("Measurement", 60), duration=15, period=60),
+                Event(Mode("Transmit", 75), duration=0.005, period=60, offset=15),
+                Event(Mode("Update", 70), duration=120, offset=3600),
+            ],
+        )
+        timeline = schedule.compile(horizon=24 * 60 * 60)
+    """
+
+    def __init__(self, standby: Mode, events: Sequence[Event]):
+        self.standby = standby
+        self.events = list(events)
+
+    @property
+    def modes(self) -> List[Mode]:
+        """Return the modes in the schedule; the standby mode is always first."""
+        modes = [self.standby]
+        for event in self.events:
+            if event.mode not in modes:
+                modes.append(event.mode)
+        return modes
+
+    def compile(self, horizon: float) -> Timeline:
+        """Compile the schedule into a run-length-encoded timeline over [0, horizon).
+
+        Args:
+            horizon: Length of the compiled timeline, in seconds
+
+        Returns:
+            Timeline with one segment per run of constant mode
+        """
+        if horizon <= 0:
+            raise ValueError(f"Schedule horizon must be positive: {horizon}")
+
+        modes = self.modes
+        event_starts = [event.starts(horizon) for event in self.events]
+        event_ends = [
+            np.minimum(starts + event.duration, horizon)
+            for starts, event in zip(event_starts, self.events)
+        ]
+
+        boundaries = np.unique(
+            np.concatenate([[0.0, horizon], *event_starts, *event_ends])
+        )
+        n_intervals = len(boundaries) - 1
+
+        mode_codes = np.zeros(n_intervals, dtype=np.int32)
+        assigned = np.zeros(n_intervals, dtype=bool)
+
+        precedence = sorted(
+            range(len(self.events)), key=lambda i: -self.events[i].mode.power
+        )
+        for i in precedence:
+            # Mark the elementary intervals covered by any occurrence of the event with
+            # a difference array over interval indices.
+            coverage = np.zeros(n_intervals + 1, dtype=np.int32)
+            np.add.at(coverage, np.searchsorted(boundaries, event_starts[i]), 1)
+            np.add.at(coverage, np.searchsorted(boundaries, event_ends[i]), -1)
+            covered = np.cumsum(coverage[:-1]) > 0
+
+            mode_codes[covered & ~assigned] = modes.index(self.events[i].mode)
+            assigned |= covered
+
+        is_transition = np.concatenate([[True], mode_codes[1:] != mode_codes[:-1]])
+        starts = boundaries[:-1][is_transition]
+        durations = np.diff(np.append(starts, horizon))
+
+        return Timeline(starts, durations, mode_codes[is_transition], modes)
+
+
+def two_mode_schedule(
+    idle_power: float,
+    active_power: float,
+    active_operation_seconds: float,
+    active_operation_frequency: float,
+) -> Schedule:
+    """Return the schedule of a simplified sensor with two modes, active and idle, that
+    samples at a consistent frequency.
+
+    Args:
+        idle_power: Power used in idle mode
+        active_power: Power used in active mode (same units as idle_power)
+        active_operation_seconds: Time spent in active mode per sample, in seconds
+        active_operation_frequency: Sampling period, in seconds
+
+    Returns:
+        Schedule with an "Idle" standby mode and a periodic "Active" event
+    """
+    return Schedule(
+        Mode("Idle", idle_power),
+        [
+            Event(
+                Mode("Active", active_power),
+                duration=active_operation_seconds,
+                period=active_operation_frequency,
+            )
+        ],
+    )
@@ -0,0 +1,180 @@
+"""Contains methods to simulate the energy stored by a sensor (for instance, in a
+supercapacitor) over a light level time series.
+
+Each timestep, the store gains the energy harvested from the available light and loses
+the energy used by the sensor at its sampling rate, clipped to the empty and full
+capacity:
+
+    E[i] = clip(E[i - 1] + (P_harvested[i] - P_load[i]) * dt, 0, capacity)
+
+The sensor browns out (and misses samples) whenever its store is empty and it uses more
+energy than it harvests.
+
+Between touching one bound and touching the other, the clipped recursion is a running
+sum reflected at a single bound, which is vectorized with a running maximum (or
+minimum). The scan therefore only steps through the trace in Python once per full to
+empty (or empty to full) swing, e.g. twice a day for lights-off nights, rather than
+once per timestep.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..sensor_profiles.base import check_single_variant
+from ..sensor_profiles.tabulated import to_sampling_rate_seconds
+
+# Initial (and maximum) number of timesteps scanned at once between bound crossings.
+MIN_SCAN_WINDOW = 1_024
+MAX_SCAN_WINDOW = 262_144
+
+
+class StorageSimulation(NamedTuple):
+    """Result of simulate_storage().
+
+    Attributes:
+        stored_energy: Stored energy at the end of each timestep, in joules
+        state_of_charge: Stored energy as a fraction of capacity
+        brownout: Whether the sensor browned out during each timestep
+        brownout_intervals: DataFrame with the start, end and duration_seconds of each
+            run of brownout timesteps
+        missed_samples: Number of samples missed during brownouts
+    """
+
+    stored_energy: np.ndarray
+    state_of_charge: np.ndarray
+    brownout: np.ndarray
+    brownout_intervals: pd.DataFrame
+    missed_samples: int
+
+
+def _clipped_cumsum(
+    net_energy: np.ndarray, initial_energy: float, capacity: float
+) -> np.ndarray:
+    """Return the running sum of net_energy from initial_energy, clipped to [0,
+    capacity] at every step."""
+    stored_energy = np.empty_like(net_energy)
+    level = initial_energy
+    # Bound the running sum is reflected at: True for full, False for empty.
+    reflect_full = True
+    window = MIN_SCAN_WINDOW
+    i = 0
+
+    while i < len(net_energy):
+        running = level + np.cumsum(net_energy[i : i + window])
+        # Reflecting can overshoot the bound by a rounding error, so clip to it.
+        if reflect_full:
+            path = running - np.maximum(np.maximum.accumulate(running - capacity), 0)
+            path = np.minimum(path, capacity)
+            crossed = np.flatnonzero(path < 0)
+        else:
+            path = running - np.minimum(np.minimum.accumulate(running), 0)
+            path = np.maximum(path, 0)
+            crossed = np.flatnonzero(path > capacity)
+
+        if len(crossed) == 0:
+            stored_energy[i : i + len(path)] = path
+            level = path[-1]
+            i += len(path)
+            window = min(2 * window, MAX_SCAN_WINDOW)
+            continue
+
+        # The path is exact up to the first step that crosses the other bound, which
+        # clips to that bound and becomes the new reflecting bound.
+        j = crossed[0]
+        level = 0.0 if reflect_full else capacity
+        stored_energy[i : i + j] = path[:j]
+        stored_energy[i + j] = level
+        reflect_full = not reflect_full
+        i += j + 1
+        window = MIN_SCAN_WINDOW
+
+    return stored_energy
+
+
+def _brownout_intervals(brownout: np.ndarray, times, timestep_seconds: float):
+    """Return the start, end and duration of each run of brownout timesteps."""
+    edges = np.diff(np.concatenate([[0], brownout.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    if isinstance(times, pd.DatetimeIndex):
+        end_times = times[ends - 1] + pd.Timedelta(seconds=timestep_seconds)
+    else:
+        end_times = ends * timestep_seconds
+
+    return pd.DataFrame(
+        {
+            "start": times[starts],
+            "end": end_times,
+            "duration_seconds": (ends - starts) * timestep_seconds,
+        }
+    )
+
+
+def simulate_storage(
+    lux,
+    sensor_profile,
+    sampling_rate,
+    capacity_joules: float,
+    timestep_seconds: float = 60,
+    initial_state_of_charge: float = 1.0,
+) -> StorageSimulation:
+    """Simulate the energy stored by a sensor over a light level time series.
+
+    Typical usage example:
+        year = pd.date_range("2023-01-01", periods=365 * 24 * 60, freq="1min")
+        lux = pd.Series(np.where(year.hour.isin(range(8, 18)), 400, 0), index=year)
+        result = simulate_storage(
+            lux, EveractiveEnvironmentalPlusEversensor(), 60, capacity_joules=5
+        )
+        result.brownout_intervals.duration_seconds.sum()
+
+    Args:
+        lux: Available light at each timestep, in lux, as array or pandas Series (whose
+            index labels the brownout intervals). Missing (NaN) readings would
+            corrupt every later timestep, so they raise a ValueError; fill gaps
+            first, e.g. with 0 lux.
+        sensor_profile: Sensor profile, providing get_harvested_power() and
+            get_load_power()
+        sampling_rate: Sampling rate period, in seconds, or "continuous", or an array
+            with the sampling rate period at each timestep
+        capacity_joules: Usable energy storage capacity, in joules
+        timestep_seconds: Time between lux readings, in seconds
+        initial_state_of_charge: Stored energy at the start, as a fraction of capacity
+
+    Returns:
+        StorageSimulation
+    """
+    check_single_variant(sensor_profile)
+    if isinstance(lux, pd.Series):
+        times = lux.index
+    else:
+        times = np.arange(len(lux)) * timestep_seconds
+
+    harvested_power = np.asarray(sensor_profile.get_harvested_power(lux), dtype=float)
+    load_power = np.asarray(sensor_profile.get_load_power(sampling_rate), dtype=float)
+    net_energy = (harvested_power - load_power) * timestep_seconds
+    net_energy = np.broadcast_to(net_energy, harvested_power.shape)
+    if not np.all(np.isfinite(net_energy)):
+        first = np.flatnonzero(~np.isfinite(net_energy))[0]
+        raise ValueError(f"Net energy is not finite at timestep {first}")
+
+    stored_energy = _clipped_cumsum(
+        net_energy, initial_state_of_charge * capacity_joules, capacity_joules
+    )
+    brownout = (stored_energy <= 0) & (net_energy < 0)
+
+    sampling_rate_seconds = np.broadcast_to(
+        np.asarray(to_sampling_rate_seconds(sampling_rate), dtype=float), brownout.shape
+    )
+    missed_samples = np.sum(timestep_seconds / sampling_rate_seconds[brownout])
+
+    return StorageSimulation(
+        stored_energy=stored_energy,
+        state_of_charge=stored_energy / capacity_joules,
+        brownout=brownout,
+        brownout_intervals=_brownout_intervals(brownout, times, timestep_seconds),
+        missed_samples=int(np.floor(missed_samples)),
+    )
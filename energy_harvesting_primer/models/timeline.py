@@ -0,0 +1,248 @@
+"""Contains NumPy-backed methods to model the power profile of a simplified sensor with
+two modes, active and idle, over arbitrarily long time horizons."""
+
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .schedule import Timeline, two_mode_schedule
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def duty_cycle(active_operation_seconds, active_operation_frequency):
+    """Return the fraction of each sampling period that the sensor spends in active
+    mode.
+
+    Args:
+        active_operation_seconds: Time spent in active mode per period, in seconds
+        active_operation_frequency: Sampling period, in seconds
+
+    Returns:
+        Duty cycle, as float (or array of floats for array inputs)
+    """
+    return np.true_divide(active_operation_seconds, active_operation_frequency)
+
+
+def average_load_power(idle_power, active_power, duty_cycle):
+    """Return the average load power of a sensor that spends the given fraction of time
+    in active mode and the remainder in idle mode.
+
+    Args:
+        idle_power: Power used in idle mode
+        active_power: Power used in active mode (same units as idle_power)
+        duty_cycle: Fraction of time spent in active mode
+
+    Returns:
+        Average load power, in the units of the supplied powers
+    """
+    return active_power * duty_cycle + idle_power * (1 - duty_cycle)
+
+
+def power_profile_metrics(
+    idle_power, active_power, active_operation_seconds, active_operation_frequency
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the duty cycle and average load power of many power profile
+    configurations in one vectorized pass, without building any charts.
+
+    Inputs are broadcast against each other, so any of them may be a scalar shared by
+    all configurations.
+
+    Typical usage example:
+        duty_cycles, average_load_powers = power_profile_metrics(
+            idle_power=10,
+            active_power=np.array([40, 60, 75]),
+            active_operation_seconds=15,
+            active_operation_frequency=np.array([30, 60, 300]),
+        )
+
+    Args:
+        idle_power: Power(s) used in idle mode
+        active_power: Power(s) used in active mode (same units as idle_power)
+        active_operation_seconds: Time(s) spent in active mode per period, in seconds
+        active_operation_frequency: Sampling period(s), in seconds
+
+    Returns:
+        Tuple of:
+            duty cycles, as float array
+            average load powers, as float array
+    """
+    idle_power, active_power, t_active, t_period = np.broadcast_arrays(
+        *(
+            np.asarray(x, dtype=float)
+            for x in (
+                idle_power,
+                active_power,
+                active_operation_seconds,
+                active_operation_frequency,
+            )
+        )
+    )
+    if np.any(t_period <= 0):
+        raise ValueError("Sampling periods must be positive numbers of seconds")
+
+    duty_cycles = duty_cycle(t_active, t_period)
+    average_load_powers = average_load_power(idle_power, active_power, duty_cycles)
+
+    return duty_cycles, average_load_powers
+
+
+def power_profile_metrics_frame(configurations: pd.DataFrame) -> pd.DataFrame:
+    """Compute power profile metrics for a DataFrame of configurations.
+
+    Args:
+        configurations: DataFrame with columns idle_power, active_power,
+            active_operation_seconds and active_operation_frequency
+
+    Returns:
+        Copy of the supplied DataFrame with added duty_cycle and average_load_power
+        columns
+    """
+    duty_cycles, average_load_powers = power_profile_metrics(
+        configurations["idle_power"].to_numpy(),
+        configurations["active_power"].to_numpy(),
+        configurations["active_operation_seconds"].to_numpy(),
+        configurations["active_operation_frequency"].to_numpy(),
+    )
+    return configurations.assign(
+        duty_cycle=duty_cycles, average_load_power=average_load_powers
+    )
+
+
+def _two_mode_segments(
+    idle_power: float,
+    active_power: float,
+    active_operation_seconds: int,
+    active_operation_frequency: int,
+    duration_seconds: int,
+    start_seconds: int,
+) -> Tuple[Timeline, np.ndarray]:
+    """Return the compiled two-mode timeline over a single sampling period, and the
+    segment of that timeline in effect at each second of the requested window.
+
+    The schedule repeats every sampling period, so one period is compiled (with
+    two_mode_schedule()) and every second is looked up modulo the period.
+    """
+    if active_operation_frequency <= 0:
+        raise ValueError("Sampling period must be a positive number of seconds")
+
+    timeline = two_mode_schedule(
+        idle_power, active_power, active_operation_seconds, active_operation_frequency
+    ).compile(active_operation_frequency)
+
+    t = np.arange(start_seconds, start_seconds + duration_seconds, dtype=np.int64)
+    segments = (
+        np.searchsorted(timeline.starts, t % active_operation_frequency, side="right")
+        - 1
+    )
+    return timeline, segments
+
+
+def active_mask(
+    duration_seconds: int,
+    active_operation_seconds: int,
+    active_operation_frequency: int,
+    start_seconds: int = 0,
+) -> np.ndarray:
+    """Return a boolean mask, at 1 second resolution, of the seconds in which the sensor
+    is in active mode.
+
+    Sampling events are triggered at every multiple of the sampling period (starting at
+    t = 0) and keep the sensor active for the following active_operation_seconds, as in
+    two_mode_schedule().
+
+    Args:
+        duration_seconds: Number of seconds to evaluate
+        active_operation_seconds: Time spent in active mode per event, in seconds
+        active_operation_frequency: Sampling period, in seconds
+        start_seconds: Time of the first evaluated second
+
+    Returns:
+        Boolean array of length duration_seconds, True where the sensor is active
+    """
+    timeline, segments = _two_mode_segments(
+        0,
+        1,
+        active_operation_seconds,
+        active_operation_frequency,
+        duration_seconds,
+        start_seconds,
+    )
+    return timeline.mode_codes[segments] != 0
+
+
+def power_timeline(
+    idle_power: float,
+    active_power: float,
+    active_operation_seconds: int,
+    active_operation_frequency: int,
+    duration_seconds: int,
+    start_seconds: int = 0,
+) -> np.ndarray:
+    """Return the sensor power draw for every second of the requested window, sampled
+    from the compiled two_mode_schedule().
+
+    Args:
+        idle_power: Power used in idle mode
+        active_power: Power used in active mode (same units as idle_power)
+        active_operation_seconds: Time spent in active mode per event, in seconds
+        active_operation_frequency: Sampling period, in seconds
+        duration_seconds: Number of seconds to evaluate
+        start_seconds: Time of the first evaluated second
+
+    Returns:
+        Array of length duration_seconds with the power draw at each second
+    """
+    timeline, segments = _two_mode_segments(
+        idle_power,
+        active_power,
+        active_operation_seconds,
+        active_operation_frequency,
+        duration_seconds,
+        start_seconds,
+    )
+    return timeline.power[segments]
+
+
+def iter_power_timeline(
+    idle_power: float,
+    active_power: float,
+    active_operation_seconds: int,
+    active_operation_frequency: int,
+    duration_seconds: int,
+    chunk_seconds: int = SECONDS_PER_DAY,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield the per-second power draw of the sensor in chunks, so that week- or
+    year-long horizons can be processed without materializing the full timeline.
+
+    Typical usage example:
+        energy = 0
+        for t, power in iter_power_timeline(10, 60, 15, 60, 365 * SECONDS_PER_DAY):
+            energy += power.sum()
+
+    Args:
+        idle_power: Power used in idle mode
+        active_power: Power used in active mode (same units as idle_power)
+        active_operation_seconds: Time spent in active mode per event, in seconds
+        active_operation_frequency: Sampling period, in seconds
+        duration_seconds: Total number of seconds to evaluate
+        chunk_seconds: Maximum number of seconds per yielded chunk
+
+    Yields:
+        Tuple of:
+            time of each second in the chunk, as int array
+            power draw at each second in the chunk, as array
+    """
+    for chunk_start in range(0, duration_seconds, chunk_seconds):
+        chunk_duration = min(chunk_seconds, duration_seconds - chunk_start)
+        t = np.arange(chunk_start, chunk_start + chunk_duration, dtype=np.int64)
+        power = power_timeline(
+            idle_power,
+            active_power,
+            active_operation_seconds,
+            active_operation_frequency,
+            chunk_duration,
+            start_seconds=chunk_start,
+        )
+        yield t, power
@@ -0,0 +1,96 @@
+"""Contains methods to estimate the data sent by a fleet of sensors, for sizing gateways
+and backhaul.
+
+Every argument may be an array, and arguments are broadcast against each other, so that
+e.g. every combination of sampling rate and fleet size is evaluated in one pass:
+
+    data_volume(
+        sampling_rate=np.array([15, 60, 600])[:, np.newaxis],
+        fleet_size=np.array([1, 1_000, 100_000]),
+    ).messages_per_second  # 3 x 3 array
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ..sensor_profiles.tabulated import to_sampling_rate_seconds
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+BYTES_PER_MB = 1_048_576
+DEFAULT_PACKET_SIZE_BYTES = 55
+
+
+class DataVolume(NamedTuple):
+    """Result of data_volume(). Totals are for the whole fleet over the period.
+
+    Attributes:
+        readings: Readings taken per sensor over the period
+        messages: Messages sent by the fleet, including retransmissions
+        messages_per_second: Average messages sent per second by the fleet
+        uplink_bytes: Bytes sent by the fleet, including headers and retransmissions
+        uplink_mb: uplink_bytes, in MB
+        airtime_seconds: Time spent transmitting by the fleet (NaN without a bitrate)
+        channel_utilization: airtime_seconds as a fraction of the period
+    """
+
+    readings: np.ndarray
+    messages: np.ndarray
+    messages_per_second: np.ndarray
+    uplink_bytes: np.ndarray
+    uplink_mb: np.ndarray
+    airtime_seconds: np.ndarray
+    channel_utilization: np.ndarray
+
+
+def data_volume(
+    sampling_rate,
+    packet_size_bytes=DEFAULT_PACKET_SIZE_BYTES,
+    retransmission_overhead=0.0,
+    fleet_size=1,
+    header_bytes=0,
+    bitrate_bps: Optional[float] = None,
+    period_seconds: float = SECONDS_PER_YEAR,
+) -> DataVolume:
+    """Estimate the data sent by a fleet of sensors, each sending one packet per
+    reading.
+
+    Args:
+        sampling_rate: Sampling rate period, in seconds, or "continuous"
+        packet_size_bytes: Payload sent per reading, in bytes
+        retransmission_overhead: Retransmitted messages, as a fraction of readings
+        fleet_size: Number of sensors
+        header_bytes: Link layer overhead per message, in bytes
+        bitrate_bps: Link bitrate, in bits per second, or None if unknown
+        period_seconds: Period to total over, in seconds (defaults to a year)
+
+    Returns:
+        DataVolume, with float arrays (or floats for all-scalar input)
+    """
+    rates = np.asarray(to_sampling_rate_seconds(sampling_rate), dtype=float)
+    fleet_size = np.asarray(fleet_size, dtype=float)
+
+    readings = period_seconds / rates
+    messages = readings * fleet_size * (1 + np.asarray(retransmission_overhead))
+    message_bytes = np.asarray(packet_size_bytes, dtype=float) + header_bytes
+    uplink_bytes = messages * message_bytes
+
+    if bitrate_bps is None:
+        airtime_seconds = np.full_like(uplink_bytes, np.nan)
+    else:
+        airtime_seconds = uplink_bytes * 8 / np.asarray(bitrate_bps, dtype=float)
+
+    volume = DataVolume(
+        readings=readings,
+        messages=messages,
+        messages_per_second=messages / period_seconds,
+        uplink_bytes=uplink_bytes,
+        uplink_mb=uplink_bytes / BYTES_PER_MB,
+        airtime_seconds=airtime_seconds,
+        channel_utilization=airtime_seconds / period_seconds,
+    )
+    # Broadcast every result to the common shape of the inputs.
+    shape = np.broadcast_shapes(*(np.shape(x) for x in volume))
+    if shape:
+        return DataVolume(*(np.broadcast_to(x, shape) for x in volume))
+    return DataVolume(*(float(x) for x in volume))
@@ -0,0 +1,97 @@
+"""Contains methods to classify power measurements into energy harvesting zones.
+
+The zone of an energy harvesting sensor is set by the greater of its load power and its
+harvested power, relative to the sensor's always-on and active power (see
+power_operating_space()):
+
+    - ZONE_1 (No Energy Harvesting): up to the always-on power,
+    - ZONE_2 (Limited Energy Harvesting): up to the active power,
+    - ZONE_3 (Plentiful Energy Harvesting): above the active power.
+
+Zones are returned as compact int8 codes, indexing ZONES, so that large batches of
+measurements (e.g. fleet telemetry) can be classified at once:
+
+    codes = classify_zone(df["p_load"], df["p_harvested"], 1e-6, 1e-3)
+    df["zone"] = zone_labels(codes)
+"""
+
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+ZONE_1 = "No Energy Harvesting"
+ZONE_2 = "Limited Energy Harvesting"
+ZONE_3 = "Plentiful Energy Harvesting"
+ZONES = (ZONE_1, ZONE_2, ZONE_3)
+
+# Zone code of measurements that cannot be classified (e.g. NaN power).
+UNKNOWN_ZONE = -1
+
+
+def _group_thresholds(thresholds: Mapping, groups) -> np.ndarray:
+    """Return the threshold of each measurement's group, from a mapping of group to
+    threshold, as float array."""
+    codes, uniques = pd.factorize(groups if np.ndim(groups) == 1 else np.ravel(groups))
+    group_thresholds = pd.Series(thresholds, dtype=float).reindex(np.asarray(uniques))
+    missing = group_thresholds.index[group_thresholds.isna()]
+    if len(missing):
+        raise KeyError(f"No thresholds for groups {list(missing)}")
+    return group_thresholds.to_numpy()[codes].reshape(np.shape(groups))
+
+
+def classify_zone(
+    p_load,
+    p_harvested,
+    p_always_on,
+    p_active,
+    groups=None,
+):
+    """Classify power measurements into energy harvesting zones.
+
+    Typical usage example:
+        # Per-sensor thresholds, for a long DataFrame of telemetry.
+        codes = classify_zone(
+            df["p_load"], df["p_harvested"],
+            p_always_on={"sensor-1": 1e-7, "sensor-2": 1e-6},
+            p_active={"sensor-1": 1e-4, "sensor-2": 1e-3},
+            groups=df["sensor_id"],
+        )
+
+    Args:
+        p_load: Sensor load power, in watts
+        p_harvested: Sensor harvested power, in watts
+        p_always_on: Sensor always-on power, in watts, or a mapping of group to
+            always-on power if groups is given
+        p_active: Sensor active power, in watts, or a mapping of group to active power
+            if groups is given
+        groups: Group (e.g. sensor ID) of each measurement, to look up its thresholds
+            in p_always_on and p_active, or None if the thresholds are not grouped
+
+    Returns:
+        Zone code of each measurement, indexing ZONES (or UNKNOWN_ZONE for NaN power),
+        as int8 array (or int for all-scalar input)
+    """
+    if groups is not None:
+        p_always_on = _group_thresholds(p_always_on, groups)
+        p_active = _group_thresholds(p_active, groups)
+
+    p_always_on = np.asarray(p_always_on, dtype=float)
+    p_active = np.asarray(p_active, dtype=float)
+    if np.any(p_always_on >= p_active):
+        raise ValueError("Always-on power must be less than active power")
+
+    power = np.maximum(
+        np.asarray(p_load, dtype=float), np.asarray(p_harvested, dtype=float)
+    )
+    codes = (power > p_always_on).astype(np.int8)
+    codes += power > p_active
+    codes = np.where(np.isnan(power), np.int8(UNKNOWN_ZONE), codes)
+
+    return int(codes) if codes.ndim == 0 else codes
+
+
+def zone_labels(codes) -> pd.Categorical:
+    """Return zone names for zone codes returned by classify_zone(), as categorical
+    (with unknown zones missing)."""
+    return pd.Categorical.from_codes(np.ravel(codes), categories=ZONES)
@@ -1,6 +1,25 @@
 """energy_harvesting_primer.sensor_profiles"""
 
-from .everactive_environmental_sensor import (
+from .base import (
+    CONTINUOUS,
+    CONTINUOUS_SAMPLING_RATE_SECONDS,
+    DEFAULT_WATTS_PER_LUX,
+    SAMPLING_RATES,
     BaseSensorProfile,
-    EveractiveEnvironmentalPlusEversensor,
+    check_single_variant,
+)
+from .everactive_environmental_sensor import EveractiveEnvironmentalPlusEversensor
+from .parametric import ParametricSensorProfile
+from .registry import (
+    DeclarativeSensorProfile,
+    SensorProfileRegistry,
+    load_profile,
+    read_profile_definition,
+    registry,
+)
+from .tabulated import (
+    REFERENCE_TEMPERATURE_C,
+    RequiredLuxGrid,
+    RequiredLuxTable,
+    TabulatedSensorProfile,
 )
@@ -0,0 +1,168 @@
+"""Contains the abstract base class representing energy harvesting sensors."""
+
+import abc
+import functools
+
+import numpy as np
+
+CONTINUOUS = "continuous"
+CONTINUOUS_SAMPLING_RATE_SECONDS = 4
+
+# Sampling rate periods (in seconds) showcased in the primer: continuous, 15 and 30
+# seconds, and every minute from 1 to 20 minutes.
+SAMPLING_RATES = (
+    CONTINUOUS_SAMPLING_RATE_SECONDS,
+    15,
+    30,
+    *(60 * x for x in range(1, 21)),
+)
+
+# Approximate power harvested per lux by an AM1454-class indoor PV cell, in watts, used
+# to convert required light into an energy budget for profiles measured in lux only.
+DEFAULT_WATTS_PER_LUX = 2e-7
+
+
+def check_single_variant(sensor_profile) -> None:
+    """Raise ValueError if the sensor profile evaluates several hardware variants at
+    once, for models that expect one value per sampling rate or lux level."""
+    if sensor_profile.variant_shape:
+        raise ValueError(
+            f"Sensor profile has hardware variants of shape "
+            f"{sensor_profile.variant_shape}; select one with variant() first"
+        )
+
+
+class BaseSensorProfile(abc.ABC):
+    """Abstract base class to represent a Energy Harvesting Sensor showcased and
+    explored through the Energy Harvesting Sensors 101 primer.
+
+    Typical usage example:
+        class MyNewSensor(BaseSensorProfile):
+            ...
+    """
+
+    @property
+    @abc.abstractclassmethod
+    def manufacturer(self) -> str:
+        """Return name of manufacturer."""
+        pass
+
+    @property
+    @abc.abstractclassmethod
+    def display_name(self) -> str:
+        """Return (short) display name of sensor."""
+        pass
+
+    @property
+    @abc.abstractclassmethod
+    def full_display_name(self) -> str:
+        """Return full display name of sensor."""
+        pass
+
+    @abc.abstractclassmethod
+    def get_required_lux(self, sampling_rate, temperature=None):
+        """Return light (in lux) required to achieve infinite sensor runtime at the
+        requested sampling rate.
+
+        Args:
+            sampling_rate: Sampling rate period, in seconds, or "continuous". May also
+                be an array of sampling rate periods.
+            temperature: Sensor temperature, in degrees Celsius, or an array of
+                temperatures (broadcast against sampling_rate). Defaults to the
+                temperature the sensor was measured at.
+
+        Return:
+            Required light, in lux, as float (or array of floats for array input)
+        """
+        pass
+
+    watts_per_lux = DEFAULT_WATTS_PER_LUX
+
+    def get_harvested_power(self, lux):
+        """Return power harvested (in watts) at the given light level(s), in lux.
+
+        Defaults to a harvested power proportional to lux, at watts_per_lux.
+        """
+        power = np.asarray(lux, dtype=float) * self.watts_per_lux
+        return power if power.ndim else float(power)
+
+    def get_load_power(self, sampling_rate, temperature=None):
+        """Return the average load power (in watts) when sampling at the given sampling
+        rate period(s), in seconds, or "continuous", and temperature(s).
+
+        Defaults to the power harvested at the rate's required lux, since the sensor
+        runs indefinitely at exactly that light level.
+        """
+        return self.get_harvested_power(
+            self.get_required_lux(sampling_rate, temperature=temperature)
+        )
+
+    @property
+    def variant_shape(self) -> tuple:
+        """Return the shape of the hardware variants the profile evaluates at once, or
+        () for a single sensor."""
+        return ()
+
+    @property
+    def sampling_rates(self) -> np.ndarray:
+        """Return the sampling rate periods, in seconds, that the sensor supports."""
+        return np.array(SAMPLING_RATES, dtype=float)
+
+    @functools.cached_property
+    def _sampling_rate_thresholds(self):
+        """Return the sampling rate thresholds of the supported sampling rates."""
+        return self.get_sampling_rate_thresholds(self.sampling_rates)
+
+    def get_sampling_rate_thresholds(self, sampling_rates=None, temperature=None):
+        """Return sampling rates in ascending order, and for each one the minimum lux
+        required to achieve infinite sensor runtime at that rate.
+
+        A sampling rate is sustained by the lux required for it, or for any faster rate,
+        so each threshold is the running minimum of the required lux over the rates up
+        to it.
+
+        Typical usage example:
+            rates, thresholds = sensor_profile.get_sampling_rate_thresholds()
+            sustained = lux[:, np.newaxis] >= thresholds
+
+        Args:
+            sampling_rates: Sampling rate periods, in seconds. Defaults to the sampling
+                rates supported by the sensor.
+            temperature: Sensor temperature, in degrees Celsius, or None for the
+                temperature the sensor was measured at
+
+        Return:
+            Tuple of sampling rate periods, in ascending order, and their thresholds, in
+            lux (with trailing axes for hardware variants, if any), as float arrays
+        """
+        if sampling_rates is None and temperature is None:
+            return self._sampling_rate_thresholds
+        if sampling_rates is None:
+            sampling_rates = self.sampling_rates
+
+        rates = np.sort(np.asarray(sampling_rates, dtype=float))
+        required_lux = np.asarray(
+            self.get_required_lux(rates, temperature=temperature), dtype=float
+        )
+        return rates, np.minimum.accumulate(required_lux)
+
+    def get_fastest_sampling_rate(self, lux, sampling_rates=None):
+        """Return the fastest sampling rate that achieves infinite sensor runtime with
+        the available light.
+
+        Args:
+            lux: Available light, in lux, as scalar or array (e.g. logged readings)
+            sampling_rates: Candidate sampling rate periods, in seconds. Defaults to
+                the sampling rates supported by the sensor.
+
+        Return:
+            Fastest sustainable sampling rate period, in seconds, as float (or array of
+            floats for array input). NaN where no candidate rate is sustainable.
+        """
+        rates, thresholds = self.get_sampling_rate_thresholds(sampling_rates)
+        lux = np.asarray(lux, dtype=float)
+        # Thresholds are non-increasing, so negate them for searchsorted.
+        idx = np.searchsorted(-thresholds, -lux, side="left")
+        fastest = np.append(rates, np.nan)[idx]
+
+        return fastest if lux.ndim else float(fastest)
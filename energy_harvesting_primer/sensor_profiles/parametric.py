@@ -0,0 +1,240 @@
+"""Contains a class representing an energy harvesting sensor whose performance is derived
+from its energy budget, rather than measured.
+
+A PV cell of area A and efficiency eta, lit by L lux, harvests
+
+    P_harvested = A * eta(L) * L / K
+
+watts, where K is the luminous efficacy of the light source (lumens per watt). Cell
+efficiency varies with light intensity, and is modeled as eta(L) = eta_ref * (L /
+L_ref) ** gamma. Sampling every T seconds, the sensor consumes
+
+    P_load = P_always_on + E_sample / T
+
+watts, so infinite runtime requires P_harvested >= P_load, which can be solved for L in
+closed form. A sensor also needs to store at least one sample's worth of energy.
+
+Hardware parameters may be arrays, describing many hardware variants at once. Results
+then hold the variants on trailing axes, after the axes of the sampling rates or lux
+levels requested, so that each rate is evaluated against every variant.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from .base import CONTINUOUS_SAMPLING_RATE_SECONDS, BaseSensorProfile
+from .tabulated import to_sampling_rate_seconds
+
+# Typical luminous efficacy of indoor (white LED and fluorescent) lighting, in lm/W.
+INDOOR_LUMINOUS_EFFICACY = 300
+
+CM2_PER_M2 = 10_000
+
+
+class ParametricSensorProfile(BaseSensorProfile):
+    """Class representing an energy harvesting sensor described by its hardware
+    parameters.
+
+    Every hardware parameter may be an array, so that many hardware variants can be
+    evaluated at once. Parameters are broadcast against each other into variant_shape,
+    and results have shape input_shape + variant_shape.
+
+    Typical usage example:
+        sensor_profile = ParametricSensorProfile(
+            harvester_area_cm2=np.array([10, 20, 30]),
+            efficiency=0.1,
+            storage_capacity_joules=2.0,
+            energy_per_sample_joules=3e-4,
+            always_on_power_watts=2e-6,
+        )
+        lux = sensor_profile.get_required_lux(60)  # one value per harvester area
+        lux = sensor_profile.get_required_lux([15, 60])  # shape (2, 3)
+        sensor_profile.variant(1).get_required_lux(60)  # 20 cm2 variant only
+
+    Args:
+        harvester_area_cm2: Active area of the PV cell, in square centimeters
+        efficiency: PV cell efficiency at reference_lux, as a fraction
+        storage_capacity_joules: Usable energy storage capacity, in joules
+        energy_per_sample_joules: Energy to take and transmit one reading, in joules
+        always_on_power_watts: Always-on power, in watts
+        efficiency_exponent: Exponent gamma of the efficiency vs. lux power law
+        reference_lux: Light level at which efficiency is specified, in lux
+        luminous_efficacy: Luminous efficacy of the light source, in lm/W
+    """
+
+    def __init__(
+        self,
+        harvester_area_cm2,
+        efficiency,
+        storage_capacity_joules,
+        energy_per_sample_joules,
+        always_on_power_watts,
+        efficiency_exponent=0.0,
+        reference_lux: float = 200,
+        luminous_efficacy: float = INDOOR_LUMINOUS_EFFICACY,
+        manufacturer: str = "",
+        display_name: str = "Parametric Sensor",
+        full_display_name: str = "Parametric Energy Harvesting Sensor",
+    ):
+        self.harvester_area_cm2 = np.asarray(harvester_area_cm2, dtype=float)
+        self.efficiency = np.asarray(efficiency, dtype=float)
+        self.storage_capacity_joules = np.asarray(storage_capacity_joules, float)
+        self.energy_per_sample_joules = np.asarray(energy_per_sample_joules, float)
+        self.always_on_power_watts = np.asarray(always_on_power_watts, dtype=float)
+        self.efficiency_exponent = np.asarray(efficiency_exponent, dtype=float)
+        self.reference_lux = reference_lux
+        self.luminous_efficacy = luminous_efficacy
+        self._manufacturer = manufacturer
+        self._display_name = display_name
+        self._full_display_name = full_display_name
+
+    @property
+    def manufacturer(self) -> str:
+        """Return name of manufacturer."""
+        return self._manufacturer
+
+    @property
+    def display_name(self) -> str:
+        """Return (short) display name of sensor."""
+        return self._display_name
+
+    @property
+    def full_display_name(self) -> str:
+        """Return full display name of sensor."""
+        return self._full_display_name
+
+    @property
+    def _parameters(self) -> Dict[str, np.ndarray]:
+        """Return the hardware parameters, by constructor argument name."""
+        return {
+            "harvester_area_cm2": self.harvester_area_cm2,
+            "efficiency": self.efficiency,
+            "storage_capacity_joules": self.storage_capacity_joules,
+            "energy_per_sample_joules": self.energy_per_sample_joules,
+            "always_on_power_watts": self.always_on_power_watts,
+            "efficiency_exponent": self.efficiency_exponent,
+        }
+
+    @property
+    def variant_shape(self) -> tuple:
+        """Return the shape of the hardware variants, broadcast from the parameters."""
+        return np.broadcast_shapes(*(p.shape for p in self._parameters.values()))
+
+    def variant(self, index) -> "ParametricSensorProfile":
+        """Return the profile of a single hardware variant (or a subset of variants,
+        for a slice index)."""
+        shape = self.variant_shape
+        return ParametricSensorProfile(
+            **{
+                name: np.broadcast_to(parameter, shape)[index]
+                for name, parameter in self._parameters.items()
+            },
+            reference_lux=self.reference_lux,
+            luminous_efficacy=self.luminous_efficacy,
+            manufacturer=self._manufacturer,
+            display_name=self._display_name,
+            full_display_name=self._full_display_name,
+        )
+
+    def _with_variant_axes(self, values) -> np.ndarray:
+        """Return values as float array of shape values_shape + variant_shape."""
+        values = np.asarray(values, dtype=float)
+        shape = self.variant_shape
+        return np.broadcast_to(
+            values.reshape(values.shape + (1,) * len(shape)), values.shape + shape
+        )
+
+    @property
+    def _harvest_coefficient(self) -> np.ndarray:
+        """Return c such that harvested power = c * lux ** (1 + efficiency_exponent)."""
+        area_m2 = self.harvester_area_cm2 / CM2_PER_M2
+        return (
+            area_m2
+            * self.efficiency
+            / (self.luminous_efficacy * self.reference_lux**self.efficiency_exponent)
+        )
+
+    def get_harvested_power(self, lux):
+        """Return power harvested (in watts) at the given light level(s), in lux."""
+        lux = self._with_variant_axes(lux)
+        power = self._harvest_coefficient * lux ** (1 + self.efficiency_exponent)
+        return power if power.ndim else float(power)
+
+    def get_load_power(self, sampling_rate, temperature=None):
+        """Return the average load power (in watts) when sampling at the given sampling
+        rate period(s), in seconds, or "continuous". The model does not depend on
+        temperature, but temperature arrays are broadcast against sampling rates."""
+        rates = np.asarray(to_sampling_rate_seconds(sampling_rate), dtype=float)
+        if temperature is not None:
+            rates = rates + np.zeros_like(temperature, dtype=float)
+        rates = self._with_variant_axes(rates)
+        power = self.always_on_power_watts + self.energy_per_sample_joules / rates
+        return power if np.ndim(power) else float(power)
+
+    def get_required_lux(self, sampling_rate, temperature=None):
+        """Return light (in lux) required to achieve infinite sensor runtime at the
+        requested sampling rate(s).
+
+        Args:
+            sampling_rate: Sampling rate period, in seconds, or "continuous", or an
+                array of sampling rate periods
+            temperature: Temperature, in degrees Celsius, or an array of temperatures.
+                The model does not depend on temperature.
+
+        Return:
+            Required light, in lux, as float (or array of floats of shape input_shape +
+            variant_shape). Infinite where the storage cannot hold a single sample.
+        """
+        load_power = np.asarray(self.get_load_power(sampling_rate, temperature))
+        required_lux = (load_power / self._harvest_coefficient) ** (
+            1 / (1 + self.efficiency_exponent)
+        )
+        required_lux = np.where(
+            self.energy_per_sample_joules > self.storage_capacity_joules,
+            np.inf,
+            required_lux,
+        )
+        return required_lux if required_lux.ndim else float(required_lux)
+
+    def get_fastest_sampling_rate(self, lux, sampling_rates=None):
+        """Return the fastest sampling rate that achieves infinite sensor runtime with
+        the available light.
+
+        Without candidate sampling rates, the energy budget is solved for the sampling
+        period directly, limited to the continuous sampling rate.
+
+        Args:
+            lux: Available light, in lux, as scalar or array
+            sampling_rates: Candidate sampling rate periods, in seconds, or None
+
+        Return:
+            Fastest sustainable sampling rate period, in seconds, as float (or array of
+            floats of shape lux_shape + variant_shape). NaN where the sensor cannot
+            achieve infinite runtime.
+        """
+        if sampling_rates is not None and not self.variant_shape:
+            return super().get_fastest_sampling_rate(lux, sampling_rates)
+
+        if sampling_rates is not None:
+            rates, thresholds = self.get_sampling_rate_thresholds(sampling_rates)
+            # Thresholds are non-increasing along the rate axis, so the fastest
+            # sustainable rate is the first one whose threshold is met.
+            unmet = self._with_variant_axes(lux)[..., np.newaxis] < np.moveaxis(
+                thresholds, 0, -1
+            )
+            fastest = np.append(rates, np.nan)[np.count_nonzero(unmet, axis=-1)]
+            return fastest if fastest.ndim else float(fastest)
+
+        surplus_power = (
+            np.asarray(self.get_harvested_power(lux)) - self.always_on_power_watts
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            period = np.where(
+                (surplus_power > 0)
+                & (self.energy_per_sample_joules <= self.storage_capacity_joules),
+                self.energy_per_sample_joules / surplus_power,
+                np.nan,
+            )
+        period = np.maximum(period, CONTINUOUS_SAMPLING_RATE_SECONDS)
+        return period if period.ndim else float(period)
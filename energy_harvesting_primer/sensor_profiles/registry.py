@@ -0,0 +1,299 @@
+"""Contains a registry of sensor profiles, including profiles loaded lazily from
+declarative TOML, JSON or CSV files.
+
+TOML and JSON profile files hold the sensor's display attributes and its measured
+sampling rate (in seconds, or "continuous") to required lux table:
+
+    manufacturer = "Everactive"
+    display_name = "ENV+ Eversensor"
+    full_display_name = "Environmental+ (ENV+) Eversensor"
+
+    [required_lux]
+    continuous = 865
+    15 = 295
+    30 = 200
+
+Sensors measured at several temperatures (in degrees Celsius) hold one such table per
+temperature instead, and their room temperature table is interpolated from them:
+
+    [required_lux_by_temperature."-20"]
+    continuous = 1100
+    30 = 260
+
+    [required_lux_by_temperature.25]
+    continuous = 865
+    30 = 200
+
+CSV profile files hold sampling_rate and required_lux columns, and optionally a
+temperature column. Display attributes may be given in leading comment lines, such as
+"# manufacturer: Everactive"; the display name defaults to the file name.
+
+Profiles shipped with the package, such as the ENV+ Eversensor ("everactive_env_plus"),
+are registered in the default registry.
+
+Registering a file or directory only records file names, so startup time does not
+depend on how many profiles are installed. Each file is parsed, and its table compiled,
+the first time its profile is requested.
+"""
+
+import csv
+import io
+import json
+import os
+import pathlib
+from typing import Callable, Dict, Iterator, Optional, Union
+
+from .base import BaseSensorProfile
+from .tabulated import REFERENCE_TEMPERATURE_C, RequiredLuxGrid, TabulatedSensorProfile
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+PROFILE_FILE_SUFFIXES = (".toml", ".json", ".csv")
+
+# Profile files shipped with the package.
+PACKAGED_PROFILES_DIR = pathlib.Path(__file__).parent / "profiles"
+
+ProfileSource = Union[str, os.PathLike, Callable[[], BaseSensorProfile]]
+
+
+class DeclarativeSensorProfile(TabulatedSensorProfile):
+    """Class representing a sensor described by data (for instance, a profile file)
+    rather than by a hand-written subclass.
+
+    Typical usage example:
+        sensor_profile = DeclarativeSensorProfile(
+            manufacturer="Everactive",
+            display_name="ENV+ Eversensor",
+            sampling_rate_to_required_lux={"continuous": 865, 15: 295, 30: 200},
+        )
+
+    Args:
+        manufacturer: Name of manufacturer
+        display_name: (Short) display name of sensor
+        sampling_rate_to_required_lux: Sampling rate to required lux table, measured
+            at room temperature. Interpolated from temperature_to_required_lux at
+            REFERENCE_TEMPERATURE_C if None.
+        full_display_name: Full display name of sensor; defaults to display_name
+        out_of_range: Policy for sampling rates outside of the measured range
+        temperature_to_required_lux: Temperature to sampling rate to required lux
+            tables, for sensors measured at several temperatures
+    """
+
+    def __init__(
+        self,
+        manufacturer: str,
+        display_name: str,
+        sampling_rate_to_required_lux: Optional[Dict] = None,
+        full_display_name: Optional[str] = None,
+        out_of_range: str = "raise",
+        temperature_to_required_lux: Optional[Dict] = None,
+    ):
+        if sampling_rate_to_required_lux is None:
+            if not temperature_to_required_lux:
+                raise ValueError("Profile has no required lux data")
+            sampling_rate_to_required_lux = RequiredLuxGrid(
+                temperature_to_required_lux
+            ).row(REFERENCE_TEMPERATURE_C)
+
+        self._manufacturer = manufacturer
+        self._display_name = display_name
+        self._full_display_name = full_display_name or display_name
+        self._required_lux = sampling_rate_to_required_lux
+        self._temperature_to_required_lux = temperature_to_required_lux
+        self.out_of_range = out_of_range
+
+    @property
+    def manufacturer(self) -> str:
+        """Return name of manufacturer."""
+        return self._manufacturer
+
+    @property
+    def display_name(self) -> str:
+        """Return (short) display name of sensor."""
+        return self._display_name
+
+    @property
+    def full_display_name(self) -> str:
+        """Return full display name of sensor."""
+        return self._full_display_name
+
+    @property
+    def _sampling_rate_to_required_lux(self) -> Dict:
+        return self._required_lux
+
+
+def _parse_sampling_rate(sampling_rate: str):
+    """Parse a sampling rate key from a profile file."""
+    try:
+        return float(sampling_rate)
+    except ValueError:
+        return sampling_rate.strip()
+
+
+def _read_csv_profile(path: pathlib.Path) -> Dict:
+    """Read a CSV profile file into a profile definition dict."""
+    definition = {"display_name": path.stem}
+    lines = []
+
+    with open(path, newline="") as f:
+        for line in f:
+            if line.startswith("#"):
+                key, _, value = line.lstrip("#").partition(":")
+                definition[key.strip()] = value.strip()
+            else:
+                lines.append(line)
+
+    for row in csv.DictReader(io.StringIO("".join(lines))):
+        if row.get("temperature") is None:
+            table = definition.setdefault("required_lux", {})
+        else:
+            tables = definition.setdefault("required_lux_by_temperature", {})
+            table = tables.setdefault(row["temperature"], {})
+        table[row["sampling_rate"]] = float(row["required_lux"])
+
+    return definition
+
+
+def read_profile_definition(path: Union[str, os.PathLike]) -> Dict:
+    """Read the raw definition of a sensor profile from a TOML, JSON or CSV profile
+    file, without building the profile.
+
+    Args:
+        path: Path to the profile file
+
+    Returns:
+        Dict of the file's profile attributes, with its required_lux table (and
+        required_lux_by_temperature tables) keyed by sampling rate in seconds, or
+        "continuous", and by temperature as float
+    """
+    path = pathlib.Path(path)
+
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ImportError("Reading TOML profiles requires Python 3.11+ or tomli")
+        with open(path, "rb") as f:
+            definition = tomllib.load(f)
+    elif path.suffix == ".json":
+        with open(path) as f:
+            definition = json.load(f)
+    elif path.suffix == ".csv":
+        definition = _read_csv_profile(path)
+    else:
+        raise ValueError(f"Unsupported profile file type {path.suffix}: {path}")
+
+    def parse_table(table: Dict) -> Dict:
+        return {_parse_sampling_rate(str(k)): v for k, v in table.items()}
+
+    if "required_lux" in definition:
+        definition["required_lux"] = parse_table(definition["required_lux"])
+    if "required_lux_by_temperature" in definition:
+        definition["required_lux_by_temperature"] = {
+            float(temperature): parse_table(table)
+            for temperature, table in definition["required_lux_by_temperature"].items()
+        }
+    return definition
+
+
+def load_profile(path: Union[str, os.PathLike]) -> DeclarativeSensorProfile:
+    """Load a sensor profile from a TOML, JSON or CSV profile file.
+
+    Args:
+        path: Path to the profile file
+
+    Returns:
+        Sensor profile, with its required lux table compiled
+    """
+    path = pathlib.Path(path)
+    definition = read_profile_definition(path)
+
+    try:
+        profile = DeclarativeSensorProfile(
+            manufacturer=definition.get("manufacturer", ""),
+            display_name=definition.get("display_name", path.stem),
+            full_display_name=definition.get("full_display_name"),
+            out_of_range=definition.get("out_of_range", "raise"),
+            sampling_rate_to_required_lux=definition.get("required_lux"),
+            temperature_to_required_lux=definition.get("required_lux_by_temperature"),
+        )
+    except ValueError as e:
+        raise ValueError(f"Profile file {path} is invalid: {e}") from e
+
+    # Compile the lookup tables now, so that malformed tables fail on load.
+    profile.required_lux_table
+    profile.required_lux_grid
+    return profile
+
+
+class SensorProfileRegistry:
+    """Registry of sensor profiles by name, populated with profile classes, factories or
+    declarative profile files.
+
+    Profiles are created on first access and cached.
+
+    Typical usage example:
+        registry = SensorProfileRegistry()
+        registry.register_directory("site_surveys/profiles")
+        sensor_profile = registry.get("my_sensor_v2")
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, ProfileSource] = {}
+        self._profiles: Dict[str, BaseSensorProfile] = {}
+
+    def register(self, name: str, source: ProfileSource) -> None:
+        """Register a profile under the given name.
+
+        Args:
+            name: Name to register the profile under
+            source: Path to a profile file, or a callable (such as a
+                BaseSensorProfile subclass) that returns the profile
+        """
+        self._sources[name] = source
+        self._profiles.pop(name, None)
+
+    def register_directory(self, directory: Union[str, os.PathLike]) -> None:
+        """Register every profile file in a directory, named after its file name
+        (without suffix). Files are not read until their profile is requested."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                stem, suffix = os.path.splitext(entry.name)
+                if entry.is_file() and suffix in PROFILE_FILE_SUFFIXES:
+                    self.register(stem, entry.path)
+
+    def get(self, name: str) -> BaseSensorProfile:
+        """Return the profile registered under the given name."""
+        if name not in self._profiles:
+            try:
+                source = self._sources[name]
+            except KeyError:
+                raise KeyError(f"No sensor profile registered as {name}")
+
+            if callable(source):
+                self._profiles[name] = source()
+            else:
+                self._profiles[name] = load_profile(source)
+
+        return self._profiles[name]
+
+    def names(self):
+        """Return the names of all registered profiles."""
+        return list(self._sources)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
+registry = SensorProfileRegistry()
+registry.register_directory(PACKAGED_PROFILES_DIR)
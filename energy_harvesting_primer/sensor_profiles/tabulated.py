@@ -0,0 +1,274 @@
+"""Contains classes representing energy harvesting sensors whose performance is given by
+a measured table of sampling rates and required light levels, optionally measured at
+several temperatures."""
+
+import abc
+import functools
+from typing import Dict, Optional
+
+import numpy as np
+
+from .base import CONTINUOUS, CONTINUOUS_SAMPLING_RATE_SECONDS, BaseSensorProfile
+
+OUT_OF_RANGE_POLICIES = ("raise", "clip", "nan")
+
+# Temperature (in degrees Celsius) at which single-temperature tables are measured.
+REFERENCE_TEMPERATURE_C = 25
+
+
+def to_sampling_rate_seconds(sampling_rate):
+    """Return sampling rate period(s) in seconds, mapping "continuous" to
+    CONTINUOUS_SAMPLING_RATE_SECONDS."""
+    if isinstance(sampling_rate, str):
+        if sampling_rate != CONTINUOUS:
+            raise KeyError(f"No required lux data for sampling rate {sampling_rate}")
+        return CONTINUOUS_SAMPLING_RATE_SECONDS
+    return sampling_rate
+
+
+class RequiredLuxTable:
+    """Measured sampling rate to required lux table, compiled into sorted NumPy arrays.
+
+    Lookups accept scalars or arrays of arbitrary sampling rates and interpolate
+    linearly between measured points, which preserves the monotonicity of the
+    measurements.
+
+    Typical usage example:
+        table = RequiredLuxTable({"continuous": 865, 15: 295, 30: 200})
+        table.lookup(20)                         # 263.3
+        table.lookup(np.array([15, 22.5, 30]))   # array([295., 247.5, 200.])
+        table.lookup(60, out_of_range="clip")    # 200.0
+    """
+
+    def __init__(
+        self,
+        sampling_rate_to_required_lux: Dict,
+        out_of_range: str = "raise",
+    ):
+        if out_of_range not in OUT_OF_RANGE_POLICIES:
+            raise ValueError(
+                f"Unknown out-of-range policy {out_of_range}: {OUT_OF_RANGE_POLICIES}"
+            )
+
+        sampling_rates = np.array(
+            [to_sampling_rate_seconds(x) for x in sampling_rate_to_required_lux],
+            dtype=float,
+        )
+        required_lux = np.array(list(sampling_rate_to_required_lux.values()), float)
+        order = np.argsort(sampling_rates)
+
+        self.sampling_rates = sampling_rates[order]
+        self.required_lux = required_lux[order]
+        self.out_of_range = out_of_range
+
+    def lookup(self, sampling_rate, out_of_range: Optional[str] = None):
+        """Return light (in lux) required to achieve infinite sensor runtime at the
+        requested sampling rate(s).
+
+        Args:
+            sampling_rate: Sampling rate period, in seconds, or "continuous", or an
+                array of sampling rate periods
+            out_of_range: Policy for sampling rates outside of the measured range:
+                "raise" a KeyError, "clip" to the nearest measured value, or return
+                "nan". Defaults to the table's policy.
+
+        Return:
+            Required light, in lux, as float (or array of floats for array input)
+        """
+        out_of_range = out_of_range or self.out_of_range
+        rates = np.asarray(to_sampling_rate_seconds(sampling_rate), dtype=float)
+
+        required_lux = np.interp(rates, self.sampling_rates, self.required_lux)
+
+        outside = (rates < self.sampling_rates[0]) | (rates > self.sampling_rates[-1])
+        if np.any(outside):
+            if out_of_range == "raise":
+                raise KeyError(
+                    f"No required lux data for sampling rate {rates[outside].min()}"
+                    if rates.ndim
+                    else f"No required lux data for sampling rate {sampling_rate}"
+                )
+            if out_of_range == "nan":
+                required_lux = np.where(outside, np.nan, required_lux)
+
+        return required_lux if rates.ndim else float(required_lux)
+
+
+def _interpolation_weights(axis: np.ndarray, x: np.ndarray):
+    """Return, for each x, the indices of the axis points bracketing it and the weight
+    of the upper one, clipped to the ends of the axis."""
+    lower = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, len(axis) - 1)
+    upper = np.minimum(lower + 1, len(axis) - 1)
+    span = axis[upper] - axis[lower]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(span > 0, (x - axis[lower]) / span, 0.0)
+    return lower, upper, np.clip(weight, 0, 1)
+
+
+class RequiredLuxGrid:
+    """Measured temperature by sampling rate to required lux table, compiled into a
+    NumPy grid.
+
+    Lookups accept scalars or arrays of temperatures and sampling rates, which are
+    broadcast against each other, and interpolate bilinearly between measured points.
+    Every temperature must be measured at the same sampling rates.
+
+    Typical usage example:
+        grid = RequiredLuxGrid(
+            {
+                -20: {"continuous": 1100, 30: 260, 60: 190},
+                25: {"continuous": 865, 30: 200, 60: 150},
+            }
+        )
+        grid.lookup(30, temperature=np.array([-20, 2.5, 25]))  # [260., 230., 200.]
+    """
+
+    def __init__(
+        self,
+        temperature_to_required_lux: Dict,
+        out_of_range: str = "raise",
+    ):
+        temperatures = np.array(list(temperature_to_required_lux), dtype=float)
+        rows = [
+            RequiredLuxTable(x, out_of_range=out_of_range)
+            for x in temperature_to_required_lux.values()
+        ]
+        if not all(
+            np.array_equal(x.sampling_rates, rows[0].sampling_rates) for x in rows
+        ):
+            raise ValueError("Every temperature must be measured at the same rates")
+
+        order = np.argsort(temperatures)
+
+        self.temperatures = temperatures[order]
+        self.sampling_rates = rows[0].sampling_rates
+        self.required_lux = np.stack([rows[i].required_lux for i in order])
+        self.out_of_range = out_of_range
+
+    def row(self, temperature: float) -> Dict:
+        """Return the sampling rate to required lux table at the given temperature,
+        clipped to the measured temperatures."""
+        required_lux = self.lookup(self.sampling_rates, temperature, "clip")
+        return dict(zip(self.sampling_rates.tolist(), required_lux.tolist()))
+
+    def lookup(self, sampling_rate, temperature, out_of_range: Optional[str] = None):
+        """Return light (in lux) required to achieve infinite sensor runtime at the
+        requested sampling rate(s) and temperature(s).
+
+        Args:
+            sampling_rate: Sampling rate period, in seconds, or "continuous", or an
+                array of sampling rate periods
+            temperature: Temperature, in degrees Celsius, or an array of temperatures
+            out_of_range: Policy for sampling rates or temperatures outside of the
+                measured range: "raise" a KeyError, "clip" to the nearest measured
+                value, or return "nan". Defaults to the table's policy.
+
+        Return:
+            Required light, in lux, as float (or array of floats for array input)
+        """
+        out_of_range = out_of_range or self.out_of_range
+        rates, temperatures = np.broadcast_arrays(
+            np.asarray(to_sampling_rate_seconds(sampling_rate), dtype=float),
+            np.asarray(temperature, dtype=float),
+        )
+
+        i0, i1, wi = _interpolation_weights(self.sampling_rates, rates)
+        j0, j1, wj = _interpolation_weights(self.temperatures, temperatures)
+        grid = self.required_lux
+        required_lux = (1 - wj) * ((1 - wi) * grid[j0, i0] + wi * grid[j0, i1]) + wj * (
+            (1 - wi) * grid[j1, i0] + wi * grid[j1, i1]
+        )
+
+        outside = {
+            "sampling rate": (rates < self.sampling_rates[0])
+            | (rates > self.sampling_rates[-1]),
+            "temperature": (temperatures < self.temperatures[0])
+            | (temperatures > self.temperatures[-1]),
+        }
+        for name, mask in outside.items():
+            if np.any(mask):
+                if out_of_range == "raise":
+                    values = rates if name == "sampling rate" else temperatures
+                    raise KeyError(
+                        f"No required lux data for {name} {values[mask].min()}"
+                    )
+                if out_of_range == "nan":
+                    required_lux = np.where(mask, np.nan, required_lux)
+
+        return required_lux if rates.ndim else float(required_lux)
+
+
+class TabulatedSensorProfile(BaseSensorProfile):
+    """Abstract class to represent a sensor whose required lux has been measured at a
+    set of sampling rates.
+
+    Subclasses supply the measurements as a dict of sampling rate (in seconds, or
+    "continuous") to required light (in lux); the table is compiled into a
+    RequiredLuxTable on first use. Subclasses measured at several temperatures may also
+    supply a dict of temperature (in degrees Celsius) to such tables, which is compiled
+    into a RequiredLuxGrid.
+
+    Typical usage example:
+        class MyNewSensor(TabulatedSensorProfile):
+            _sampling_rate_to_required_lux = {"continuous": 500, 60: 100}
+            ...
+    """
+
+    out_of_range = "raise"
+    _temperature_to_required_lux: Optional[Dict] = None
+
+    @property
+    @abc.abstractmethod
+    def _sampling_rate_to_required_lux(self) -> Dict:
+        """Return the measured sampling rate to required lux table."""
+        pass
+
+    @property
+    def sampling_rates(self) -> np.ndarray:
+        """Return the measured sampling rate periods, in seconds."""
+        return self.required_lux_table.sampling_rates
+
+    @functools.cached_property
+    def required_lux_table(self) -> RequiredLuxTable:
+        """Return the compiled required lux table."""
+        return RequiredLuxTable(
+            self._sampling_rate_to_required_lux, out_of_range=self.out_of_range
+        )
+
+    @functools.cached_property
+    def required_lux_grid(self) -> Optional[RequiredLuxGrid]:
+        """Return the compiled temperature by sampling rate required lux table, or None
+        if the sensor was only measured at one temperature."""
+        if not self._temperature_to_required_lux:
+            return None
+        return RequiredLuxGrid(
+            self._temperature_to_required_lux, out_of_range=self.out_of_range
+        )
+
+    def get_required_lux(
+        self, sampling_rate, temperature=None, out_of_range: Optional[str] = None
+    ):
+        """Return light (in lux) required to achieve infinite sensor runtime at the
+        requested sampling rate(s), interpolating between measured sampling rates (and
+        temperatures).
+
+        Args:
+            sampling_rate: Sampling rate period, in seconds, or "continuous", or an
+                array of sampling rate periods
+            temperature: Temperature, in degrees Celsius, or an array of temperatures.
+                Ignored if the sensor was only measured at one temperature.
+            out_of_range: Policy for sampling rates (or temperatures) outside of the
+                measured range ("raise", "clip" or "nan"); defaults to the profile's
+                out_of_range
+
+        Return:
+            Required light, in lux, as float (or array of floats for array input)
+        """
+        if temperature is None or self.required_lux_grid is None:
+            required_lux = self.required_lux_table.lookup(sampling_rate, out_of_range)
+            if temperature is None:
+                return required_lux
+            # Temperature-independent, but broadcast like a temperature-aware lookup.
+            required_lux = required_lux + np.zeros_like(temperature, dtype=float)
+            return required_lux if np.ndim(required_lux) else float(required_lux)
+        return self.required_lux_grid.lookup(sampling_rate, temperature, out_of_range)
@@ -4,8 +4,49 @@ visuals."""
 import base64
 import os
 
+import numpy as np
+
+from energy_harvesting_primer.sensor_profiles.base import (
+    CONTINUOUS_SAMPLING_RATE_SECONDS,
+)
+
 MU = "\u03bc"
 
+METRIC_PREFIXES = ("", "K", "M", "G", "T", "P")
+
+
+def sampling_rate_display_name(seconds: float) -> str:
+    """Return display name of a sampling rate period, in seconds, e.g. "2 minutes"."""
+    if seconds == CONTINUOUS_SAMPLING_RATE_SECONDS:
+        return "continuous"
+    if seconds % 60 == 0:
+        minutes = int(seconds // 60)
+        return "1 minute" if minutes == 1 else f"{minutes} minutes"
+    return f"{seconds:g} seconds"
+
+
+def human_readable_format(values, decimals: int = 1) -> np.ndarray:
+    """Convert supplied large number(s) to human-readable format, e.g. 1.5M.
+
+    Args:
+        values: Number, or array of numbers
+        decimals: Number of decimal places shown
+
+    Returns:
+        Array of strings (or string for scalar input)
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide="ignore"):
+        magnitude = np.floor(np.log10(np.abs(values)) / 3)
+    magnitude = np.clip(np.nan_to_num(magnitude), 0, len(METRIC_PREFIXES) - 1)
+    mantissa = values / 1000.0**magnitude
+
+    formatted = np.char.add(
+        np.char.mod(f"%.{decimals}f", mantissa),
+        np.asarray(METRIC_PREFIXES)[magnitude.astype(int)],
+    )
+    return formatted if formatted.ndim else str(formatted)
+
 
 def get_linked_image(image_filepath: str, target_url: str, image_width: int) -> str:
     """Returns HTML that encodes the specified image and links the target URL.
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from energy_harvesting_primer.models.light_logs import (
+    iter_light_log,
+    write_light_log_store,
+)
+
+TIMESTEP_SECONDS = 60
+MAX_GAP_SECONDS = 300
+
+
+@pytest.fixture
+def readings():
+    rng = np.random.default_rng(0)
+    sensors = {}
+    for i in range(5):
+        # Multiples of 15 seconds, so that readings often land on grid points (at
+        # chunk boundaries too), including repeated timestamps.
+        gaps = rng.choice([0.0, 15, 30, 45, 60, 90], 400)
+        # A few long outages, longer than MAX_GAP_SECONDS.
+        gaps[rng.choice(len(gaps), 5, replace=False)] = 1_005
+        sensors[f"sensor-{i}"] = (
+            1_600_000_200 + np.cumsum(gaps),
+            rng.uniform(0, 500, len(gaps)),
+        )
+    return sensors
+
+
+@pytest.fixture
+def log_path(tmp_path, readings):
+    df = pd.concat(
+        pd.DataFrame({"timestamp": times, "sensor_id": sensor_id, "lux": lux})
+        for sensor_id, (times, lux) in readings.items()
+    )
+    # Interleave the sensors' readings, keeping each sensor's in time order.
+    df = df.sort_values("timestamp", kind="stable")
+    path = tmp_path / "log.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def brute_force_resample(times, lux, max_gap_seconds=None):
+    start = np.ceil(times[0] / TIMESTEP_SECONDS) * TIMESTEP_SECONDS
+    n_points = int((times[-1] - start) // TIMESTEP_SECONDS) + 1
+    grid = start + np.arange(n_points) * TIMESTEP_SECONDS
+    resampled = []
+    for t in grid:
+        i = np.flatnonzero(times <= t)[-1]
+        held = max_gap_seconds is not None and t - times[i] > max_gap_seconds
+        resampled.append(0.0 if held else lux[i])
+    return start, np.array(resampled)
+
+
+def read_traces(path, **kwargs):
+    traces = {}
+    for sensor_id, start, lux in iter_light_log(
+        path, TIMESTEP_SECONDS, timestamp_unit="s", **kwargs
+    ):
+        if sensor_id in traces:
+            traces[sensor_id][1].append(lux)
+        else:
+            traces[sensor_id] = (start, [lux])
+    return {k: (start, np.concatenate(lux)) for k, (start, lux) in traces.items()}
+
+
+@pytest.mark.parametrize("max_gap_seconds", [None, MAX_GAP_SECONDS])
+def test_small_chunks_match_single_chunk(log_path, max_gap_seconds):
+    single = read_traces(log_path, max_gap_seconds=max_gap_seconds)
+    chunked = read_traces(log_path, max_gap_seconds=max_gap_seconds, chunksize=97)
+
+    assert single.keys() == chunked.keys()
+    for sensor_id, (start, lux) in single.items():
+        assert chunked[sensor_id][0] == start
+        np.testing.assert_array_equal(chunked[sensor_id][1], lux)
+
+
+@pytest.mark.parametrize("max_gap_seconds", [None, MAX_GAP_SECONDS])
+def test_resampling_matches_brute_force(log_path, readings, max_gap_seconds):
+    traces = read_traces(log_path, max_gap_seconds=max_gap_seconds, chunksize=97)
+
+    for sensor_id, (times, lux) in readings.items():
+        start, expected = brute_force_resample(times, lux, max_gap_seconds)
+        assert traces[sensor_id][0] == start
+        # Lux goes through a CSV round trip, which may change its last digit.
+        np.testing.assert_allclose(traces[sensor_id][1], expected, rtol=1e-12)
+
+
+def test_store_fills_gaps(log_path, readings, tmp_path):
+    store = write_light_log_store(
+        log_path,
+        tmp_path / "store",
+        TIMESTEP_SECONDS,
+        max_gap_seconds=MAX_GAP_SECONDS,
+        timestamp_unit="s",
+        chunksize=97,
+    )
+
+    assert set(store) == set(readings)
+    for sensor_id, (times, lux) in readings.items():
+        start, expected = brute_force_resample(times, lux, MAX_GAP_SECONDS)
+        assert store.start_seconds(sensor_id) == start
+        assert not np.isnan(store[sensor_id]).any()
+        np.testing.assert_allclose(store[sensor_id], expected, rtol=1e-6)
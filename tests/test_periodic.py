@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from energy_harvesting_primer.models.periodic import hyperperiod, steady_state
+from energy_harvesting_primer.models.schedule import Event, Mode, Schedule
+
+STANDBY = Mode("Standby", 10)
+
+
+def random_schedule(rng, n_events):
+    events = []
+    for i in range(n_events):
+        period = int(rng.choice([4, 6, 10, 15]))
+        events.append(
+            Event(
+                Mode(f"Mode {i}", float(rng.integers(20, 100))),
+                duration=int(rng.integers(1, period + 1)),
+                period=period,
+                offset=int(rng.integers(0, period)),
+            )
+        )
+    return Schedule(STANDBY, events)
+
+
+def brute_force_power(schedule, horizon):
+    """Return the power drawn in each second of [0, horizon), for events with whole
+    second durations, periods and offsets."""
+    power = np.full(horizon, float(schedule.standby.power))
+    active = np.zeros(horizon, dtype=bool)
+    for t in range(horizon):
+        for event in schedule.events:
+            since_start = t - event.offset
+            if since_start >= 0 and since_start % event.period < event.duration:
+                power[t] = (
+                    max(power[t], event.mode.power) if active[t] else event.mode.power
+                )
+                active[t] = True
+    return power, active
+
+
+def test_hyperperiod():
+    assert hyperperiod([4, 6, 10]) == pytest.approx(60)
+    assert hyperperiod([0.5, 0.75]) == pytest.approx(1.5)
+    with pytest.raises(ValueError):
+        hyperperiod([60, 0])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_steady_state_matches_brute_force(seed):
+    schedule = random_schedule(np.random.default_rng(seed), n_events=3)
+    h = math.lcm(*(event.period for event in schedule.events))
+
+    # Every occurrence that overlaps the second hyperperiod has started by then, so
+    # it is in steady state.
+    power, active = brute_force_power(schedule, 2 * h)
+    duty_cycle, average_power = steady_state(schedule)
+
+    assert duty_cycle == pytest.approx(active[h:].mean())
+    assert average_power == pytest.approx(power[h:].mean())
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_compile_matches_brute_force(seed):
+    schedule = random_schedule(np.random.default_rng(seed), n_events=3)
+    horizon = 2 * math.lcm(*(event.period for event in schedule.events))
+
+    timeline = schedule.compile(horizon)
+    power, active = brute_force_power(schedule, horizon)
+    segments = np.searchsorted(timeline.starts, np.arange(horizon), side="right") - 1
+
+    np.testing.assert_allclose(timeline.power[segments], power)
+    np.testing.assert_array_equal(timeline.mode_codes[segments] != 0, active)
+    assert timeline.horizon == pytest.approx(horizon)
+    assert timeline.average_power() == pytest.approx(power.mean())
+
+
+def test_steady_state_without_events():
+    assert steady_state(Schedule(STANDBY, [])) == (0.0, 10.0)
+
+
+def test_steady_state_rejects_one_off_events():
+    schedule = Schedule(STANDBY, [Event(Mode("Update", 70), duration=120)])
+    with pytest.raises(ValueError):
+        steady_state(schedule)
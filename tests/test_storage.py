@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import energy_harvesting_primer.models.storage as storage
+from energy_harvesting_primer.sensor_profiles import (
+    EveractiveEnvironmentalPlusEversensor,
+)
+
+
+def brute_force_clipped_cumsum(net_energy, initial_energy, capacity):
+    stored_energy = np.empty_like(net_energy)
+    level = initial_energy
+    for i, x in enumerate(net_energy):
+        level = min(max(level + x, 0.0), capacity)
+        stored_energy[i] = level
+    return stored_energy
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("initial_energy", [0.0, 2.5, 5.0])
+def test_clipped_cumsum_matches_brute_force(seed, initial_energy):
+    rng = np.random.default_rng(seed)
+    # Daily swings between full and empty, with noise, over ~2 weeks of minutes.
+    t = np.arange(20_000)
+    net_energy = 0.02 * np.sin(2 * np.pi * t / 1440) + rng.normal(0, 0.01, len(t))
+
+    np.testing.assert_allclose(
+        storage._clipped_cumsum(net_energy, initial_energy, 5.0),
+        brute_force_clipped_cumsum(net_energy, initial_energy, 5.0),
+        atol=1e-9,
+    )
+
+
+def test_clipped_cumsum_matches_brute_force_across_scan_windows(monkeypatch):
+    monkeypatch.setattr(storage, "MIN_SCAN_WINDOW", 4)
+    monkeypatch.setattr(storage, "MAX_SCAN_WINDOW", 16)
+    rng = np.random.default_rng(0)
+    net_energy = rng.normal(0, 1, 2_000)
+
+    np.testing.assert_allclose(
+        storage._clipped_cumsum(net_energy, 1.0, 3.0),
+        brute_force_clipped_cumsum(net_energy, 1.0, 3.0),
+        atol=1e-9,
+    )
+
+
+def test_simulate_storage_brownout_intervals():
+    index = pd.date_range("2023-01-02", periods=3 * 24 * 60, freq="1min")
+    lux = pd.Series(np.where(index.hour.isin(range(8, 18)), 1000, 0), index=index)
+
+    result = storage.simulate_storage(
+        lux, EveractiveEnvironmentalPlusEversensor(), 60, capacity_joules=0.1
+    )
+
+    assert result.stored_energy.min() >= 0
+    assert result.stored_energy.max() <= 0.1
+    # Brownouts start shortly after the lights go off (and the first midnight), and
+    # last until they come back on.
+    assert len(result.brownout_intervals) == 4
+    assert not result.brownout[lux.to_numpy() > 0].any()
+    assert (result.brownout_intervals.end.dt.hour.iloc[:-1] == 8).all()
+    assert result.missed_samples == result.brownout.sum()
+
+
+def test_simulate_storage_rejects_nan_lux():
+    lux = np.full(100, 200.0)
+    lux[42] = np.nan
+
+    with pytest.raises(ValueError, match="timestep 42"):
+        storage.simulate_storage(
+            lux, EveractiveEnvironmentalPlusEversensor(), 60, capacity_joules=1
+        )
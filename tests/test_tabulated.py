@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from energy_harvesting_primer.models.fleet import _clip_temperature
+from energy_harvesting_primer.sensor_profiles import (
+    DeclarativeSensorProfile,
+    RequiredLuxGrid,
+)
+
+TEMPERATURE_TO_REQUIRED_LUX = {
+    25: {"continuous": 865, 30: 200, 60: 150, 300: 60},
+    -20: {"continuous": 1100, 30: 260, 60: 190, 300: 90},
+    60: {"continuous": 1300, 30: 320, 60: 240, 300: 110},
+}
+MEASURED_RATES = [30, 60, 300]
+
+
+def brute_force_bilinear(sampling_rate, temperature):
+    """Interpolate along the sampling rates at the two bracketing temperatures, then
+    between them, clipping both to the measured ranges."""
+    temperatures = sorted(TEMPERATURE_TO_REQUIRED_LUX)
+    temperature = min(max(temperature, temperatures[0]), temperatures[-1])
+    sampling_rate = min(max(sampling_rate, MEASURED_RATES[0]), MEASURED_RATES[-1])
+
+    def at(t):
+        row = TEMPERATURE_TO_REQUIRED_LUX[t]
+        return np.interp(
+            sampling_rate, MEASURED_RATES, [row[x] for x in MEASURED_RATES]
+        )
+
+    for low, high in zip(temperatures, temperatures[1:]):
+        if low <= temperature <= high:
+            weight = (temperature - low) / (high - low)
+            return (1 - weight) * at(low) + weight * at(high)
+
+
+@pytest.fixture
+def grid():
+    return RequiredLuxGrid(TEMPERATURE_TO_REQUIRED_LUX)
+
+
+def test_lookup_at_measured_points(grid):
+    for temperature, row in TEMPERATURE_TO_REQUIRED_LUX.items():
+        for sampling_rate, required_lux in row.items():
+            assert grid.lookup(sampling_rate, temperature) == required_lux
+
+
+def test_lookup_interpolates_bilinearly(grid):
+    rng = np.random.default_rng(0)
+    rates = rng.uniform(30, 300, 200)
+    temperatures = rng.uniform(-20, 60, 200)
+
+    np.testing.assert_allclose(
+        grid.lookup(rates, temperatures),
+        [brute_force_bilinear(r, t) for r, t in zip(rates, temperatures)],
+    )
+    # Halfway between 30 and 60 seconds and between 25 and 60 degrees.
+    assert grid.lookup(45, 42.5) == pytest.approx((200 + 150 + 320 + 240) / 4)
+
+
+def test_lookup_broadcasts_scalars_against_arrays(grid):
+    assert isinstance(grid.lookup(60, 0.0), float)
+    np.testing.assert_allclose(
+        grid.lookup(30, temperature=np.array([-20, 2.5, 25])), [260, 230, 200]
+    )
+    np.testing.assert_allclose(
+        grid.lookup(np.array([30, 60]), temperature=-20), [260, 190]
+    )
+
+
+def test_lookup_clips_temperatures_at_grid_edges(grid):
+    temperatures = np.array([-60, -20.5, -20, 60, 60.5, 120])
+    rates = np.full(len(temperatures), 45)
+
+    np.testing.assert_allclose(
+        grid.lookup(rates, temperatures, out_of_range="clip"),
+        [brute_force_bilinear(45, t) for t in temperatures],
+    )
+    np.testing.assert_allclose(
+        grid.lookup(rates, temperatures, out_of_range="clip")[[0, 1, 4, 5]],
+        [225, 225, 280, 280],
+    )
+
+
+def test_lookup_out_of_range_policies(grid):
+    with pytest.raises(KeyError, match="temperature -30"):
+        grid.lookup(60, np.array([-30, 0, 70]))
+    with pytest.raises(KeyError, match="sampling rate 600"):
+        grid.lookup(600, 0)
+
+    required_lux = grid.lookup(60, np.array([-30, 0, 70]), out_of_range="nan")
+    assert np.isnan(required_lux[[0, 2]]).all()
+    assert required_lux[1] == pytest.approx(brute_force_bilinear(60, 0))
+
+
+def test_row_clips_temperature(grid):
+    assert grid.row(-40) == grid.row(-20)
+    assert grid.row(100) == grid.row(60)
+    assert grid.row(25)[60] == 150
+
+
+def test_clip_temperature_counts_out_of_range_steps():
+    sensor_profile = DeclarativeSensorProfile(
+        "Acme", "Test sensor", temperature_to_required_lux=TEMPERATURE_TO_REQUIRED_LUX
+    )
+    clipped, out_of_range_steps = _clip_temperature(
+        sensor_profile, [-40, -20, 0, 60, 75]
+    )
+
+    np.testing.assert_array_equal(clipped, [-20, -20, 0, 60, 60])
+    assert out_of_range_steps == 2